@@ -19,10 +19,10 @@ from PyQt5.QtMultimedia import QSoundEffect
 from config import MODERN_COLORS, SOUND_OPTIONS  
 from widgets.progress_ring_widget import ProgressRingWidget
 from dialogs.history_window import HistoryWindow
-from dialogs.settings_dialog import SettingsDialog
+from dialogs.settings_dialog import SettingsDialog, derive_theme_colors
 from core.settings_manager import SettingsManager
 from dialogs.reminder_dialog import ReminderDialog
-from widgets.toast import ToastLabel
+from widgets.toast import ToastLabel, SHADOW_MARGIN
 from utils import resource_path
 from widgets.time_since import LoveTimer
 from widgets.todo_widget import TodoListWidget
@@ -46,6 +46,8 @@ class MainWindow(QMainWindow):
         self.sound_file = self.settings_manager.get('sound_choice')
         self.hydration_log_count = self.settings_manager.get('log_count')
         self.theme_name = self.settings_manager.get('theme')
+        # Lower-cased once; theme lookups and comparisons use this, the stored name keeps its casing
+        self.theme_key = self.theme_name.lower()
         self.show_progress_text = self.settings_manager.get('show_progress_text')
         self.exit_on_close = False
 
@@ -219,7 +221,7 @@ class MainWindow(QMainWindow):
 
     def get_theme(self):
         """Return the current theme dictionary for UI components"""
-        theme = MODERN_COLORS.get(self.theme_name.lower())
+        theme = MODERN_COLORS.get(self.theme_key)
         if not theme:
             print(f"Warning: Theme '{self.theme_name}' not found. Using default theme.")
             theme = MODERN_COLORS.get("dark v2")
@@ -245,7 +247,7 @@ class MainWindow(QMainWindow):
         return widget
 
     def apply_theme(self):
-        theme = MODERN_COLORS.get(self.theme_name.lower())
+        theme = MODERN_COLORS.get(self.theme_key)
         if not theme:
             print(f"Warning: Theme '{self.theme_name}' not found. Using default theme.")
             theme = MODERN_COLORS.get("dark v2")
@@ -254,6 +256,9 @@ class MainWindow(QMainWindow):
         if not accent_dark:
             accent_color = theme.get('accent', '#EF4565')
             accent_dark = accent_color 
+        
+        # Derived color strings for the settings dialog, rebuilt only on theme change
+        self.theme_derived = derive_theme_colors(self.theme_name)
                 
         self.setStyleSheet(f"""
             QMainWindow, QWidget {{
@@ -460,7 +465,7 @@ class MainWindow(QMainWindow):
             self.tray_icon.showMessage("Time to Hydrate!", "Your body needs water! ✨",
                                        QSystemTrayIcon.Information, 10000)
 
-        theme = MODERN_COLORS.get(self.theme_name.lower())
+        theme = MODERN_COLORS.get(self.theme_key)
         if not theme:
             theme = MODERN_COLORS.get("dark v2")
         
@@ -574,7 +579,7 @@ class MainWindow(QMainWindow):
         print("WaterLevelWidget is now hidden but still exists in memory")
     
     def show_context_menu(self):
-        theme = MODERN_COLORS.get(self.theme_name.lower(), MODERN_COLORS.get("dark v2"))
+        theme = MODERN_COLORS.get(self.theme_key, MODERN_COLORS.get("dark v2"))
         menu = QMenu(self)
         menu.setStyleSheet(f"""
             QMenu {{
@@ -649,6 +654,7 @@ class MainWindow(QMainWindow):
         self.sound_file = self.settings_manager.get('sound_choice')
         self.hydration_log_count = self.settings_manager.get('log_count')
         self.theme_name = self.settings_manager.get('theme')
+        self.theme_key = self.theme_name.lower()
         self.show_progress_text = self.settings_manager.get('show_progress_text')
             
         self.apply_theme()
@@ -721,7 +727,8 @@ class MainWindow(QMainWindow):
         from PyQt5.QtGui import QGuiApplication
         screen = QGuiApplication.primaryScreen().availableGeometry()
         x = screen.center().x() - toast.width() // 2
-        y = screen.bottom() - toast.height() - 60
+        # The widget includes SHADOW_MARGIN around the card; keep the card itself 60px from the bottom
+        y = screen.bottom() - toast.height() + SHADOW_MARGIN - 60
 
         toast.move(x, y + 40)
         toast.setWindowOpacity(0.0)
@@ -775,15 +782,17 @@ class MainWindow(QMainWindow):
             self._current_toast = None
 
     def save_settings(self):
-        self.settings_manager.set('min_minutes', self.min_hydration_interval)
-        self.settings_manager.set('max_minutes', self.max_hydration_interval)
-        self.settings_manager.set('snooze_minutes', self.snooze_duration)
-        self.settings_manager.set('daily_goal', self.daily_hydration_goal)
-        self.settings_manager.set('sound_enabled', self.sound_enabled)
-        self.settings_manager.set('sound_choice', self.sound_file)
-        self.settings_manager.set('log_count', self.hydration_log_count)
-        self.settings_manager.set('theme', self.theme_name)
-        self.settings_manager.set('show_progress_text', self.show_progress_text)
+        self.settings_manager.update({
+            'min_minutes': self.min_hydration_interval,
+            'max_minutes': self.max_hydration_interval,
+            'snooze_minutes': self.snooze_duration,
+            'daily_goal': self.daily_hydration_goal,
+            'sound_enabled': self.sound_enabled,
+            'sound_choice': self.sound_file,
+            'log_count': self.hydration_log_count,
+            'theme': self.theme_name,
+            'show_progress_text': self.show_progress_text,
+        })
         self.settings_manager.update_last_log_date()
         
         # Get log_times without default value
@@ -845,7 +854,7 @@ class MainWindow(QMainWindow):
         self.tray_icon.setIcon(icon)
         
         tray_menu = QMenu()
-        theme = MODERN_COLORS.get(self.theme_name.lower(), MODERN_COLORS.get("dark v2"))
+        theme = MODERN_COLORS.get(self.theme_key, MODERN_COLORS.get("dark v2"))
         tray_menu.setStyleSheet(f"""
             QMenu {{
                 background-color: {theme['surface'] if 'surface' in theme else theme['background']};
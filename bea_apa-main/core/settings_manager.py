@@ -1,8 +1,22 @@
 # core/settings_manager.py
 import os
 import json
+import threading
 from datetime import datetime
 
+# Saves may come from worker threads and from widgets sharing the same file
+_write_lock = threading.Lock()
+
+
+def write_settings_file(path, settings):
+    """Atomically replace the settings file at path; safe to call from a worker thread with a snapshot."""
+    # Write to a temporary file and swap it in, so an interrupted save never leaves a truncated file
+    tmp_path = path + ".tmp"
+    with _write_lock:
+        with open(tmp_path, "w") as f:
+            json.dump(settings, f, indent=4)
+        os.replace(tmp_path, path)
+
 class SettingsManager:
     def __init__(self, settings_path="settings.json"):
         self.settings_path = settings_path
@@ -50,9 +64,12 @@ class SettingsManager:
             return self.default_settings.copy()
 
     def save_settings(self):
+        self.write_settings(self.settings)
+
+    def write_settings(self, settings):
+        """Write a settings dict to disk; safe to call from a worker thread with a snapshot."""
         try:
-            with open(self.settings_path, "w") as f:
-                json.dump(self.settings, f, indent=4)
+            write_settings_file(self.settings_path, settings)
         except Exception as e:
             print("Error saving settings:", e)
 
@@ -62,5 +79,9 @@ class SettingsManager:
     def set(self, key, value):
         self.settings[key] = value
 
+    def update(self, values):
+        """Set several keys at once; persisted by the next save_settings() call."""
+        self.settings.update(values)
+
     def update_last_log_date(self):
         self.settings["last_log_date"] = datetime.now().isoformat()
@@ -32,7 +32,7 @@ class HistoryWindow(QDialog):
         self.main_app = parent
         
         # Get theme colors
-        self.theme_name = self.main_app.theme_name.lower()
+        self.theme_name = self.main_app.theme_key
         self.theme = MODERN_COLORS.get(self.theme_name, MODERN_COLORS.get("dark v2"))
         
         # Setup window properties
@@ -1,8 +1,9 @@
 # dialogs/settings_dialog.py
+import re
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
     QSpinBox, QCheckBox, QComboBox, QPushButton, QMessageBox, QLabel,
-    QSlider, QTabWidget, QWidget, QScrollArea, QFrame, QSizePolicy, QGridLayout, QApplication,
+    QSlider, QTabWidget, QWidget, QScrollArea, QFrame, QSizePolicy, QGridLayout,
     QListWidget, QListWidgetItem, QStackedWidget, QLineEdit
 )
 from PyQt5.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, QTimer, QMargins, QRectF, QEvent, pyqtSignal, pyqtProperty
@@ -12,6 +13,594 @@ from PyQt5.QtGui import QIcon, QColor, QFont, QPixmap, QPainter, QPainterPath, Q
 from config import MODERN_COLORS, SOUND_OPTIONS
 from utils import resource_path
 
+# Settings dialog stylesheet; %(name)s slots are filled from derive_theme_colors()
+_STYLE_TEMPLATE = """
+    /* ======================================
+    BASE DIALOG AND GENERAL ELEMENTS
+    ====================================== */
+    
+    /* Main Dialog Background */
+    QDialog {
+        background-color: %(background)s;
+        color: %(text)s;
+        font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', sans-serif;
+        border-radius: 10px; /* Rounded dialog corners */
+    }
+    
+    /* All Labels - No Background */
+    QLabel {
+        background-color: transparent;
+        color: %(text)s;
+    }
+    
+    /* ======================================
+    CUSTOM TITLE BAR
+    ====================================== */
+    
+    /* Title bar background */
+    #titleBar {
+        background-color: %(surface)s;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+        border-bottom: 1px solid %(border)s;
+    }
+    
+    /* Window title */
+    #windowTitle {
+        color: %(text)s;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    
+    /* Window control buttons base */
+    #windowButton {
+        border-radius: 6px;
+        border: none;
+    }
+    
+    /* Close button */
+    #closeButton {
+        background-color: #FF5F57;
+        border: none;
+    }
+    
+    #closeButton:hover {
+        background-color: #FF5F57;
+    }
+    
+    /* Minimize button */
+    #minimizeButton {
+        background-color: #FEBC2E;
+        border: none;
+    }
+    
+    #minimizeButton:hover {
+        background-color: #FEBC2E;
+    }
+    
+    /* Maximize button */
+    #maximizeButton {
+        background-color: #28C840;
+        border: none;
+    }
+    
+    #maximizeButton:hover {
+        background-color: #28C840;
+    }
+    
+    /* ======================================
+    NAVIGATION SIDEBAR STYLING
+    ====================================== */
+    
+    /* Sidebar Background with Border */
+    #navSidebar {
+        background-color: %(surface)s;
+        border-right: 1px solid %(border)s;
+        border-bottom-left-radius: 10px;
+    }
+    
+    /* Sidebar header with app name */
+    #sidebarHeader {
+        color: %(primary)s;
+        font-size: 16px;
+        font-weight: 600;
+        background-color: transparent;
+    }
+    
+    /* Navigation Item Containers */
+    #navItem {
+        border-radius: 8px;
+        padding: 8px 10px;
+        margin: 2px 0;
+        background-color: transparent;
+    }
+    
+    /* Selected Navigation Item */
+    #navItem[selected="true"] {
+        background-color: %(primary_10)s; /* 10%% opacity primary color */
+    }
+    
+    /* Selection indicator bar */
+    #selectionIndicator {
+        background-color: %(primary)s;
+        border-radius: 1.5px;
+    }
+    
+    /* Navigation Item Text */
+    #navItemText {
+        color: %(text)s;
+        font-size: 14px;
+    }
+    
+    /* Navigation Icons */
+    #navIcon {
+        color: %(text)s;
+        font-size: 16px;
+    }
+    
+    /* ======================================
+    CONTENT AREA AND SCROLLING
+    ====================================== */
+    
+    /* Content Area Background */
+    #contentScroll {
+        background-color: transparent;
+        border: none;
+    }
+    
+    /* Page Header Text */
+    #pageHeader {
+        color: %(text)s;
+        font-size: 22px;
+        font-weight: 600;
+        margin-bottom: 8px;
+    }
+    
+    /* ======================================
+    SECTION HEADERS AND DESCRIPTIONS
+    ====================================== */
+    
+    /* Section Title Text */
+    #sectionTitle {
+        color: %(text)s;
+        font-size: 16px;
+        font-weight: 600;
+        margin-top: 8px;
+    }
+    
+    /* Section Description Text */
+    #sectionDescription {
+        color: %(text_secondary)s;
+        font-size: 13px;
+        line-height: 1.4;
+    }
+    
+    /* Settings Label Text */
+    #settingLabel {
+        color: %(text)s;
+        font-size: 14px;
+    }
+    
+    /* ======================================
+    SLIDER CONTROLS
+    ====================================== */
+    
+    /* macOS-style Slider - Base */
+    QSlider {
+        height: %(slider_height)spx; /* Configurable slider height */
+    }
+    
+    /* Slider Track */
+    QSlider::groove:horizontal {
+        background: %(border)s;
+        height: 4px;
+        border-radius: 2px;
+    }
+    
+    /* Slider Track - Active/Filled Portion */
+    QSlider::sub-page:horizontal {
+        background: %(primary)s; /* Color of the filled part */
+        height: 4px;
+        border-radius: 2px;
+    }
+    
+    /* Slider Handle */
+    QSlider::handle:horizontal {
+        background: %(primary)s;
+        width: 16px;
+        height: 16px;
+        margin: -6px 0;
+        border-radius: 8px;
+    }
+    
+    /* Slider Handle - Hover Effect */
+    QSlider::handle:horizontal:hover {
+        background: %(secondary)s;
+        width: 18px; /* Slightly larger on hover */
+        height: 18px;
+        margin: -7px 0;
+    }
+    
+    /* Slider Handle - Pressed Effect */
+    QSlider::handle:horizontal:pressed {
+        background: %(secondary)s;
+        width: 18px;
+        height: 18px;
+        margin: -7px 0;
+    }
+    
+    /* ======================================
+    FORM INPUT CONTROLS
+    ====================================== */
+    
+    /* Text Input Field */
+    #valueInput {
+        background-color: %(surface_raised)s;
+        color: %(text)s;
+        border: 1px solid %(border)s;
+        border-radius: 6px;
+        padding: 4px 8px;
+        font-size: 13px;
+    }
+    
+    /* Text Input Field - Focus */
+    #valueInput:focus {
+        border: 1px solid %(primary)s;
+    }
+    
+    /* Combo Box - Dropdown */
+    QComboBox {
+        background-color: %(surface_raised)s;
+        color: %(text)s;
+        border: 1px solid %(border)s;
+        border-radius: 6px;
+        padding: 6px 10px;
+        min-height: 24px;
+        font-size: 14px;
+    }
+    
+    /* Combo Box - Hover Effect */
+    QComboBox:hover {
+        border-color: %(primary_50)s; /* 50%% opacity */
+    }
+    
+    /* Combo Box - Arrow Button */
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: center right;
+        width: 20px;
+        border: none;
+        padding-right: 10px;
+    }
+    
+    /* Combo Box - Arrow Icon - NO SVG */
+    QComboBox::down-arrow {
+        width: 10px;
+        height: 10px;
+        background-color: %(primary)s;
+        clip-path: polygon(0%% 0%%, 100%% 0%%, 50%% 100%%);
+    }
+    
+    /* Combo Box - Dropdown List */
+    QComboBox QAbstractItemView {
+        background-color: %(surface_raised)s;
+        color: %(text)s;
+        border: 1px solid %(border)s;
+        selection-background-color: %(primary_25)s; /* 25%% opacity */
+        selection-color: %(text)s;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    
+    /* ======================================
+    BUTTON STYLES
+    ====================================== */
+    
+    /* Standard Button */
+    QPushButton {
+        background-color: %(surface_raised)s;
+        color: %(text)s;
+        border: 1px solid %(border)s;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 14px;
+        font-weight: 500;
+    }
+    
+    /* Button - Hover Effect */
+    QPushButton:hover {
+        background-color: %(surface_raised)s;
+        border: 1px solid %(primary_50)s; /* 50%% opacity */
+    }
+    
+    /* Button - Pressed Effect */
+    QPushButton:pressed {
+        background-color: %(surface)s;
+    }
+    
+    /* Button - Disabled State */
+    QPushButton:disabled {
+        color: %(text_secondary)s;
+        opacity: 0.6;
+    }
+    
+    /* ======================================
+    THEME SELECTOR BUTTONS
+    ====================================== */
+    
+    /* Theme Button Label */
+    #themeLabel {
+        color: %(text)s;
+        font-size: 14px;
+        font-weight: 500;
+        margin-top: 4px;
+    }
+    
+    /* Color Button */
+    #colorButton {
+        background-color: transparent;
+        border: 2px solid transparent;
+        border-radius: 10px;
+    }
+    
+    #colorButton:checked {
+        border: 2px solid %(primary)s;
+    }
+    
+    /* ======================================
+    APPEARANCE PREVIEW
+    ====================================== */
+    
+    /* Scale Preview Container */
+    #scalePreview {
+        background-color: %(surface_raised)s;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    
+    /* Preview Label */
+    #previewLabel {
+        font-size: 14px;
+        font-weight: 500;
+        margin-top: 10px;
+    }
+    
+    /* Preview Button */
+    #previewButton {
+        background-color: %(primary)s;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-weight: 500;
+    }
+    
+    /* Preview Text */
+    #previewText {
+        color: %(text)s;
+        margin-top: 8px;
+        text-align: center;
+    }
+    
+    /* ======================================
+    SPECIALIZED BUTTON VARIANTS
+    ====================================== */
+    
+    /* Primary Action Button */
+    #primaryButton {
+        background-color: %(primary)s;
+        color: white;
+        border: none;
+    }
+    
+    #primaryButton:hover {
+        background-color: %(secondary)s;
+    }
+    
+    /* Danger/Destructive Button */
+    #dangerButton {
+        background-color: %(accent)s;
+        color: white;
+        border: none;
+    }
+    
+    #dangerButton:hover {
+        background-color: %(accent_87)s; /* Slightly transparent */
+    }
+    
+    /* Warning Button */
+    #warningButton {
+        background-color: %(warning)s;
+        color: white;
+        border: none;
+    }
+    
+    #warningButton:hover {
+        background-color: %(warning_87)s; /* Slightly transparent */
+    }
+    
+    /* Secondary/Outline Button */
+    #secondaryButton {
+        background-color: transparent;
+        color: %(text)s;
+        border: 1px solid %(border)s;
+    }
+    
+    #secondaryButton:hover {
+        background-color: rgba(128, 128, 128, 0.1);
+        border-color: %(primary_50)s; /* 50%% opacity */
+    }
+    
+    /* Play Button for Sound Preview */
+    #playButton {
+        background-color: %(primary)s;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 6px;
+    }
+    
+    #playButton:hover {
+        background-color: %(secondary)s;
+    }
+    
+    /* ======================================
+    VOLUME CONTROLS
+    ====================================== */
+    
+    /* Volume Icon */
+    #volumeIcon {
+        font-size: 16px;
+        color: %(text)s;
+    }
+    
+    /* Volume Value Text */
+    #volumeValue {
+        color: %(text)s;
+        font-size: 14px;
+    }
+    
+    /* ======================================
+    INFORMATIONAL ELEMENTS
+    ====================================== */
+    
+    /* Informational Text */
+    #infoText {
+        color: %(text_secondary)s;
+        font-size: 12px;
+        font-style: italic;
+        padding: 4px 0;
+    }
+    
+    /* ======================================
+    DIVIDERS AND SEPARATORS
+    ====================================== */
+    
+    /* Section Separator Line */
+    #sectionSeparator {
+        background-color: %(border)s;
+        height: 1px;
+    }
+    
+    /* ======================================
+    SCROLLBAR STYLING
+    ====================================== */
+    
+    /* Vertical Scrollbar Base */
+    QScrollBar:vertical {
+        background: transparent;
+        width: 8px;
+        margin: 0px;
+    }
+    
+    /* Scrollbar Handle */
+    QScrollBar::handle:vertical {
+        background: %(border_50)s; /* 50%% opacity */
+        border-radius: 4px;
+        min-height: 30px;
+    }
+    
+    /* Scrollbar Handle - Hover Effect */
+    QScrollBar::handle:vertical:hover {
+        background: %(border)s;
+    }
+    
+    /* Hide Scrollbar Buttons */
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    
+    /* Hide Scrollbar Page Buttons */
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    
+    /* ======================================
+    BOTTOM BUTTON CONTAINER
+    ====================================== */
+    
+    /* Container for Bottom Action Buttons */
+    #buttonContainer {
+        background-color: %(surface)s;
+        border-top: 1px solid %(border)s;
+        border-bottom-left-radius: 10px;
+        border-bottom-right-radius: 10px;
+    }
+    
+    /* Save Button */
+    #saveButton {
+        background-color: %(primary)s;
+        color: white;
+        border: none;
+        min-width: 100px;
+        font-weight: 600;
+    }
+    
+    #saveButton:hover {
+        background-color: %(secondary)s;
+    }
+    
+    /* Cancel Button */
+    #cancelButton {
+        background-color: transparent;
+        color: %(text)s;
+        border: 1px solid %(border)s;
+        min-width: 80px;
+    }
+    
+    #cancelButton:hover {
+        background-color: rgba(128, 128, 128, 0.1);
+        border-color: %(primary_50)s; /* 50%% opacity */
+    }
+"""
+
+
+def _compile_template(template):
+    """Compile a %(name)s template into an f-string render function, parsed once at import"""
+    names = sorted(set(re.findall(r"%\((\w+)\)s", template)))
+    body = template.replace("{", "{{").replace("}", "}}")
+    body = re.sub(r"%\((\w+)\)s", r"{\1}", body).replace("%%", "%")
+    # Extra keys (e.g. colors the stylesheet doesn't use) are accepted and ignored
+    source = f"def render({', '.join(names)}, **_unused):\n    return f{body!r}\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["render"]
+
+
+_render_stylesheet = _compile_template(_STYLE_TEMPLATE)
+
+
+def derive_theme_colors(theme_name):
+    """Resolve the settings dialog colors for a theme, including alpha-suffixed variants"""
+    theme = MODERN_COLORS.get(theme_name.lower(), MODERN_COLORS.get("dark"))
+    
+    # Determine if it's a dark theme
+    is_dark = theme.get('is_dark', False)
+    
+    colors = {
+        'background': theme.get('background', '#1E1E1E' if is_dark else '#F5F5F7'),
+        'surface': theme.get('surface', '#262626' if is_dark else '#FFFFFF'),
+        'surface_raised': theme.get('surface_raised', '#323232' if is_dark else '#F0F0F0'),
+        'text': theme.get('text', '#FFFFFF' if is_dark else '#000000'),
+        'text_secondary': theme.get('text_secondary', '#BBBBBB' if is_dark else '#6E6E6E'),
+        'border': theme.get('border', '#383838' if is_dark else '#D1D1D6'),
+        'primary': theme.get('primary', '#0A84FF'),  # iOS blue
+        'secondary': theme.get('secondary', '#52A8FF'),  # lighter blue
+        'accent': theme.get('accent', '#FF453A'),  # iOS red
+        'warning': theme.get('warning', '#FF9F0A'),  # iOS orange
+        'success': theme.get('success', '#30D158'),  # iOS green
+    }
+    
+    # Alpha-suffixed variants (#RRGGBBAA)
+    colors['primary_50'] = colors['primary'] + "80"
+    colors['primary_25'] = colors['primary'] + "40"
+    colors['primary_10'] = colors['primary'] + "18"
+    colors['border_50'] = colors['border'] + "80"
+    colors['accent_87'] = colors['accent'] + "DD"
+    colors['warning_87'] = colors['warning'] + "DD"
+    return colors
+
+
 class MacOSSlider(QWidget):
     """macOS-style slider with value display and visual enhancements"""
     valueChanged = pyqtSignal(int)
@@ -886,6 +1475,8 @@ class ColorButton(QPushButton):
         super().__init__(parent)
         self.color = QColor(color)
         self.label = label
+        self.theme_name = None  # Plain attribute; avoids a QVariant round-trip on lookup
+        self.theme_key = None  # theme_name lower-cased, compared against main_app.theme_key
         self.setFixedSize(80, 80)
         self.setCheckable(True)
         self.setCursor(Qt.PointingHandCursor)
@@ -951,7 +1542,7 @@ class AppearancePage(SettingsPage):
         ]
         
         # Current theme
-        current_theme = self.parent_dialog.main_app.theme_name
+        current_theme = self.parent_dialog.main_app.theme_key
         
         # Create color buttons for each theme
         self.theme_buttons = []
@@ -959,8 +1550,9 @@ class AppearancePage(SettingsPage):
             row, col = divmod(i, 3)  # 3 columns
             color_btn = ColorButton(theme["color"], theme["text"])
             color_btn.setCheckable(True)
-            color_btn.setChecked(theme["name"].lower() == current_theme.lower())
-            color_btn.setProperty("theme_name", theme["name"])
+            color_btn.theme_name = theme["name"]
+            color_btn.theme_key = theme["name"].lower()
+            color_btn.setChecked(color_btn.theme_key == current_theme)
             
             # Make buttons larger
             color_btn.setFixedSize(90, 90)
@@ -1370,565 +1962,9 @@ class SettingsDialog(QDialog):
         
     def apply_theme(self, slider_height=22):
         """Apply macOS-inspired theme styling to the settings dialog"""
-        theme_name = self.main_app.theme_name.lower()
-        theme = MODERN_COLORS.get(theme_name, MODERN_COLORS.get("dark"))
-        
-        # Determine if it's a dark theme
-        is_dark = theme.get('is_dark', False)
-        
-        # Get main colors from theme
-        background_color = theme.get('background', '#1E1E1E' if is_dark else '#F5F5F7')
-        surface_color = theme.get('surface', '#262626' if is_dark else '#FFFFFF')
-        surface_raised = theme.get('surface_raised', '#323232' if is_dark else '#F0F0F0')
-        text_color = theme.get('text', '#FFFFFF' if is_dark else '#000000')
-        text_secondary_color = theme.get('text_secondary', '#BBBBBB' if is_dark else '#6E6E6E')
-        border_color = theme.get('border', '#383838' if is_dark else '#D1D1D6')
-        primary_color = theme.get('primary', '#0A84FF')  # iOS blue
-        secondary_color = theme.get('secondary', '#52A8FF')  # lighter blue
-        accent_color = theme.get('accent', '#FF453A')  # iOS red
-        warning_color = theme.get('warning', '#FF9F0A')  # iOS orange
-        success_color = theme.get('success', '#30D158')  # iOS green
-            
-        # Build stylesheet without SVG references
-        self.setStyleSheet(f"""
-            /* ======================================
-            BASE DIALOG AND GENERAL ELEMENTS
-            ====================================== */
-            
-            /* Main Dialog Background */
-            QDialog {{
-                background-color: {background_color};
-                color: {text_color};
-                font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', sans-serif;
-                border-radius: 10px; /* Rounded dialog corners */
-            }}
-            
-            /* All Labels - No Background */
-            QLabel {{
-                background-color: transparent;
-                color: {text_color};
-            }}
-            
-            /* ======================================
-            CUSTOM TITLE BAR
-            ====================================== */
-            
-            /* Title bar background */
-            #titleBar {{
-                background-color: {surface_color};
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                border-bottom: 1px solid {border_color};
-            }}
-            
-            /* Window title */
-            #windowTitle {{
-                color: {text_color};
-                font-size: 13px;
-                font-weight: 500;
-            }}
-            
-            /* Window control buttons base */
-            #windowButton {{
-                border-radius: 6px;
-                border: none;
-            }}
-            
-            /* Close button */
-            #closeButton {{
-                background-color: #FF5F57;
-                border: none;
-            }}
-            
-            #closeButton:hover {{
-                background-color: #FF5F57;
-            }}
-            
-            /* Minimize button */
-            #minimizeButton {{
-                background-color: #FEBC2E;
-                border: none;
-            }}
-            
-            #minimizeButton:hover {{
-                background-color: #FEBC2E;
-            }}
-            
-            /* Maximize button */
-            #maximizeButton {{
-                background-color: #28C840;
-                border: none;
-            }}
-            
-            #maximizeButton:hover {{
-                background-color: #28C840;
-            }}
-            
-            /* ======================================
-            NAVIGATION SIDEBAR STYLING
-            ====================================== */
-            
-            /* Sidebar Background with Border */
-            #navSidebar {{
-                background-color: {surface_color};
-                border-right: 1px solid {border_color};
-                border-bottom-left-radius: 10px;
-            }}
-            
-            /* Sidebar header with app name */
-            #sidebarHeader {{
-                color: {primary_color};
-                font-size: 16px;
-                font-weight: 600;
-                background-color: transparent;
-            }}
-            
-            /* Navigation Item Containers */
-            #navItem {{
-                border-radius: 8px;
-                padding: 8px 10px;
-                margin: 2px 0;
-                background-color: transparent;
-            }}
-            
-            /* Selected Navigation Item */
-            #navItem[selected="true"] {{
-                background-color: {primary_color}18; /* 10% opacity primary color */
-            }}
-            
-            /* Selection indicator bar */
-            #selectionIndicator {{
-                background-color: {primary_color};
-                border-radius: 1.5px;
-            }}
-            
-            /* Navigation Item Text */
-            #navItemText {{
-                color: {text_color};
-                font-size: 14px;
-            }}
-            
-            /* Navigation Icons */
-            #navIcon {{
-                color: {text_color};
-                font-size: 16px;
-            }}
-            
-            /* ======================================
-            CONTENT AREA AND SCROLLING
-            ====================================== */
-            
-            /* Content Area Background */
-            #contentScroll {{
-                background-color: transparent;
-                border: none;
-            }}
-            
-            /* Page Header Text */
-            #pageHeader {{
-                color: {text_color};
-                font-size: 22px;
-                font-weight: 600;
-                margin-bottom: 8px;
-            }}
-            
-            /* ======================================
-            SECTION HEADERS AND DESCRIPTIONS
-            ====================================== */
-            
-            /* Section Title Text */
-            #sectionTitle {{
-                color: {text_color};
-                font-size: 16px;
-                font-weight: 600;
-                margin-top: 8px;
-            }}
-            
-            /* Section Description Text */
-            #sectionDescription {{
-                color: {text_secondary_color};
-                font-size: 13px;
-                line-height: 1.4;
-            }}
-            
-            /* Settings Label Text */
-            #settingLabel {{
-                color: {text_color};
-                font-size: 14px;
-            }}
-            
-            /* ======================================
-            SLIDER CONTROLS
-            ====================================== */
-            
-            /* macOS-style Slider - Base */
-            QSlider {{
-                height: {slider_height}px; /* Configurable slider height */
-            }}
-            
-            /* Slider Track */
-            QSlider::groove:horizontal {{
-                background: {border_color};
-                height: 4px;
-                border-radius: 2px;
-            }}
-            
-            /* Slider Track - Active/Filled Portion */
-            QSlider::sub-page:horizontal {{
-                background: {primary_color}; /* Color of the filled part */
-                height: 4px;
-                border-radius: 2px;
-            }}
-            
-            /* Slider Handle */
-            QSlider::handle:horizontal {{
-                background: {primary_color};
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 8px;
-            }}
-            
-            /* Slider Handle - Hover Effect */
-            QSlider::handle:horizontal:hover {{
-                background: {secondary_color};
-                width: 18px; /* Slightly larger on hover */
-                height: 18px;
-                margin: -7px 0;
-            }}
-            
-            /* Slider Handle - Pressed Effect */
-            QSlider::handle:horizontal:pressed {{
-                background: {secondary_color};
-                width: 18px;
-                height: 18px;
-                margin: -7px 0;
-            }}
-            
-            /* ======================================
-            FORM INPUT CONTROLS
-            ====================================== */
-            
-            /* Text Input Field */
-            #valueInput {{
-                background-color: {surface_raised};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 4px 8px;
-                font-size: 13px;
-            }}
-            
-            /* Text Input Field - Focus */
-            #valueInput:focus {{
-                border: 1px solid {primary_color};
-            }}
-            
-            /* Combo Box - Dropdown */
-            QComboBox {{
-                background-color: {surface_raised};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 6px 10px;
-                min-height: 24px;
-                font-size: 14px;
-            }}
-            
-            /* Combo Box - Hover Effect */
-            QComboBox:hover {{
-                border-color: {primary_color}80; /* 50% opacity */
-            }}
-            
-            /* Combo Box - Arrow Button */
-            QComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 20px;
-                border: none;
-                padding-right: 10px;
-            }}
-            
-            /* Combo Box - Arrow Icon - NO SVG */
-            QComboBox::down-arrow {{
-                width: 10px;
-                height: 10px;
-                background-color: {primary_color};
-                clip-path: polygon(0% 0%, 100% 0%, 50% 100%);
-            }}
-            
-            /* Combo Box - Dropdown List */
-            QComboBox QAbstractItemView {{
-                background-color: {surface_raised};
-                color: {text_color};
-                border: 1px solid {border_color};
-                selection-background-color: {primary_color}40; /* 25% opacity */
-                selection-color: {text_color};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            
-            /* ======================================
-            BUTTON STYLES
-            ====================================== */
-            
-            /* Standard Button */
-            QPushButton {{
-                background-color: {surface_raised};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            
-            /* Button - Hover Effect */
-            QPushButton:hover {{
-                background-color: {surface_raised};
-                border: 1px solid {primary_color}80; /* 50% opacity */
-            }}
-            
-            /* Button - Pressed Effect */
-            QPushButton:pressed {{
-                background-color: {surface_color};
-            }}
-            
-            /* Button - Disabled State */
-            QPushButton:disabled {{
-                color: {text_secondary_color};
-                opacity: 0.6;
-            }}
-            
-            /* ======================================
-            THEME SELECTOR BUTTONS
-            ====================================== */
-            
-            /* Theme Button Label */
-            #themeLabel {{
-                color: {text_color};
-                font-size: 14px;
-                font-weight: 500;
-                margin-top: 4px;
-            }}
-            
-            /* Color Button */
-            #colorButton {{
-                background-color: transparent;
-                border: 2px solid transparent;
-                border-radius: 10px;
-            }}
-            
-            #colorButton:checked {{
-                border: 2px solid {primary_color};
-            }}
-            
-            /* ======================================
-            APPEARANCE PREVIEW
-            ====================================== */
-            
-            /* Scale Preview Container */
-            #scalePreview {{
-                background-color: {surface_raised};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-            
-            /* Preview Label */
-            #previewLabel {{
-                font-size: 14px;
-                font-weight: 500;
-                margin-top: 10px;
-            }}
-            
-            /* Preview Button */
-            #previewButton {{
-                background-color: {primary_color};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }}
-            
-            /* Preview Text */
-            #previewText {{
-                color: {text_color};
-                margin-top: 8px;
-                text-align: center;
-            }}
-            
-            /* ======================================
-            SPECIALIZED BUTTON VARIANTS
-            ====================================== */
-            
-            /* Primary Action Button */
-            #primaryButton {{
-                background-color: {primary_color};
-                color: white;
-                border: none;
-            }}
-            
-            #primaryButton:hover {{
-                background-color: {secondary_color};
-            }}
-            
-            /* Danger/Destructive Button */
-            #dangerButton {{
-                background-color: {accent_color};
-                color: white;
-                border: none;
-            }}
-            
-            #dangerButton:hover {{
-                background-color: {accent_color}DD; /* Slightly transparent */
-            }}
-            
-            /* Warning Button */
-            #warningButton {{
-                background-color: {warning_color};
-                color: white;
-                border: none;
-            }}
-            
-            #warningButton:hover {{
-                background-color: {warning_color}DD; /* Slightly transparent */
-            }}
-            
-            /* Secondary/Outline Button */
-            #secondaryButton {{
-                background-color: transparent;
-                color: {text_color};
-                border: 1px solid {border_color};
-            }}
-            
-            #secondaryButton:hover {{
-                background-color: rgba(128, 128, 128, 0.1);
-                border-color: {primary_color}80; /* 50% opacity */
-            }}
-            
-            /* Play Button for Sound Preview */
-            #playButton {{
-                background-color: {primary_color};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px;
-            }}
-            
-            #playButton:hover {{
-                background-color: {secondary_color};
-            }}
-            
-            /* ======================================
-            VOLUME CONTROLS
-            ====================================== */
-            
-            /* Volume Icon */
-            #volumeIcon {{
-                font-size: 16px;
-                color: {text_color};
-            }}
-            
-            /* Volume Value Text */
-            #volumeValue {{
-                color: {text_color};
-                font-size: 14px;
-            }}
-            
-            /* ======================================
-            INFORMATIONAL ELEMENTS
-            ====================================== */
-            
-            /* Informational Text */
-            #infoText {{
-                color: {text_secondary_color};
-                font-size: 12px;
-                font-style: italic;
-                padding: 4px 0;
-            }}
-            
-            /* ======================================
-            DIVIDERS AND SEPARATORS
-            ====================================== */
-            
-            /* Section Separator Line */
-            #sectionSeparator {{
-                background-color: {border_color};
-                height: 1px;
-            }}
-            
-            /* ======================================
-            SCROLLBAR STYLING
-            ====================================== */
-            
-            /* Vertical Scrollbar Base */
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 8px;
-                margin: 0px;
-            }}
-            
-            /* Scrollbar Handle */
-            QScrollBar::handle:vertical {{
-                background: {border_color}80; /* 50% opacity */
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            
-            /* Scrollbar Handle - Hover Effect */
-            QScrollBar::handle:vertical:hover {{
-                background: {border_color};
-            }}
-            
-            /* Hide Scrollbar Buttons */
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            
-            /* Hide Scrollbar Page Buttons */
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-            
-            /* ======================================
-            BOTTOM BUTTON CONTAINER
-            ====================================== */
-            
-            /* Container for Bottom Action Buttons */
-            #buttonContainer {{
-                background-color: {surface_color};
-                border-top: 1px solid {border_color};
-                border-bottom-left-radius: 10px;
-                border-bottom-right-radius: 10px;
-            }}
-            
-            /* Save Button */
-            #saveButton {{
-                background-color: {primary_color};
-                color: white;
-                border: none;
-                min-width: 100px;
-                font-weight: 600;
-            }}
-            
-            #saveButton:hover {{
-                background-color: {secondary_color};
-            }}
-            
-            /* Cancel Button */
-            #cancelButton {{
-                background-color: transparent;
-                color: {text_color};
-                border: 1px solid {border_color};
-                min-width: 80px;
-            }}
-            
-            #cancelButton:hover {{
-                background-color: rgba(128, 128, 128, 0.1);
-                border-color: {primary_color}80; /* 50% opacity */
-            }}
-        """)
+        # Colors are derived once per theme change by the main window
+        values = dict(self.main_app.theme_derived, slider_height=slider_height)
+        self.setStyleSheet(_render_stylesheet(**values))
         
     def init_ui(self, slider_height=22):
         """Initialize the UI with macOS-inspired layout"""
@@ -1958,20 +1994,24 @@ class SettingsDialog(QDialog):
         # Stacked widget for content pages
         self.content_stack = QStackedWidget()
         
-        # Create pages
-        self.general_page = GeneralPage(self, slider_height=slider_height)
-        self.appearance_page = AppearancePage(self, slider_height=slider_height)
-        self.sound_page = SoundPage(self, slider_height=slider_height)
-        self.data_page = DataPage(self)
+        # Pages are built on first navigation; placeholders hold their slots until then
+        self._page_builders = [
+            ("general_page", lambda: GeneralPage(self, slider_height=slider_height)),
+            ("appearance_page", lambda: AppearancePage(self, slider_height=slider_height)),
+            ("sound_page", lambda: SoundPage(self, slider_height=slider_height)),
+            ("data_page", lambda: DataPage(self)),
+        ]
+        self._pages = [None] * len(self._page_builders)
+        self.general_page = self.appearance_page = self.sound_page = self.data_page = None
+        for _ in self._page_builders:
+            self.content_stack.addWidget(QWidget())
         
-        # Add pages to stack
-        self.content_stack.addWidget(self.general_page)
-        self.content_stack.addWidget(self.appearance_page)
-        self.content_stack.addWidget(self.sound_page)
-        self.content_stack.addWidget(self.data_page)
+        # The first page is visible on open, so build it right away
+        self._ensure_page(0)
+        self.content_stack.setCurrentIndex(0)
         
         # Connect navigation to stack
-        self.navigation.selectionChanged.connect(self.content_stack.setCurrentIndex)
+        self.navigation.selectionChanged.connect(self._show_page)
         
         # Add to content layout
         content_layout.addWidget(self.navigation)
@@ -2006,6 +2046,25 @@ class SettingsDialog(QDialog):
         # Set dialog styles for shadows and corner radius
         #self.setAttribute(Qt.WA_TranslucentBackground)
     
+    def _ensure_page(self, index):
+        """Build the page at index if it is still a placeholder and return it"""
+        page = self._pages[index]
+        if page is None:
+            attr_name, builder = self._page_builders[index]
+            page = builder()
+            placeholder = self.content_stack.widget(index)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.content_stack.insertWidget(index, page)
+            self._pages[index] = page
+            setattr(self, attr_name, page)
+        return page
+    
+    def _show_page(self, index):
+        """Switch to a page, building it on first visit"""
+        self._ensure_page(index)
+        self.content_stack.setCurrentIndex(index)
+    
     def save_settings(self):
         """Save all settings from the pages to the application"""
         # Validate settings
@@ -2021,11 +2080,13 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "Invalid Settings", validation_message)
             return
         
-        # Show saving indicator
+        # Show saving indicator; the label repaints before the deferred save runs
         self.save_btn.setText("Saving...")
         self.save_btn.setEnabled(False)
-        QApplication.processEvents()  # Force UI update
-        
+        QTimer.singleShot(0, self._do_save)
+    
+    def _do_save(self):
+        """Write the validated settings back to the application"""
         try:
             # General settings
             self.main_app.min_hydration_interval = self.general_page.min_slider.value()
@@ -2033,24 +2094,29 @@ class SettingsDialog(QDialog):
             self.main_app.snooze_duration = self.general_page.snooze_slider.value()
             self.main_app.daily_hydration_goal = self.general_page.daily_goal_slider.value()
             
-            # Appearance settings
-            # Get the selected theme
-            for button in self.appearance_page.theme_buttons:
-                if button.isChecked():
-                    self.main_app.theme_name = button.property("theme_name")
-                    break
-            self.main_app.show_progress_text = self.appearance_page.show_progress_toggle.isChecked()
+            # Appearance settings (unvisited pages hold no changes)
+            if self.appearance_page is not None:
+                # Get the selected theme
+                for button in self.appearance_page.theme_buttons:
+                    if button.isChecked():
+                        self.main_app.theme_name = button.theme_name
+                        self.main_app.theme_key = button.theme_key
+                        break
+                self.main_app.show_progress_text = self.appearance_page.show_progress_toggle.isChecked()
             
             # Sound settings
-            self.main_app.sound_enabled = self.sound_page.sound_enabled_toggle.isChecked()
-            self.main_app.sound_file = SOUND_OPTIONS.get(
-                self.sound_page.sound_choice_combo.currentText(),
-                "assets/sounds/normal.wav"
-            )
+            if self.sound_page is not None:
+                self.main_app.sound_enabled = self.sound_page.sound_enabled_toggle.isChecked()
+                self.main_app.sound_file = SOUND_OPTIONS.get(
+                    self.sound_page.sound_choice_combo.currentText(),
+                    "assets/sounds/normal.wav"
+                )
             
             # Behavior settings (referenced from the GeneralPage)
-            self.main_app.settings_manager.set('start_at_login', self.general_page.start_at_login_toggle.isChecked())
-            self.main_app.settings_manager.set('notification_style', self.general_page.notification_combo.currentText())
+            self.main_app.settings_manager.update({
+                'start_at_login': self.general_page.start_at_login_toggle.isChecked(),
+                'notification_style': self.general_page.notification_combo.currentText(),
+            })
             
             # Save to settings manager and update the UI
             self.main_app.save_settings()
@@ -2096,25 +2162,27 @@ class SettingsDialog(QDialog):
             self.general_page.daily_goal_slider.value() != self.main_app.daily_hydration_goal):
             return True
         
-        # Appearance settings
-        selected_theme = None
-        for button in self.appearance_page.theme_buttons:
-            if button.isChecked():
-                selected_theme = button.property("theme_name")
-                break
-        if (selected_theme.lower() != self.main_app.theme_name.lower() or
-            self.appearance_page.show_progress_toggle.isChecked() != self.main_app.show_progress_text):
-            return True
+        # Appearance settings (unvisited pages hold no changes)
+        if self.appearance_page is not None:
+            selected_theme = None
+            for button in self.appearance_page.theme_buttons:
+                if button.isChecked():
+                    selected_theme = button.theme_key
+                    break
+            if (selected_theme != self.main_app.theme_key or
+                self.appearance_page.show_progress_toggle.isChecked() != self.main_app.show_progress_text):
+                return True
         
         # Sound settings
-        current_sound = None
-        for key, value in SOUND_OPTIONS.items():
-            if value == self.main_app.sound_file:
-                current_sound = key
-                break
-        if (self.sound_page.sound_enabled_toggle.isChecked() != self.main_app.sound_enabled or
-            self.sound_page.sound_choice_combo.currentText() != current_sound):
-            return True
+        if self.sound_page is not None:
+            current_sound = None
+            for key, value in SOUND_OPTIONS.items():
+                if value == self.main_app.sound_file:
+                    current_sound = key
+                    break
+            if (self.sound_page.sound_enabled_toggle.isChecked() != self.main_app.sound_enabled or
+                self.sound_page.sound_choice_combo.currentText() != current_sound):
+                return True
         
         # Behavior settings (referenced from the GeneralPage)
         if self.general_page.start_at_login_toggle.isChecked() != self.main_app.settings_manager.get('start_at_login'):
@@ -10,13 +10,13 @@ def unregister_autostart():
         try:
             import winreg as reg
             reg_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
-            key = reg.OpenKey(reg.HKEY_CURRENT_USER, reg_key, 0, reg.KEY_ALL_ACCESS)
-            try:
-                reg.DeleteValue(key, "bea_apa")
-                print("Removed auto-start registry entry.")
-            except FileNotFoundError:
-                print("Auto-start registry entry not found.")
-            reg.CloseKey(key)
+            access = reg.KEY_SET_VALUE | reg.KEY_QUERY_VALUE
+            with reg.OpenKey(reg.HKEY_CURRENT_USER, reg_key, 0, access) as key:
+                try:
+                    reg.DeleteValue(key, "bea_apa")
+                    print("Removed auto-start registry entry.")
+                except FileNotFoundError:
+                    print("Auto-start registry entry not found.")
         except Exception as e:
             print("Error removing auto-start registry entry:", e)
     elif sys.platform.startswith('linux'):
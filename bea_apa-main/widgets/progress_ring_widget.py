@@ -1,10 +1,13 @@
 # widgets/progress_ring_widget.py
 
 from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QBrush, QConicalGradient, QLinearGradient, QPainterPath, QFontMetrics
+from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QBrush, QConicalGradient, QLinearGradient, QPainterPath, QFontMetrics, QPixmap
 from PyQt5.QtWidgets import QWidget
 from config import MODERN_COLORS
 
+# Droplet/particle opacity is quantized to this many steps for batching
+OPACITY_STEPS = 16
+
 class ProgressRingWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -16,33 +19,204 @@ class ProgressRingWidget(QWidget):
         self.theme = "Dark"  # default theme
         self.countdown_progress = 0.0
         
-        # Water droplet effect
-        self.droplets = []
+        # Last drawn state, used by setProgress to skip redundant repaints
+        self._last_state = None
+        
+        # Arc extents in half-degree steps, updated by setProgress
+        self._progress_steps = 0
+        self._countdown_steps = 0
+        
+        # Persistent pens and fonts; only color/width/size are mutated later
+        self._progress_pen = QPen()
+        self._progress_pen.setCapStyle(Qt.RoundCap)
+        self._countdown_pen = QPen()
+        self._countdown_pen.setCapStyle(Qt.RoundCap)
+        self._main_font = QFont("Segoe UI")
+        self._main_font.setBold(True)
+        self._goal_font = QFont("Segoe UI")
+        
+        # Size-dependent geometry, updated on resize
+        self._update_geometry()
+        
+        # Theme colors resolved to QColor once per theme change
+        self._resolved = {}
+        self._resolve_theme()
+        
+        # Text measurements keyed by (size, log_count, daily_goal)
+        self._text_cache = {}
+        
+        # Pre-rendered background ring keyed by (width, height, theme)
+        self._bg_cache = {}
+        
+        # Arc paths keyed by half-degree step, rebuilt only on resize
+        self._progress_path_cache = {}
+        self._countdown_path_cache = {}
+        
+        # Water droplet effect, stored as parallel columns (one entry per droplet)
+        self._drop_x = []
+        self._drop_y = []
+        self._drop_size = []
+        self._drop_opacity = []
+        self._drop_speed = []
+        # Pre-built droplet brushes, one per opacity step
+        self._droplet_brushes = [QBrush(QColor(30, 144, 255, int(255 * i / OPACITY_STEPS)))
+                                 for i in range(OPACITY_STEPS + 1)]
+        # One reusable path per opacity step, cleared before it is refilled at the start of each paint
+        self._droplet_paths = [QPainterPath() for _ in range(OPACITY_STEPS + 1)]
         self.droplet_timer = QTimer(self)
         self.droplet_timer.timeout.connect(self.update_droplets)
-        self.droplet_timer.start(50)  # Update droplets every 50ms
+        self.droplet_timer.setInterval(50)  # Runs only while droplets are animating
 
     def add_droplet(self):
         """Add a new water droplet effect"""
-        if len(self.droplets) < 8:  # Limit number of droplets
-            self.droplets.append({
-                'x': self.width() / 2,
-                'y': self.height() / 2,
-                'size': 5.0,
-                'opacity': 1.0,
-                'speed': 2.0
-            })
+        if len(self._drop_opacity) < 8:  # Limit number of droplets
+            self._drop_x.append(self.width() / 2)
+            self._drop_y.append(self.height() / 2)
+            self._drop_size.append(5.0)
+            self._drop_opacity.append(1.0)
+            self._drop_speed.append(2.0)
+            if self.isVisible() and not self.droplet_timer.isActive():
+                self.droplet_timer.start()
 
     def update_droplets(self):
         """Animate water droplets"""
-        for droplet in self.droplets:
-            droplet['size'] += droplet['speed']
-            droplet['opacity'] -= 0.01
+        self._drop_size = [size + speed for size, speed in zip(self._drop_size, self._drop_speed)]
+        self._drop_opacity = [opacity - 0.01 for opacity in self._drop_opacity]
         
-        # Remove expired droplets
-        self.droplets = [d for d in self.droplets if d['opacity'] > 0]
+        # Remove expired droplets. All droplets fade at the same rate and are
+        # appended in order, so expired ones are always at the front.
+        expired = 0
+        for opacity in self._drop_opacity:
+            if opacity > 0:
+                break
+            expired += 1
+        if expired:
+            del self._drop_x[:expired]
+            del self._drop_y[:expired]
+            del self._drop_size[:expired]
+            del self._drop_opacity[:expired]
+            del self._drop_speed[:expired]
+        if not self._drop_opacity:
+            self.droplet_timer.stop()
+        # Repaint while animating, plus once more to clear the last droplet
         self.update()
 
+    def showEvent(self, event):
+        """Resume the droplet animation when shown"""
+        super().showEvent(event)
+        if self._drop_opacity:
+            self.droplet_timer.start()
+
+    def hideEvent(self, event):
+        """Hidden widgets don't need to animate"""
+        super().hideEvent(event)
+        self.droplet_timer.stop()
+
+    def resizeEvent(self, event):
+        """Recompute geometry and drop size-dependent caches"""
+        super().resizeEvent(event)
+        self._update_geometry()
+        self._text_cache.clear()
+        self._bg_cache.clear()
+        self._progress_path_cache.clear()
+        self._countdown_path_cache.clear()
+
+    def _update_geometry(self):
+        """Precompute the ring rectangle and pen widths for the current size"""
+        w, h = self.width(), self.height()
+        self._ring_size = min(w, h) - 30  # Slightly smaller for padding
+        size = self._ring_size
+        self._ring_rect = QRectF((w - size) / 2, (h - size) / 2, size, size)
+        self._main_pen_width = max(10, size * 0.05)
+        self._countdown_pen_width = max(4, size * 0.02)
+        inset = self._main_pen_width * 1.5
+        self._countdown_rect = self._ring_rect.adjusted(inset, inset, -inset, -inset)
+        self._progress_pen.setWidthF(self._main_pen_width)
+        self._countdown_pen.setWidthF(self._countdown_pen_width)
+        self._main_font.setPointSize(max(1, int(size * 0.22)))
+        self._goal_font.setPointSize(max(1, int(size * 0.11)))
+
+    def _resolve_theme(self):
+        """Look up the current theme and convert the colors paintEvent needs"""
+        # Get theme colors safely with a fallback
+        try:
+            theme_colors = MODERN_COLORS[self.theme.lower()]
+        except KeyError:
+            theme_colors = MODERN_COLORS.get("dark v2", {
+                "highlight": "#72757E",
+                "primary": "#7F5AF0",
+                "secondary": "#2CB67D",
+                "accent": "#EF4565",
+                "text": "#FFFFFE",
+                "background": "#16161A"
+            })
+        
+        bg_color = QColor(theme_colors.get('highlight', "#72757E"))
+        bg_color.setAlphaF(0.3)  # Subtle transparency
+        text_color = QColor(theme_colors.get('text', "#FFFFFF"))
+        secondary_text_color = QColor(text_color)
+        secondary_text_color.setAlphaF(0.7)  # Slightly transparent for secondary text
+        
+        self._resolved = {
+            'background': bg_color,
+            'primary': QColor(theme_colors.get('primary', "#1e90ff")),
+            'accent': QColor(theme_colors.get('accent', "#EF4565")),
+            'text': text_color,
+            'text_secondary': secondary_text_color,
+            'shadow': QColor(0, 0, 0, 50),
+        }
+        self._progress_pen.setColor(self._resolved['primary'])
+        self._countdown_pen.setColor(self._resolved['accent'])
+
+    def _background_pixmap(self, rect, pen_width):
+        """Return the static background ring, rendering it on a cache miss"""
+        # The scale factor changes when the window moves to a monitor with different scaling
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self.theme, dpr)
+        pixmap = self._bg_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            # Subtle transparent ring in the theme highlight color
+            bg_pen = QPen(self._resolved['background'], pen_width)
+            bg_pen.setCapStyle(Qt.RoundCap)
+            
+            cache_painter = QPainter(pixmap)
+            cache_painter.setRenderHint(QPainter.Antialiasing)
+            cache_painter.setPen(bg_pen)
+            cache_painter.drawEllipse(rect)
+            cache_painter.end()
+            self._bg_cache[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _arc_path(cache, rect, steps):
+        """Return a cached arc running clockwise from 12 o'clock over steps half-degrees"""
+        path = cache.get(steps)
+        if path is None:
+            path = QPainterPath()
+            path.arcMoveTo(rect, 90)
+            path.arcTo(rect, 90, -steps / 2)
+            cache[steps] = path
+        return path
+
+    def _text_layout(self, size):
+        """Return cached (main_text_width, main_text_height, goal_text_width)"""
+        key = (size, self.log_count, self.daily_goal)
+        layout = self._text_cache.get(key)
+        if layout is None:
+            main_metrics = QFontMetrics(self._main_font)
+            goal_metrics = QFontMetrics(self._goal_font)
+            layout = (
+                main_metrics.horizontalAdvance(f"{self.log_count}"),
+                main_metrics.height(),
+                goal_metrics.horizontalAdvance(f"of {self.daily_goal}"),
+            )
+            self._text_cache[key] = layout
+        return layout
+
     def setProgress(self, progress, log_count, daily_goal, show_text=True, theme="Dark", countdown=0.0):
         """Set progress and other parameters - this is the main public method"""
         # Validate and clamp countdown_progress between 0 and 1
@@ -56,13 +230,29 @@ class ProgressRingWidget(QWidget):
         self.log_count = int(log_count)
         self.daily_goal = int(daily_goal)
         self.show_text = bool(show_text)
-        self.theme = theme if isinstance(theme, str) else "Dark"
+        theme = theme if isinstance(theme, str) else "Dark"
+        if theme != self.theme:
+            self.theme = theme
+            self._resolve_theme()
+            self._bg_cache.clear()
         
         # Set progress value directly (no animation)
+        prev_progress = self._progress_value
         self._progress_value = float(progress) if progress is not None else 0.0
         
-        # Add water droplet effect for visual feedback
-        if self._progress_value > 0:
+        # Arc extents in half-degree steps (720 == 360 * 2)
+        self._progress_steps = int(self._progress_value * 720)
+        self._countdown_steps = int(self.countdown_progress * 720)
+        
+        # Timer ticks mostly re-send the same state; nothing to repaint then
+        state = (self._progress_value, self.log_count, self.daily_goal,
+                 self.show_text, self.theme, self._countdown_steps)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        
+        # Add water droplet effect when progress actually increases
+        if self._progress_value > prev_progress:
             self.add_droplet()
             
         # Trigger a repaint
@@ -73,190 +263,77 @@ class ProgressRingWidget(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
 
         w, h = self.width(), self.height()
-        size = min(w, h) - 30  # Slightly smaller for padding
-        rect = QRectF((w - size) / 2, (h - size) / 2, size, size)
+        size = self._ring_size
+        rect = self._ring_rect
         center_x, center_y = w / 2, h / 2
-        
-        # Get theme colors safely with a fallback
-        try:
-            theme_colors = MODERN_COLORS[self.theme.lower()]
-        except KeyError:
-            theme_colors = MODERN_COLORS.get("dark v2", {
-                "highlight": "#72757E",
-                "primary": "#7F5AF0",
-                "secondary": "#2CB67D",
-                "accent": "#EF4565",
-                "text": "#FFFFFE",
-                "background": "#16161A"
-            })
+        colors = self._resolved
 
-        # Draw water droplet effects
-        for droplet in self.droplets:
-            painter.save()
-            droplet_color = QColor(30, 144, 255, int(255 * droplet['opacity']))
-            painter.setBrush(QBrush(droplet_color))
-            painter.setPen(Qt.NoPen)
-            droplet_rect = QRectF(
-                droplet['x'] - droplet['size'] / 2,
-                droplet['y'] - droplet['size'] / 2,
-                droplet['size'],
-                droplet['size']
-            )
-            painter.drawEllipse(droplet_rect)
-            painter.restore()
+        # Draw water droplet effects, batched into one path per opacity bucket
+        used_buckets = set()
+        for x, y, droplet_size, opacity in zip(self._drop_x, self._drop_y,
+                                               self._drop_size, self._drop_opacity):
+            bucket = int(opacity * OPACITY_STEPS)
+            path = self._droplet_paths[bucket]
+            if bucket not in used_buckets:
+                used_buckets.add(bucket)
+                path.clear()
+                path.setFillRule(Qt.WindingFill)  # Overlapping droplets must not cancel out
+            path.addEllipse(QRectF(
+                x - droplet_size / 2,
+                y - droplet_size / 2,
+                droplet_size,
+                droplet_size
+            ))
+        for bucket in used_buckets:
+            painter.fillPath(self._droplet_paths[bucket], self._droplet_brushes[bucket])
             
-        # Calculate ring dimensions and positioning
-        center = rect.center()
-        main_pen_width = max(10, size * 0.05)
-        countdown_pen_width = max(4, size * 0.02)
+        main_pen_width = self._main_pen_width
         
         # ===== Background Ring with subtle glow =====
-        bg_path = QRectF(rect)
-        
-        # Create a smooth background gradient
-        bg_color = QColor(theme_colors.get('highlight', "#72757E"))
-        bg_color.setAlphaF(0.3)  # Subtle transparency
-        
-        # Draw the background ring
-        bg_pen = QPen(bg_color, main_pen_width)
-        bg_pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(bg_pen)
-        painter.drawEllipse(rect)
+        # Depends only on size and theme, so it is blitted from a cached pixmap
+        painter.drawPixmap(0, 0, self._background_pixmap(rect, main_pen_width))
         
         # ===== Progress Ring with Gradient =====
         if self._progress_value > 0:
-            # Calculate arc rectangle
-            progress_rect = QRectF(rect)
-            
-            # Create water-themed gradient
-            progress_color = QColor(theme_colors.get('primary', "#1e90ff"))
-            progress_pen = QPen(progress_color, main_pen_width)
-            progress_pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(progress_pen)
-            
-            # Calculate angles for the arc (counterclockwise from 90°)
-            start_angle = 90 * 16  # Convert to 1/16th of a degree units
-            span_angle = int(-self._progress_value * 360 * 16)  # Convert to integer
-            
-            # Draw the progress arc
-            painter.drawArc(progress_rect, start_angle, span_angle)
-        '''
-        # ===== Progress Text with improved typography and glow =====
-        if self.show_text:
-            # Create glow effect for text
-            glow_rect = rect.adjusted(rect.width() * 0.25, rect.height() * 0.25, 
-                                    -rect.width() * 0.25, -rect.height() * 0.25)
-            
-            # Draw count text
-            count_font = QFont("Segoe UI", int(size * 0.18), QFont.Bold)
-            painter.setFont(count_font)
-            
-            # Calculate text dimensions for proper layout
-            count_text = f"{self.log_count}/{self.daily_goal}"
-            
-            # Draw subtle glow/shadow
-            shadow_color = QColor(0, 0, 0, 50)
-            painter.setPen(shadow_color)
-            painter.drawText(glow_rect.adjusted(2, 2, 2, 2), Qt.AlignCenter, count_text)
-            
-            # Draw main text
-            painter.setPen(QColor(theme_colors.get('text', "#FFFFFF")))
-            painter.drawText(glow_rect, Qt.AlignCenter, count_text)
-            
-            # Draw "drinks" label
-            label_font = QFont("Segoe UI", int(size * 0.08))
-            painter.setFont(label_font)
-            label_rect = rect.adjusted(0, rect.height() * 0.15, 0, rect.height() * 0.15)
-            painter.drawText(label_rect, Qt.AlignCenter, "drinks today")
-        ''' 
-         
+            # Draw the progress arc from a path cached per half-degree step
+            painter.strokePath(
+                self._arc_path(self._progress_path_cache, rect, self._progress_steps),
+                self._progress_pen)
+
         if self.show_text:
             # Prepare text content
             main_text = f"{self.log_count}"
             goal_text = f"of {self.daily_goal}"
             
-            # Set up text colors
-            text_color = QColor(theme_colors.get('text', "#FFFFFF"))
-            secondary_text_color = QColor(text_color)
-            secondary_text_color.setAlphaF(0.7)  # Slightly transparent for secondary text
-            
-            # Calculate font sizes proportional to widget size
-            main_font_size = int(size * 0.22)
-            goal_font_size = int(size * 0.11)
+            # Fonts scale with the widget (see _update_geometry); measurements are cached
+            main_text_width, main_text_height, goal_text_width = self._text_layout(size)
             
             # ---- Draw main count ----
-            main_font = QFont("Segoe UI", main_font_size, QFont.Bold)
-            painter.setFont(main_font)
-            
-            # Get text dimensions for centering
-            metrics = QFontMetrics(main_font)
-            main_text_width = metrics.horizontalAdvance(main_text)
-            main_text_height = metrics.height()
+            painter.setFont(self._main_font)
             
             # Position text in center
             main_text_x = center_x - main_text_width / 2
             main_text_y = center_y - main_text_height / 4
             
             # Draw main count with subtle shadow for depth
-            painter.setPen(QColor(0, 0, 0, 50))
+            painter.setPen(colors['shadow'])
             painter.drawText(QPointF(main_text_x + 1, main_text_y + 1), main_text)
-            painter.setPen(text_color)
+            painter.setPen(colors['text'])
             painter.drawText(QPointF(main_text_x, main_text_y), main_text)
             
             # ---- Draw goal text ----
-            goal_font = QFont("Segoe UI", goal_font_size)
-            painter.setFont(goal_font)
-            
-            # Get text dimensions for centering
-            metrics = QFontMetrics(goal_font)
-            goal_text_width = metrics.horizontalAdvance(goal_text)
+            painter.setFont(self._goal_font)
             
             # Position below main text
             goal_text_x = center_x - goal_text_width / 2
             goal_text_y = main_text_y + main_text_height * 0.8
             
-            painter.setPen(secondary_text_color)
+            painter.setPen(colors['text_secondary'])
             painter.drawText(QPointF(goal_text_x, goal_text_y), goal_text)
-        '''
-        if self.show_text:
-            # Create a semi-transparent background circle
-            center_size = size * 0.55
-            center_rect = QRectF(rect.center().x() - center_size/2, 
-                              rect.center().y() - center_size/2,
-                              center_size, center_size)
-            
-            
-            # Draw text with appropriate sizing
-            font_size = int(size * 0.15)
-            count_font = QFont("SF Pro Display, -apple-system, Segoe UI", font_size, QFont.DemiBold)
-            goal_font = QFont("SF Pro Display, -apple-system, Segoe UI", int(font_size * 0.7), QFont.Normal)
-            
-            # Draw count
-            painter.setFont(count_font)
-            painter.setPen(QColor(theme_colors.get('text', "#FFFFFF")))
-            count_rect = center_rect.adjusted(0, -center_size * 0.1, 0, 0)
-            painter.drawText(count_rect, Qt.AlignHCenter | Qt.AlignBottom, f"{self.log_count}")
-            
-            # Draw goal
-            painter.setFont(goal_font)
-            painter.setPen(QColor(theme_colors.get('highlight', "#8E8E93")))
-            goal_rect = center_rect.adjusted(0, center_size * 0.1, 0, 0)
-            painter.drawText(goal_rect, Qt.AlignHCenter | Qt.AlignTop, f"/ {self.daily_goal}")
 
-        '''  
         # ===== Countdown Progress Indicator =====
         if self.countdown_progress > 0:
             # Draw a more subtle countdown indicator
-            countdown_rect = rect.adjusted(
-                main_pen_width * 1.5, 
-                main_pen_width * 1.5, 
-                -main_pen_width * 1.5, 
-                -main_pen_width * 1.5
-            )
-            
-            countdown_pen = QPen(QColor(theme_colors.get('accent', "#EF4565")), countdown_pen_width)
-            countdown_pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(countdown_pen)
-            
-            countdown_extent = int(self.countdown_progress * 360 * 16)  # Convert to integer
-            painter.drawArc(countdown_rect, 90 * 16, -countdown_extent)  # Use correct format
\ No newline at end of file
+            painter.strokePath(
+                self._arc_path(self._countdown_path_cache, self._countdown_rect, self._countdown_steps),
+                self._countdown_pen)
\ No newline at end of file
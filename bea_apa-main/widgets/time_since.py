@@ -4,25 +4,36 @@ import sys
 import datetime
 import time
 import random
-from PyQt5.QtCore import Qt, QTimer, QPointF, QRectF, QEasingCurve, QPropertyAnimation, QPoint
-from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QFont, QFontMetrics, QPainterPath, QPen
+from PyQt5.QtCore import Qt, QTimer, QPointF, QRectF, QRect, QEasingCurve, QPropertyAnimation, QPoint
+from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QFont, QFontMetrics, QPainterPath, QPen, QBrush, QPixmap
 from PyQt5.QtWidgets import QLabel, QApplication, QMenu, QGraphicsOpacityEffect
 
+# Particle opacity is quantized to this many steps for batching
+OPACITY_STEPS = 16
+
 class LoveTimer(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # --- Date Configuration ---
         self.start_time = datetime.datetime(2024, 7, 25, 22, 36, 0)
+        self._start_ts = self.start_time.timestamp()
+        self._last_total = None  # Elapsed seconds last shown
 
         # --- Theme Colors ---
         self.bg_color = QColor(30, 30, 35, 180)  # Dark with transparency
         self.text_color = QColor(255, 255, 255)  # White text
         self.accent_color = QColor(236, 100, 130)  # Soft pink accent
+        self._accent_brushes = []
+        for i in range(OPACITY_STEPS + 1):
+            color = QColor(self.accent_color)
+            color.setAlphaF(i / OPACITY_STEPS)
+            self._accent_brushes.append(QBrush(color))
 
         # --- Layout Settings ---
         self.margin = 15
         self.corner_radius = 12
+        self._bg_pixmap = None  # Background + border, rendered on resize
         self.num_particles = 5  # Subtle particle effect instead of hearts
 
         # --- Font Setup ---
@@ -31,10 +42,13 @@ class LoveTimer(QLabel):
         self.day_font.setWeight(QFont.DemiBold)
         self.setFont(self.font)
 
+        # Font metrics are reused by every paint
+        self._day_metrics = QFontMetrics(self.day_font)
+        self._metrics = QFontMetrics(self.font)
+
         # Compute widget size based on a sample text layout
-        metrics = QFontMetrics(self.day_font)
-        day_text_height = metrics.height()
-        metrics = QFontMetrics(self.font)
+        day_text_height = self._day_metrics.height()
+        metrics = self._metrics
         time_text_height = metrics.height()
         
         sample_text = "000 days"
@@ -44,6 +58,10 @@ class LoveTimer(QLabel):
         height = day_text_height + time_text_height + 40  # add vertical padding
         self.setFixedSize(width, height)
 
+        # Region covered by the HH:MM:SS line (same layout as paintEvent)
+        time_baseline = height // 2 - 5 + day_text_height + 5
+        self._time_rect = QRect(0, time_baseline - metrics.ascent(), width, time_text_height)
+
         # --- Window Setup ---
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
@@ -52,19 +70,28 @@ class LoveTimer(QLabel):
         self.setToolTip("Right-click for menu. Double-click to hide.")
 
         # --- Particle Animation Setup ---
-        self.particles = []
         self.initialize_particles()
 
         # --- Timers ---
         self.time_timer = QTimer(self)
         self.time_timer.timeout.connect(self.update_time)
-        self.time_timer.start(500)
+        self.time_timer.setInterval(1000)  # The display changes once per second
+
+        # Initialize widget values
+        self.days = 0
+        self.hours = 0
+        self.minutes = 0
+        self.seconds = 0
+        self._day_text = "0"
+        self._day_unit = "days"
+        self._time_text = "00:00:00"
         self.update_time()
 
+        # Timers only run while the widget is visible (see showEvent/hideEvent)
         self.last_update_time = time.time()
         self.particle_timer = QTimer(self)
         self.particle_timer.timeout.connect(self.animate_particles)
-        self.particle_timer.start(30)
+        self.particle_timer.setInterval(30)
 
         # --- Fade-in Animation ---
         self.opacity_effect = QGraphicsOpacityEffect(self)
@@ -86,24 +113,21 @@ class LoveTimer(QLabel):
         # --- Track if widget is active ---
         self.is_active = True
 
-        # Initialize widget values
-        self.days = 0
-        self.hours = 0
-        self.minutes = 0
-        self.seconds = 0
-
     def initialize_particles(self):
         """Initialize subtle floating particles"""
-        self.particles = []  # Clear any existing particles
-        for _ in range(self.num_particles):
-            particle = {
-                'pos': QPointF(random.uniform(0, self.width()), random.uniform(0, self.height())),
-                'size': random.uniform(2, 5),
-                'opacity': random.uniform(0.2, 0.6),
-                'speed': random.uniform(5, 20),
-                'direction': random.uniform(0, 2 * 3.14159)
-            }
-            self.particles.append(particle)
+        # Particle state is kept as parallel columns (one entry per particle)
+        n = self.num_particles
+        uniform = random.uniform
+        self.particle_x = [uniform(0, self.width()) for _ in range(n)]
+        self.particle_y = [uniform(0, self.height()) for _ in range(n)]
+        self.particle_size = [uniform(2, 5) for _ in range(n)]
+        self.particle_opacity = [uniform(0.2, 0.6) for _ in range(n)]
+        self.particle_speed = [uniform(5, 20) for _ in range(n)]
+        self.particle_direction = [uniform(0, 2 * 3.14159) for _ in range(n)]
+        # Direction cosines change only on bounce/jitter, so they are cached
+        self.particle_cos = [math.cos(d) for d in self.particle_direction]
+        self.particle_sin = [math.sin(d) for d in self.particle_direction]
+        self._subpixel_accum = 0.0  # Movement since the last particle repaint
 
     def move_to_corner(self):
         """Place the widget in the top-right corner with some padding"""
@@ -118,67 +142,110 @@ class LoveTimer(QLabel):
         dt = current_time - self.last_update_time
         self.last_update_time = current_time
 
-        for particle in self.particles:
-            # Calculate movement vector
-            dx = dt * particle['speed'] * math.cos(particle['direction'])
-            dy = dt * particle['speed'] * math.sin(particle['direction'])
+        # Bind hot lookups once per tick
+        cos, sin = math.cos, math.sin
+        rand, uniform = random.random, random.uniform
+        width, height = self.width(), self.height()
+        xs, ys = self.particle_x, self.particle_y
+        speeds, directions = self.particle_speed, self.particle_direction
+        opacities = self.particle_opacity
+        cosines, sines = self.particle_cos, self.particle_sin
+
+        for i in range(len(xs)):
+            direction = directions[i]
+            step = dt * speeds[i]
             
             # Update position
-            new_x = particle['pos'].x() + dx
-            new_y = particle['pos'].y() + dy
+            new_x = xs[i] + step * cosines[i]
+            new_y = ys[i] + step * sines[i]
+            changed = False
             
             # Bounce off edges
-            if new_x < 0 or new_x > self.width():
-                particle['direction'] = 3.14159 - particle['direction']
-                new_x = max(0, min(new_x, self.width()))
+            if new_x < 0 or new_x > width:
+                direction = 3.14159 - direction
+                new_x = max(0, min(new_x, width))
+                changed = True
             
-            if new_y < 0 or new_y > self.height():
-                particle['direction'] = -particle['direction']
-                new_y = max(0, min(new_y, self.height()))
+            if new_y < 0 or new_y > height:
+                direction = -direction
+                new_y = max(0, min(new_y, height))
+                changed = True
             
             # Occasionally change direction slightly for more natural movement
-            if random.random() < 0.02:
-                particle['direction'] += random.uniform(-0.2, 0.2)
+            if rand() < 0.02:
+                direction += uniform(-0.2, 0.2)
+                changed = True
                 
-            # Apply new position
-            particle['pos'] = QPointF(new_x, new_y)
+            xs[i] = new_x
+            ys[i] = new_y
+            if changed:
+                directions[i] = direction
+                cosines[i] = cos(direction)
+                sines[i] = sin(direction)
             
             # Slowly change opacity for subtle fading effect
-            particle['opacity'] += random.uniform(-0.01, 0.01)
-            particle['opacity'] = max(0.1, min(0.7, particle['opacity']))
+            opacities[i] = max(0.1, min(0.7, opacities[i] + uniform(-0.01, 0.01)))
 
-        self.update()
+        # Only repaint once the fastest particle has moved at least a pixel
+        self._subpixel_accum += dt * max(speeds, default=0)
+        if self._subpixel_accum >= 1.0:
+            self._subpixel_accum = 0.0
+            self.update()
 
     def update_time(self):
         """Update the display with the elapsed time since start_time"""
-        now = datetime.datetime.now()
-        diff = now - self.start_time
-        days = diff.days
-        hours, remainder = divmod(diff.seconds, 3600)
+        total = int(time.time() - self._start_ts)
+        if total == self._last_total:
+            return
+        self._last_total = total
+        days, remainder = divmod(total, 86400)
+        # Like timedelta, only the day count goes negative if start_time is in the future
+        days = abs(days)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
         
+        # Only the time line changes unless the day count rolls over
+        days_changed = days != self.days
+        
         # We'll use paintEvent to render this more beautifully
-        self.days = abs(days)
-        self.hours = abs(hours)
-        self.minutes = abs(minutes)
-        self.seconds = abs(seconds)
-        self.update()
+        self.days = days
+        self.hours = hours
+        self.minutes = minutes
+        self.seconds = seconds
+        
+        # Format once per change; paintEvent just draws these
+        self._time_text = f"{hours:02}:{minutes:02}:{seconds:02}"
+        if days_changed:
+            self._day_text = f"{days}"
+            self._day_unit = "days" if days != 1 else "day"
+            self.update()
+        else:
+            self.update(self._time_rect)
 
-    def mouseDoubleClickEvent(self, event):
-        # Modified to hide instead of close
-        self.start_fade_out()
+    def _start_time_timer(self):
+        """Start the once-per-second timer, aligned to a second boundary"""
+        if self.isVisible():
+            self.update_time()
+            self.time_timer.start()
 
-    def hide_widget(self):
-        """Hide the widget without destroying it"""
-        self.is_active = False
-        self.hide()
-        # Stopping timers when hidden to save resources
+    def showEvent(self, event):
+        """Start the timers whenever the widget becomes visible"""
+        super().showEvent(event)
+        self.last_update_time = time.time()
+        self.update_time()
+        # Fire on the next wall-clock second so ticks line up with the display
+        QTimer.singleShot(1000 - int(time.time() * 1000) % 1000, self._start_time_timer)
+        self.particle_timer.start()
+
+    def hideEvent(self, event):
+        """Stop the timers while hidden to save resources"""
+        super().hideEvent(event)
         self.time_timer.stop()
         self.particle_timer.stop()
-        
-        # Signal that the fade-out has completed (for parent window tracking)
-        if hasattr(self, 'fade_out_finished') and callable(self.fade_out_finished):
-            self.fade_out_finished()
+
+    def mouseDoubleClickEvent(self, event):
+        # Modified to hide instead of close
+        self.start_fade_out()
 
     def show_widget(self):
         """Show the widget and restart necessary timers"""
@@ -197,17 +264,9 @@ class LoveTimer(QLabel):
         # Reset the opacity for fade-in
         self.opacity_effect.setOpacity(0)
         
-        # Make widget visible first (before animation)
+        # Make widget visible first (before animation); showEvent restarts the timers
         self.show()
         
-        # Restart timers
-        self.last_update_time = time.time()
-        self.time_timer.start(500)
-        self.particle_timer.start(30)
-        
-        # Update time immediately
-        self.update_time()
-        
         # Reinitialize particles in case they're in a bad state
         self.initialize_particles()
         
@@ -233,11 +292,7 @@ class LoveTimer(QLabel):
             return
             
         self.is_active = False
-        self.hide()
-        
-        # Stopping timers when hidden to save resources
-        self.time_timer.stop()
-        self.particle_timer.stop()
+        self.hide()  # hideEvent stops the timers
         
         # Signal that the fade-out has completed (for parent window tracking)
         if hasattr(self, 'fade_out_finished') and callable(self.fade_out_finished):
@@ -301,40 +356,62 @@ class LoveTimer(QLabel):
         if event.button() == Qt.LeftButton:
             self.dragging = False
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._render_background()
 
+    def _render_background(self):
+        """Render the static rounded background and border into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        self._bg_pixmap = QPixmap(self.size() * dpr)
+        self._bg_pixmap.setDevicePixelRatio(dpr)
+        self._bg_pixmap.fill(Qt.transparent)
+        
+        p = QPainter(self._bg_pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        
         # Draw background with subtle rounded corners
         rect = QRectF(0, 0, self.width(), self.height())
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(self.bg_color)
-        painter.drawRoundedRect(rect, self.corner_radius, self.corner_radius)
+        p.setPen(Qt.NoPen)
+        p.setBrush(self.bg_color)
+        p.drawRoundedRect(rect, self.corner_radius, self.corner_radius)
         
         # Draw subtle border
-        painter.setPen(QPen(QColor(255, 255, 255, 30), 1))
-        painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), self.corner_radius, self.corner_radius)
+        p.setPen(QPen(QColor(255, 255, 255, 30), 1))
+        p.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), self.corner_radius, self.corner_radius)
+        p.end()
 
-        # Draw animated particles
-        for particle in self.particles:
-            painter.save()
-            color = QColor(self.accent_color)
-            color.setAlphaF(particle['opacity'])
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(particle['pos'], particle['size'], particle['size'])
-            painter.restore()
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Background and border only change on resize
+        if self._bg_pixmap is None:
+            self._render_background()
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
+        # Draw animated particles, batched into one path per opacity bucket
+        particle_paths = {}
+        for x, y, particle_size, opacity in zip(self.particle_x, self.particle_y,
+                                                self.particle_size, self.particle_opacity):
+            bucket = int(opacity * OPACITY_STEPS)
+            path = particle_paths.get(bucket)
+            if path is None:
+                path = particle_paths[bucket] = QPainterPath()
+                path.setFillRule(Qt.WindingFill)  # Overlapping particles must not cancel out
+            path.addEllipse(QPointF(x, y), particle_size, particle_size)
+        for bucket, path in particle_paths.items():
+            painter.fillPath(path, self._accent_brushes[bucket])
 
         # Draw days counter with emphasis
-        day_text = f"{self.days}"
-        day_unit = "days" if self.days != 1 else "day"
+        day_text = self._day_text
+        day_unit = self._day_unit
         
         # Days count
         painter.setFont(self.day_font)
         painter.setPen(self.accent_color)
         
-        day_metrics = QFontMetrics(self.day_font)
-        day_rect = day_metrics.boundingRect(day_text)
+        day_metrics = self._day_metrics
         day_x = (self.width() - day_metrics.horizontalAdvance(day_text) - 
                  day_metrics.horizontalAdvance(" " + day_unit)) // 2
         day_y = self.height() // 2 - 5
@@ -347,9 +424,9 @@ class LoveTimer(QLabel):
         painter.drawText(unit_x, day_y, day_unit)
         
         # Time counter below
-        time_text = f"{self.hours:02}:{self.minutes:02}:{self.seconds:02}"
+        time_text = self._time_text
         painter.setPen(self.text_color)
-        time_metrics = QFontMetrics(self.font)
+        time_metrics = self._metrics
         time_width = time_metrics.horizontalAdvance(time_text)
         painter.drawText((self.width() - time_width) // 2, day_y + day_metrics.height() + 5, time_text)
 
@@ -1,6 +1,27 @@
 from PyQt5.QtCore import Qt, QRectF, QPropertyAnimation, QPoint, QEasingCurve, QTimer
-from PyQt5.QtGui import QPainter, QColor, QPainterPath, QFont, QFontDatabase
-from PyQt5.QtWidgets import QLabel, QGraphicsDropShadowEffect
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontDatabase, QPixmap
+from PyQt5.QtWidgets import QLabel
+
+# Room around the toast for the pre-rendered drop shadow
+SHADOW_MARGIN = 14
+SHADOW_OFFSET = 4
+
+# Shared by every toast; built on first use since fonts need a running QApplication
+_toast_font = None
+
+
+def _get_toast_font():
+    """Return the toast font, registering SF Pro Text only once per process"""
+    global _toast_font
+    if _toast_font is None:
+        # Try to use SF Pro Text (Apple's system font) if available, otherwise fallback
+        font_id = QFontDatabase.addApplicationFont(":/fonts/SF-Pro-Text-Regular.otf")
+        font_family = "SF Pro Text" if font_id != -1 else "system-ui"
+        
+        # Create font object with proper weight
+        _toast_font = QFont(font_family, 14)
+        _toast_font.setWeight(QFont.Medium)
+    return _toast_font
 
 class ToastLabel(QLabel):
     def __init__(self, text, parent=None, theme=None, duration=3000):
@@ -28,14 +49,7 @@ class ToastLabel(QLabel):
         self.setAttribute(Qt.WA_StyledBackground, True)
         self.setAlignment(Qt.AlignCenter)
         
-        # Try to use SF Pro Text (Apple's system font) if available, otherwise fallback
-        font_id = QFontDatabase.addApplicationFont(":/fonts/SF-Pro-Text-Regular.otf")
-        font_family = "SF Pro Text" if font_id != -1 else "system-ui"
-        
-        # Create font object with proper weight
-        font = QFont(font_family, 14)
-        font.setWeight(QFont.Medium)
-        self.setFont(font)
+        self.setFont(_get_toast_font())
         
         # Apply styling
         text_color = self.theme.get("text", "#FFFFFF")
@@ -46,28 +60,35 @@ class ToastLabel(QLabel):
             }}
         """)
         
-        # Apply shadow effect for depth
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setColor(QColor(self.theme.get("shadow", "#000000")))
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        # QGraphicsDropShadowEffect doesn't have setOpacity - fixed
-        # Control opacity through the shadow color's alpha value
-        shadow_color = QColor(self.theme.get("shadow", "#000000"))
-        shadow_color.setAlpha(50)  # 0-255 range, 50 is ~20% opacity
-        shadow.setColor(shadow_color)
-        self.setGraphicsEffect(shadow)
-        
-        # Set up animations for elegant appearance
+        # Shadow for depth is painted from a pixmap rendered once per size, which is
+        # far cheaper than a QGraphicsDropShadowEffect re-blurring every animation frame
+        self.setContentsMargins(SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN)
+        self._shadow_color = QColor(self.theme.get("shadow", "#000000"))
+        self._shadow_pixmap = None
+        
+        # One animation serves both showing and hiding; only hiding ends in hide()
         self.animation = QPropertyAnimation(self, b"pos")
         self.animation.setEasingCurve(QEasingCurve.OutCubic)
         self.animation.setDuration(300)  # Animation duration (ms)
+        self._hide_connected = False
         
         # Store duration for auto-hide
         self.duration = duration
         
         # Flag to control blur effect
         self.is_dark_mode = self.theme.get("is_dark", True)
+        
+        # Paint resources are fixed for the toast's lifetime; the path is rebuilt on resize
+        # Apple's notifications use blur + semi-transparency
+        if self.is_dark_mode:
+            # Dark mode: darker, more transparent
+            self._bg_color = QColor(20, 20, 25, 235)
+            self._border_color = QColor(255, 255, 255, 30)
+        else:
+            # Light mode: lighter, less transparent
+            self._bg_color = QColor(245, 245, 247, 235)
+            self._border_color = QColor(0, 0, 0, 15)
+        self._bg_rect = None
     
     def showEvent(self, event):
         """Handle appearance animation when toast is shown"""
@@ -77,13 +98,17 @@ class ToastLabel(QLabel):
             # Calculate starting and ending positions
             parent_rect = self.parent().rect()
             target_x = (parent_rect.width() - self.width()) // 2
-            target_y = parent_rect.height() - self.height() - 60  # 60px from bottom
+            target_y = parent_rect.height() - self.height() + SHADOW_MARGIN - 60  # 60px from bottom
             
             # Start from below the visible area
             start_pos = QPoint(target_x, parent_rect.height() + 20)
             end_pos = QPoint(target_x, target_y)
             
             # Set up and start the animation
+            self._disconnect_hide()
+            self.animation.stop()
+            self.animation.setEasingCurve(QEasingCurve.OutCubic)
+            self.animation.setDuration(300)
             self.move(start_pos)
             self.animation.setStartValue(start_pos)
             self.animation.setEndValue(end_pos)
@@ -98,10 +123,10 @@ class ToastLabel(QLabel):
         if not self.isVisible():
             return
             
-        # Create hide animation
-        hide_anim = QPropertyAnimation(self, b"pos")
-        hide_anim.setEasingCurve(QEasingCurve.InCubic)
-        hide_anim.setDuration(250)  # Faster than show animation
+        # Reuse the show animation for hiding
+        self.animation.stop()
+        self.animation.setEasingCurve(QEasingCurve.InCubic)
+        self.animation.setDuration(250)  # Faster than show animation
         
         # Calculate end position (below screen)
         current_pos = self.pos()
@@ -110,40 +135,73 @@ class ToastLabel(QLabel):
         else:
             end_pos = QPoint(current_pos.x(), current_pos.y() + 100)
             
-        hide_anim.setStartValue(current_pos)
-        hide_anim.setEndValue(end_pos)
+        self.animation.setStartValue(current_pos)
+        self.animation.setEndValue(end_pos)
         
         # Connect the finished signal to actually hide the widget
-        hide_anim.finished.connect(self.hide)
-        hide_anim.start()
+        if not self._hide_connected:
+            self.animation.finished.connect(self.hide)
+            self._hide_connected = True
+        self.animation.start()
+    
+    def _disconnect_hide(self):
+        """Stop the animation's finished signal from hiding the toast"""
+        if self._hide_connected:
+            self.animation.finished.disconnect(self.hide)
+            self._hide_connected = False
+    
+    def resizeEvent(self, event):
+        """Drop the cached background rect and shadow when the size changes"""
+        super().resizeEvent(event)
+        self._bg_rect = None
+        self._shadow_pixmap = None
+    
+    def _render_shadow(self, rect):
+        """Render a soft shadow under rect by stacking faint, growing rounded rects"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        spread = SHADOW_MARGIN - SHADOW_OFFSET
+        layer_color = QColor(self._shadow_color)
+        layer_color.setAlpha(50 // spread)  # Layers add up to ~20% opacity at the center
+        p.setBrush(layer_color)
+        shadow_rect = rect.translated(0, SHADOW_OFFSET)
+        for i in range(spread, 0, -1):
+            p.drawRoundedRect(shadow_rect.adjusted(-i, -i, i, i), 14 + i, 14 + i)
+        p.end()
+        return pixmap
     
     def paintEvent(self, event):
         """Custom paint event to draw the toast background"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Create rounded rect for the toast
-        rect = QRectF(0, 0, self.width(), self.height())
-        path = QPainterPath()
-        path.addRoundedRect(rect, 14, 14)  # Apple uses more subtle rounding
-        
-        # Fill with background color based on theme
-        # Apple's notifications use blur + semi-transparency
-        if self.is_dark_mode:
-            # Dark mode: darker, more transparent
-            background_color = QColor(20, 20, 25, 235)
-        else:
-            # Light mode: lighter, less transparent
-            background_color = QColor(245, 245, 247, 235)
+        # Toast rect (inside the shadow margin) and its shadow are computed once per size
+        if self._bg_rect is None:
+            self._bg_rect = QRectF(self.rect().adjusted(SHADOW_MARGIN, SHADOW_MARGIN,
+                                                        -SHADOW_MARGIN, -SHADOW_MARGIN))
+            self._shadow_pixmap = self._render_shadow(self._bg_rect)
+        
+        painter.drawPixmap(0, 0, self._shadow_pixmap)
+        
+        # Exposes that stay within the shadow margin don't need the toast body
+        if self._bg_rect.intersects(QRectF(event.rect())):
+            # For a frosted glass effect, we would use a blur effect
+            # But since that's complex in Qt, we simulate with transparency
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._bg_color)
+            painter.drawRoundedRect(self._bg_rect, 14, 14)  # Apple uses more subtle rounding
             
-        # For a frosted glass effect, we would use a blur effect
-        # But since that's complex in Qt, we simulate with transparency
-        painter.fillPath(path, background_color)
-        
-        # Draw subtle border for definition (Apple uses this in macOS)
-        border_color = QColor(255, 255, 255, 30) if self.is_dark_mode else QColor(0, 0, 0, 15)
-        painter.setPen(border_color)
-        painter.drawPath(path)
+            # Draw subtle border for definition (Apple uses this in macOS)
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(self._border_color)
+            painter.drawRoundedRect(self._bg_rect, 14, 14)
+        painter.end()
         
         # Now let the label draw its text content
         super().paintEvent(event)
\ No newline at end of file
@@ -1,21 +1,30 @@
 import os
 import json
-import random
-from datetime import datetime, timedelta, time
+import calendar
+import copy
+import itertools
+import re
+import string
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
+from datetime import date, datetime, timedelta, time
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QLineEdit, QDialog, QListWidget, QListWidgetItem, QSpinBox,
-    QGraphicsDropShadowEffect, QComboBox, QDateEdit, QTimeEdit,
+    QLineEdit, QPlainTextEdit, QDialog, QListWidget, QListWidgetItem, QSpinBox,
+    QComboBox, QDateTimeEdit, QTimeEdit,
     QMessageBox, QSizePolicy, QFrame, QScrollArea, QMenu,
     QAction, QApplication, QCheckBox, QToolTip, QCompleter
 )
 from PyQt5.QtGui import (
     QIcon, QColor, QPainter, QPen, QBrush, QPainterPath, 
-    QLinearGradient, QFont, QCursor, QFontMetrics
+    QLinearGradient, QFont, QCursor, QFontMetrics, QPixmap
 )
 from PyQt5.QtCore import (
-    Qt, QSize, pyqtSignal, QDate, QTimer, QPropertyAnimation,
-    QEasingCurve, QRectF, QPoint, QStringListModel, QTime
+    Qt, QSize, pyqtSignal, QDate, QDateTime, QTimer, QPropertyAnimation,
+    QEasingCurve, QRectF, QPoint, QStringListModel, QTime, QSignalBlocker,
+    QRunnable, QThreadPool
 )
 from config import MODERN_COLORS
 from utils import resource_path
@@ -24,15 +33,94 @@ from utils import resource_path
 # Todo Item Classes
 # ======================================================
 
+# Check button colors by priority, built once instead of on every paint
+PRIORITY_COLORS = {
+    "High": QColor("#FF453A"),    # Red
+    "Medium": QColor("#FF9F0A"),  # Orange
+    "Low": QColor("#30D158")      # Green
+}
+DEFAULT_PRIORITY_COLOR = QColor("#0A84FF")  # Blue
+
+# Fixed combo box choices and their indexes, so selection needs no text search
+PRIORITY_OPTIONS = ["High", "Medium", "Low"]
+PRIORITY_INDEX = {name: i for i, name in enumerate(PRIORITY_OPTIONS)}
+REPEAT_OPTIONS = ["None", "Daily", "Weekly", "Monthly"]
+REPEAT_INDEX = {name: i for i, name in enumerate(REPEAT_OPTIONS)}
+
+# Comma-separated tags with surrounding whitespace trimmed, in one scan
+TAG_SPLIT_RE = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
+
+# Quick-add markers (#tag, @deadline keyword, trailing !/!!/!!! priority), found in one pass
+QUICK_ADD_RE = re.compile(
+    r"(?<!\S)#(?P<tag>[^\s!]+)|@(?P<deadline>today|tomorrow|nextweek)\b|(?P<priority>!{1,3})\s*$",
+    re.IGNORECASE
+)
+QUICK_ADD_PRIORITIES = {"!!!": "High", "!!": "Medium", "!": "Low"}
+QUICK_ADD_DEADLINE_DAYS = {"today": 0, "tomorrow": 1, "nextweek": 7}
+
+# Stats bucket for todos without a category
+UNCATEGORIZED = "Uncategorized"
+
+# Source of ids for new todos; kept above every id seen so far
+_id_counter = itertools.count(1)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(text):
+    """Parse a stored ISO timestamp; the same deadline/completion strings are parsed repeatedly"""
+    return datetime.fromisoformat(text)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_date(text):
+    """Parse just the date of a stored ISO timestamp, skipping the time fields"""
+    return date.fromisoformat(text[:10])
+
+
+@lru_cache(maxsize=256)
+def parse_reminder_time(text):
+    """Parse an HH:MM reminder time; checked for every todo once a minute"""
+    return datetime.strptime(text, "%H:%M").time()
+
+
+def next_month_on_day(from_date, day):
+    """Date in the month after from_date on the given day, clamped to that month's length"""
+    year, month_index = divmod(from_date.year * 12 + from_date.month, 12)
+    month = month_index + 1
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def _reserve_id(todo_id):
+    """Make sure ids handed out later never collide with an existing todo_id"""
+    global _id_counter
+    try:
+        todo_id = int(todo_id)
+    except (TypeError, ValueError):
+        return  # Non-numeric ids from older saves can't collide with the counter's ints
+    next_id = next(_id_counter)
+    _id_counter = itertools.count(max(next_id, todo_id + 1))
+
+
 class TodoItem:
     """Model class for a todo item"""
+    # No per-instance __dict__: lists can hold many todos and these are all the fields
+    __slots__ = (
+        "id", "text", "completed", "priority", "tags", "category", "description",
+        "created_at", "_completed_at", "completed_date", "_deadline", "deadline_dt",
+        "reminder_time", "repeat_option"
+    )
+    
     def __init__(self, text="", deadline=None, priority="Medium", 
                  tags=None, completed=False, created_at=None,
                  completed_at=None, id=None, category=None,
                  description="", reminder_time=None, repeat_option=None):
         
         # Core properties
-        self.id = id or random.randint(10000, 99999)
+        if id is None:
+            id = next(_id_counter)
+        else:
+            _reserve_id(id)
+        self.id = id
         self.text = text
         self.completed = completed
         self.priority = priority  # "High", "Medium", "Low"
@@ -93,55 +181,167 @@ class TodoItem:
             self.completed_at = None
         return self.completed
     
-    def is_overdue(self):
-        """Check if the task is overdue but not completed"""
-        if not self.deadline or self.completed:
-            return False
-        
+    @property
+    def completed_at(self):
+        return self._completed_at
+    
+    @completed_at.setter
+    def completed_at(self, value):
+        """Store the completion timestamp and parse its date once for the stats"""
+        self._completed_at = value
         try:
-            deadline_dt = datetime.fromisoformat(self.deadline)
-            return deadline_dt < datetime.now()
+            self.completed_date = parse_iso_date(value) if value else None
         except (ValueError, TypeError):
-            return False
+            self.completed_date = None
     
-    def days_until_deadline(self):
-        """Get days until deadline (negative if overdue)"""
-        if not self.deadline:
-            return None
-        
+    @property
+    def deadline(self):
+        return self._deadline
+    
+    @deadline.setter
+    def deadline(self, value):
+        """Store the deadline string and parse it once for the date checks below"""
+        self._deadline = value
         try:
-            deadline_dt = datetime.fromisoformat(self.deadline)
-            days = (deadline_dt.date() - datetime.now().date()).days
-            return days
+            deadline_dt = parse_iso_datetime(value) if value else None
         except (ValueError, TypeError):
+            deadline_dt = None
+        if deadline_dt is not None and deadline_dt.tzinfo is not None:
+            # Hand-edited offsets become local naive time, so comparisons with now() can't raise
+            deadline_dt = deadline_dt.astimezone().replace(tzinfo=None)
+        self.deadline_dt = deadline_dt
+    
+    def is_overdue(self, now=None):
+        """Check if the task is overdue but not completed; pass now when checking many todos"""
+        if self.deadline_dt is None or self.completed:
+            return False
+        return self.deadline_dt < (now or datetime.now())
+    
+    def days_until_deadline(self, today=None):
+        """Get days until deadline (negative if overdue)"""
+        if self.deadline_dt is None:
             return None
+        return (self.deadline_dt.date() - (today or date.today())).days
     
-    def should_remind(self):
-        """Check if a reminder should be sent based on reminder_time"""
+    def should_remind(self, now=None):
+        """Check if a reminder should be sent based on reminder_time; pass now when checking many todos"""
         if not self.reminder_time or self.completed:
             return False
+        # A deadline that didn't parse never has a deadline day to remind on
+        if self.deadline and self.deadline_dt is None:
+            return False
         
+        now = now or datetime.now()
         try:
             # Only check date part if deadline exists
-            if self.deadline:
-                deadline_dt = datetime.fromisoformat(self.deadline)
-                today = datetime.now().date()
+            if self.deadline_dt is not None:
                 # Only remind on the deadline day
-                if deadline_dt.date() != today:
+                if self.deadline_dt.date() != now.date():
                     return False
             
             # Check if current time is past the reminder time
-            reminder_time = datetime.strptime(self.reminder_time, "%H:%M").time()
-            now = datetime.now().time()
+            reminder_time = parse_reminder_time(self.reminder_time)
             
             # Allow a 5-minute window for the reminder
-            five_min_ago = (datetime.now() - timedelta(minutes=5)).time()
+            five_min_ago = (now - timedelta(minutes=5)).time()
             
-            return five_min_ago <= reminder_time <= now
+            return five_min_ago <= reminder_time <= now.time()
         except (ValueError, TypeError):
             return False
 
 
+@lru_cache(maxsize=64)
+def cached_icon(path):
+    """Load an icon from the assets once per process and share it"""
+    return QIcon(resource_path(path))
+
+
+@lru_cache(maxsize=256)
+def elided_tags_text(text, width=200):
+    """Elide a row's tag summary to width pixels; rows often repeat the same tags"""
+    # Matches the 12px tagsLabel rule in todo_item_stylesheet
+    font = QFont(QApplication.font())
+    font.setPixelSize(12)
+    return QFontMetrics(font).elidedText(text, Qt.ElideRight, width)
+
+
+def todo_item_stylesheet(colors):
+    """Rules for every TodoItemWidget state; applied once by the containing list"""
+    text_color = colors.get('text', '#FFFFFF')
+    surface_color = colors.get('surface', '#2C2C2E')
+    muted_color = colors.get('text_secondary', '#98989E')
+    overdue_color = colors.get('accent', '#FF453A')
+    priority_high = "#FF453A"  # Red
+    priority_medium = "#FF9F0A"  # Orange
+    priority_low = "#30D158"  # Green
+    
+    # Different background for completed and normal tasks
+    completed_bg = QColor(surface_color).lighter(110).name() if '#' in surface_color else surface_color
+    normal_bg = surface_color
+    overdue_bg = QColor(surface_color).darker(110).name() if '#' in surface_color else surface_color
+    
+    return f"""
+        #todoCard {{
+            background-color: {normal_bg};
+            border-radius: 10px;
+            border-left: 3px solid transparent;
+        }}
+        #todoCardCompleted {{
+            background-color: {completed_bg};
+            border-radius: 10px;
+            border-left: 3px solid {priority_low};
+        }}
+        #todoCardOverdue {{
+            background-color: {overdue_bg};
+            border-radius: 10px;
+            border-left: 3px solid {priority_high};
+        }}
+        #todoText {{
+            color: {text_color};
+            font-size: 15px;
+        }}
+        #todoTextCompleted {{
+            color: {muted_color};
+            font-size: 15px;
+            text-decoration: line-through;
+        }}
+        #editButton, #deleteButton {{
+            background: transparent;
+            border: none;
+            border-radius: 12px;
+        }}
+        #editButton:hover, #deleteButton:hover {{
+            background-color: rgba(120, 120, 120, 0.2);
+        }}
+        #deadlineLabel {{
+            color: {muted_color};
+            font-size: 12px;
+        }}
+        #deadlineOverdue {{
+            color: {overdue_color};
+            font-size: 12px;
+            font-weight: bold;
+        }}
+        #tagsLabel {{
+            color: {muted_color};
+            font-size: 12px;
+        }}
+        #priorityHigh {{
+            color: {priority_high};
+            font-size: 12px;
+            font-weight: bold;
+        }}
+        #priorityMedium {{
+            color: {priority_medium};
+            font-size: 12px;
+        }}
+        #priorityLow {{
+            color: {priority_low};
+            font-size: 12px;
+        }}
+    """
+
+
 class PriorityCheckButton(QPushButton):
     """Custom check button with priority colors"""
     def __init__(self, priority="Medium", theme="dark v2", parent=None):
@@ -153,6 +353,18 @@ class PriorityCheckButton(QPushButton):
         self.setCheckable(True)
         self.setStyleSheet("border: none; background: transparent;")
         self.setCursor(Qt.PointingHandCursor)
+        
+        # The size is fixed, so the circle and checkmark geometry never change
+        rect = self.rect().adjusted(4, 4, -4, -4)
+        self._radius = rect.width() / 2
+        self._center = rect.center()
+        scale = rect.width() / 24.0  # Scale checkmark based on button size
+        cx, cy = self._center.x(), self._center.y()
+        self._checkmark_path = QPainterPath()
+        self._checkmark_path.moveTo(cx - 5 * scale, cy)
+        self._checkmark_path.lineTo(cx - 1 * scale, cy + 4 * scale)
+        self._checkmark_path.lineTo(cx + 6 * scale, cy - 4 * scale)
+        self._checkmark_pen = QPen(Qt.white, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
     
     def setPriority(self, priority):
         self.priority = priority
@@ -161,18 +373,10 @@ class PriorityCheckButton(QPushButton):
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        rect = self.rect().adjusted(4, 4, -4, -4)
-        radius = rect.width() / 2
-        center = rect.center()
-        
-        # Priority colors
-        priority_colors = {
-            "High": QColor("#FF453A"),    # Red
-            "Medium": QColor("#FF9F0A"),  # Orange
-            "Low": QColor("#30D158")      # Green
-        }
+        radius = self._radius
+        center = self._center
         
-        color = priority_colors.get(self.priority, QColor("#0A84FF"))  # Default to blue
+        color = PRIORITY_COLORS.get(self.priority, DEFAULT_PRIORITY_COLOR)
         
         # Hover effect
         if self.underMouse() and not self.isChecked():
@@ -187,14 +391,8 @@ class PriorityCheckButton(QPushButton):
             painter.drawEllipse(center, radius, radius)
             
             # Draw checkmark
-            painter.setPen(QPen(Qt.white, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-            checkmark = QPainterPath()
-            # Scale checkmark based on button size
-            scale = rect.width() / 24.0
-            checkmark.moveTo(center.x() - 5 * scale, center.y())
-            checkmark.lineTo(center.x() - 1 * scale, center.y() + 4 * scale)
-            checkmark.lineTo(center.x() + 6 * scale, center.y() - 4 * scale)
-            painter.drawPath(checkmark)
+            painter.setPen(self._checkmark_pen)
+            painter.drawPath(self._checkmark_path)
         else:
             # Draw empty circle
             painter.setBrush(Qt.NoBrush)
@@ -202,6 +400,16 @@ class PriorityCheckButton(QPushButton):
             painter.drawEllipse(center, radius, radius)
 
 
+class ClickableLabel(QLabel):
+    """Label that emits clicked on a left mouse press"""
+    clicked = pyqtSignal()
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
+
 class TodoItemWidget(QWidget):
     """Widget to display a single todo item in the list"""
     # Signals
@@ -210,6 +418,9 @@ class TodoItemWidget(QWidget):
     edited = pyqtSignal(int, object)  # id, updated_todo
     details_requested = pyqtSignal(int)  # id
     
+    # Card shadow gradient shared by every row
+    _shadow_strip = None
+    
     def __init__(self, todo_item, theme="dark v2", parent=None):
         super().__init__(parent)
         self.todo = todo_item
@@ -252,62 +463,17 @@ class TodoItemWidget(QWidget):
         content_layout.setSpacing(4)
         
         # Task text (clickable for details)
-        self.text_label = QLabel(self.todo.text)
+        self.text_label = ClickableLabel(self.todo.text)
         self.text_label.setObjectName("todoText")
         self.text_label.setCursor(Qt.PointingHandCursor)
         self.text_label.setWordWrap(True)
-        self.text_label.mousePressEvent = lambda e: self.details_requested.emit(self.todo.id) if e.button() == Qt.LeftButton else None
+        self.text_label.clicked.connect(self.request_edit)
         content_layout.addWidget(self.text_label)
         
-        # Deadline and tags row (in smaller text)
-        if self.todo.deadline or self.todo.tags:
-            info_row = QHBoxLayout()
-            info_row.setSpacing(8)
-            
-            # Show deadline if exists
-            if self.todo.deadline:
-                try:
-                    from datetime import datetime
-                    deadline_dt = datetime.fromisoformat(self.todo.deadline)
-                    days_left = (deadline_dt.date() - datetime.now().date()).days
-                    
-                    deadline_text = deadline_dt.strftime("%b %d")
-                    if days_left == 0:
-                        deadline_text = f"Today, {deadline_dt.strftime('%H:%M')}"
-                    elif days_left == 1:
-                        deadline_text = f"Tomorrow, {deadline_dt.strftime('%H:%M')}"
-                    elif days_left == -1:
-                        deadline_text = "Yesterday"
-                    elif days_left < -1:
-                        deadline_text = f"{abs(days_left)} days overdue"
-                    elif days_left > 0:
-                        deadline_text = f"{deadline_text} ({days_left} days)"
-                    
-                    self.deadline_label = QLabel(deadline_text)
-                    self.deadline_label.setObjectName(
-                        "deadlineOverdue" if days_left < 0 and not self.todo.completed else "deadlineLabel"
-                    )
-                    info_row.addWidget(self.deadline_label)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Show priority
-            priority_label = QLabel(self.todo.priority)
-            priority_label.setObjectName(f"priority{self.todo.priority}")
-            info_row.addWidget(priority_label)
-            
-            # Add tags if they exist
-            if self.todo.tags:
-                tags_text = ", ".join(self.todo.tags[:2])  # Show first 2 tags
-                if len(self.todo.tags) > 2:
-                    tags_text += "..."
-                tags_label = QLabel(tags_text)
-                tags_label.setObjectName("tagsLabel")
-                info_row.addWidget(tags_label)
-            
-            # Add info row to content
-            info_row.addStretch(1)
-            content_layout.addLayout(info_row)
+        # Deadline/priority/tags row
+        self.content_layout = content_layout
+        self.info_row = None
+        self.build_info_row()
         
         top_row.addLayout(content_layout, 1)
         
@@ -318,7 +484,7 @@ class TodoItemWidget(QWidget):
         # Edit button
         self.edit_btn = QPushButton()
         self.edit_btn.setObjectName("editButton")
-        self.edit_btn.setIcon(QIcon(resource_path("assets/icons/edit.svg")))
+        self.edit_btn.setIcon(cached_icon("assets/icons/edit.svg"))
         self.edit_btn.setFixedSize(24, 24)
         self.edit_btn.setCursor(Qt.PointingHandCursor)
         self.edit_btn.clicked.connect(self.request_edit)
@@ -327,7 +493,7 @@ class TodoItemWidget(QWidget):
         # Delete button
         self.delete_btn = QPushButton()
         self.delete_btn.setObjectName("deleteButton")
-        self.delete_btn.setIcon(QIcon(resource_path("assets/icons/delete.svg")))
+        self.delete_btn.setIcon(cached_icon("assets/icons/delete.svg"))
         self.delete_btn.setFixedSize(24, 24)
         self.delete_btn.setCursor(Qt.PointingHandCursor)
         self.delete_btn.clicked.connect(lambda: self.deleted.emit(self.todo.id))
@@ -338,19 +504,103 @@ class TodoItemWidget(QWidget):
         # Add main content to card
         card_layout.addLayout(top_row)
         
-        # Add card to main layout
+        # Add card to main layout; its shadow is painted by paintEvent
         main_layout.addWidget(self.card)
+    
+    def build_info_row(self):
+        """Add the deadline, priority and tag labels under the task text"""
+        # Deadline and tags row (in smaller text)
+        if not (self.todo.deadline or self.todo.tags):
+            return
         
-        # Apply card shadow effect
-        self.apply_shadow()
+        info_row = QHBoxLayout()
+        info_row.setSpacing(8)
+        
+        # Show deadline if exists (already parsed by the model)
+        deadline_dt = self.todo.deadline_dt
+        if deadline_dt is not None:
+            days_left = self.todo.days_until_deadline()
+            
+            deadline_text = deadline_dt.strftime("%b %d")
+            if days_left == 0:
+                deadline_text = f"Today, {deadline_dt.strftime('%H:%M')}"
+            elif days_left == 1:
+                deadline_text = f"Tomorrow, {deadline_dt.strftime('%H:%M')}"
+            elif days_left == -1:
+                deadline_text = "Yesterday"
+            elif days_left < -1:
+                deadline_text = f"{abs(days_left)} days overdue"
+            elif days_left > 0:
+                deadline_text = f"{deadline_text} ({days_left} days)"
+            
+            self.deadline_label = QLabel(deadline_text)
+            self.deadline_label.setObjectName(
+                "deadlineOverdue" if days_left < 0 and not self.todo.completed else "deadlineLabel"
+            )
+            info_row.addWidget(self.deadline_label)
+        
+        # Show priority
+        priority_label = QLabel(self.todo.priority)
+        priority_label.setObjectName(f"priority{self.todo.priority}")
+        info_row.addWidget(priority_label)
+        
+        # Add tags if they exist
+        if self.todo.tags:
+            tags_text = ", ".join(self.todo.tags[:2])  # Show first 2 tags
+            if len(self.todo.tags) > 2:
+                tags_text += "..."
+            tags_label = QLabel(elided_tags_text(tags_text))
+            tags_label.setObjectName("tagsLabel")
+            info_row.addWidget(tags_label)
+        
+        # Add info row to content
+        info_row.addStretch(1)
+        self.content_layout.addLayout(info_row)
+        self.info_row = info_row
     
-    def apply_shadow(self):
-        """Apply shadow effect to the card"""
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setBlurRadius(10)
-        shadow.setOffset(0, 2)
-        self.card.setGraphicsEffect(shadow)
+    def clear_info_row(self):
+        """Remove the info row so it can be rebuilt for changed task data"""
+        if self.info_row is None:
+            return
+        while self.info_row.count():
+            item = self.info_row.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self.content_layout.removeItem(self.info_row)
+        self.info_row.deleteLater()
+        self.info_row = None
+    
+    def set_todo(self, todo_item):
+        """Show another or an edited todo in this row without recreating the widget"""
+        self.todo = todo_item
+        self.text_label.setText(todo_item.text)
+        self.clear_info_row()
+        self.build_info_row()
+        self.update_appearance()
+    
+    @classmethod
+    def _get_shadow_strip(cls):
+        """Return the shared 1px-wide shadow gradient stretched under every card"""
+        if cls._shadow_strip is None:
+            cls._shadow_strip = QPixmap(1, 6)
+            cls._shadow_strip.fill(Qt.transparent)
+            gradient = QLinearGradient(0, 0, 0, 6)
+            gradient.setColorAt(0, QColor(0, 0, 0, 30))
+            gradient.setColorAt(1, QColor(0, 0, 0, 0))
+            painter = QPainter(cls._shadow_strip)
+            painter.fillRect(0, 0, 1, 6, gradient)
+            painter.end()
+        return cls._shadow_strip
+    
+    def paintEvent(self, event):
+        """Draw a soft shadow along the card's bottom edge; the card paints itself on top"""
+        strip = self._get_shadow_strip()
+        card = self.card.geometry()
+        target = QRectF(card.x() + 6, card.y() + card.height() - 2, card.width() - 12, strip.height())
+        # Exposes inside the card (e.g. button hovers) don't touch the shadow
+        if not event.rect().intersects(target.toAlignedRect()):
+            return
+        QPainter(self).drawPixmap(target, strip, QRectF(strip.rect()))
     
     def update_appearance(self):
         """Update widget appearance based on todo state"""
@@ -371,84 +621,14 @@ class TodoItemWidget(QWidget):
         text_style = "todoTextCompleted" if is_completed else "todoText"
         self.text_label.setObjectName(text_style)
         
-        # Update the stylesheet
+        # Re-apply the list's rules for the new object names
         self.update_styles()
     
     def update_styles(self):
-        """Apply current theme styles to the widget"""
-        text_color = self.colors.get('text', '#FFFFFF')
-        surface_color = self.colors.get('surface', '#2C2C2E')
-        muted_color = self.colors.get('text_secondary', '#98989E')
-        overdue_color = self.colors.get('accent', '#FF453A')
-        priority_high = "#FF453A"  # Red
-        priority_medium = "#FF9F0A"  # Orange
-        priority_low = "#30D158"  # Green
-        
-        # Different background for completed and normal tasks
-        completed_bg = QColor(surface_color).lighter(110).name() if '#' in surface_color else surface_color
-        normal_bg = surface_color
-        overdue_bg = QColor(surface_color).darker(110).name() if '#' in surface_color else surface_color
-        
-        self.setStyleSheet(f"""
-            #todoCard {{
-                background-color: {normal_bg};
-                border-radius: 10px;
-                border-left: 3px solid transparent;
-            }}
-            #todoCardCompleted {{
-                background-color: {completed_bg};
-                border-radius: 10px;
-                border-left: 3px solid {priority_low};
-            }}
-            #todoCardOverdue {{
-                background-color: {overdue_bg};
-                border-radius: 10px;
-                border-left: 3px solid {priority_high};
-            }}
-            #todoText {{
-                color: {text_color};
-                font-size: 15px;
-            }}
-            #todoTextCompleted {{
-                color: {muted_color};
-                font-size: 15px;
-                text-decoration: line-through;
-            }}
-            #editButton, #deleteButton {{
-                background: transparent;
-                border: none;
-                border-radius: 12px;
-            }}
-            #editButton:hover, #deleteButton:hover {{
-                background-color: rgba(120, 120, 120, 0.2);
-            }}
-            #deadlineLabel {{
-                color: {muted_color};
-                font-size: 12px;
-            }}
-            #deadlineOverdue {{
-                color: {overdue_color};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            #tagsLabel {{
-                color: {muted_color};
-                font-size: 12px;
-            }}
-            #priorityHigh {{
-                color: {priority_high};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            #priorityMedium {{
-                color: {priority_medium};
-                font-size: 12px;
-            }}
-            #priorityLow {{
-                color: {priority_low};
-                font-size: 12px;
-            }}
-        """)
+        """Re-polish the card and text so their new object names pick up the list's rules"""
+        for widget in (self.card, self.text_label):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
     
     def toggle_completed(self, checked):
         """Handle completion checkbox toggle"""
@@ -465,30 +645,170 @@ class TodoItemWidget(QWidget):
 # Todo Detail Dialog
 # ======================================================
 
+# Dialog stylesheet with $-placeholders, so the literal CSS braces need no escaping
+DETAIL_DIALOG_STYLE = string.Template("""
+    QDialog {
+        background-color: ${background_color};
+        color: ${text_color};
+    }
+    
+    #titleEdit {
+        color: ${text_color};
+        font-size: 18px;
+        font-weight: bold;
+        background-color: transparent;
+        border: none;
+        border-bottom: 1px solid ${border_color};
+        padding: 8px 0;
+    }
+    
+    #detailsContainer {
+        background-color: ${surface_color};
+        border-radius: 12px;
+        padding: 8px;
+    }
+    
+    QLabel {
+        color: ${text_color};
+    }
+    
+    #sectionLabel {
+        color: ${muted_color};
+        font-size: 13px;
+    }
+    
+    QLineEdit, QPlainTextEdit, #descriptionPreview, QDateTimeEdit, QTimeEdit, QComboBox {
+        background-color: ${background_color};
+        color: ${text_color};
+        border: 1px solid ${border_color};
+        border-radius: 6px;
+        padding: 8px;
+        selection-background-color: ${primary_color};
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox::down-arrow {
+        image: url(assets/icons/dropdown.svg);
+        width: 12px;
+        height: 12px;
+    }
+    
+    QCheckBox {
+        color: ${text_color};
+    }
+    
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 1px solid ${border_color};
+        border-radius: 4px;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: ${primary_color};
+        image: url(assets/icons/check.svg);
+    }
+    
+    QPushButton {
+        background-color: ${surface_color};
+        color: ${text_color};
+        border: 1px solid ${border_color};
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    
+    QPushButton:hover {
+        background-color: ${surface_color}CC;
+    }
+    
+    #saveButton {
+        background-color: ${primary_color};
+        color: white;
+        border: none;
+    }
+    
+    #saveButton:hover {
+        background-color: ${primary_color}DD;
+    }
+    
+    #deleteButton {
+        background-color: transparent;
+        color: ${danger_color};
+        border: 1px solid ${danger_color};
+    }
+    
+    #deleteButton:hover {
+        background-color: ${danger_color}22;
+    }
+""")
+
+
 class TodoDetailDialog(QDialog):
     """Dialog for viewing/editing task details"""
     todoUpdated = pyqtSignal(object)  # Updated TodoItem
     todoDeleted = pyqtSignal(int)     # TodoItem ID
     
+    # Stylesheets by theme, shared by every dialog
+    _stylesheet_cache = {}
+    # One reusable dialog per parent widget (see get_shared)
+    _shared = {}
+    
     def __init__(self, todo_item, categories, theme="dark v2", parent=None):
         super().__init__(parent)
         self.todo = todo_item
-        self.original_todo = todo_item
         self.theme = theme
         self.colors = MODERN_COLORS.get(theme.lower(), MODERN_COLORS["dark v2"])
         self.categories = categories
-        self.all_tags = []
-        
-        # Collect all unique tags
-        if parent and hasattr(parent, 'get_all_tags'):
-            self.all_tags = parent.get_all_tags()
+        self.tags_model = None
+        self._ui_built = False
+        self._category_items = None
+        self._category_index = {}
         
         self.setWindowTitle("Task Details")
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         self.setMinimumWidth(400)
-        
-        self.init_ui()
-        self.apply_styles()
+    
+    @classmethod
+    def get_shared(cls, parent, theme="dark v2"):
+        """Return the dialog reused for every task of parent, creating it on first use"""
+        key = id(parent)
+        dialog = cls._shared.get(key)
+        if dialog is None:
+            dialog = cls._shared[key] = cls(None, [], theme, parent)
+            parent.destroyed.connect(lambda: cls._shared.pop(key, None))
+        return dialog
+    
+    def bind(self, todo_item, categories):
+        """Point the dialog at another task; the fields are filled when it is shown"""
+        self.todo = todo_item
+        self.categories = categories
+    
+    def showEvent(self, event):
+        """Build the UI the first time the dialog is shown, then fill it from the task"""
+        # Tag suggestions come from a model shared by every dialog of the list
+        parent = self.parent()
+        if parent and hasattr(parent, 'get_tags_model'):
+            self.tags_model = parent.get_tags_model()
+        
+        if not self._ui_built:
+            self._ui_built = True
+            
+            # Hold off repaints while the widget tree is populated. The sheet is set
+            # first so each child is polished once as it is added, not re-polished after
+            self.setUpdatesEnabled(False)
+            self.apply_styles()
+            self.init_ui()
+            self.populate()
+            self.setUpdatesEnabled(True)
+            self.adjustSize()
+        else:
+            self.populate()
+        super().showEvent(event)
     
     def init_ui(self):
         """Initialize the dialog UI"""
@@ -502,11 +822,10 @@ class TodoDetailDialog(QDialog):
         
         # Completion checkbox
         self.complete_checkbox = QCheckBox()
-        self.complete_checkbox.setChecked(self.todo.completed)
         title_layout.addWidget(self.complete_checkbox)
         
         # Title edit
-        self.title_edit = QLineEdit(self.todo.text)
+        self.title_edit = QLineEdit()
         self.title_edit.setPlaceholderText("Task title")
         self.title_edit.setObjectName("titleEdit")
         title_layout.addWidget(self.title_edit, 1)
@@ -522,14 +841,17 @@ class TodoDetailDialog(QDialog):
         # Description
         description_layout = QVBoxLayout()
         description_layout.setSpacing(8)
-        
-        description_label = QLabel("Description")
-        description_label.setObjectName("sectionLabel")
-        description_layout.addWidget(description_label)
-        
-        self.description_edit = QLineEdit(self.todo.description)
-        self.description_edit.setPlaceholderText("Add more details about this task")
-        description_layout.addWidget(self.description_edit)
+        description_layout.addWidget(self.section_label("Description"))
+        
+        # The text editor is only created once the user clicks the preview
+        self.description_edit = None
+        self.description_preview = ClickableLabel()
+        self.description_preview.setObjectName("descriptionPreview")
+        self.description_preview.setCursor(Qt.IBeamCursor)
+        self.description_preview.setWordWrap(True)
+        self.description_preview.clicked.connect(self.expand_description)
+        description_layout.addWidget(self.description_preview)
+        self.description_layout = description_layout
         
         details_layout.addLayout(description_layout)
         
@@ -539,71 +861,28 @@ class TodoDetailDialog(QDialog):
         
         deadline_date_layout = QVBoxLayout()
         deadline_date_layout.setSpacing(8)
+        deadline_date_layout.addWidget(self.section_label("Due"))
         
-        deadline_date_label = QLabel("Due Date")
-        deadline_date_label.setObjectName("sectionLabel")
-        deadline_date_layout.addWidget(deadline_date_label)
-        
-        self.deadline_date = QDateEdit()
-        self.deadline_date.setCalendarPopup(True)
-        
-        # Set current deadline if exists
-        if self.todo.deadline:
-            try:
-                deadline_dt = datetime.fromisoformat(self.todo.deadline)
-                self.deadline_date.setDate(QDate(deadline_dt.year, deadline_dt.month, deadline_dt.day))
-            except (ValueError, TypeError):
-                self.deadline_date.setDate(QDate.currentDate())
-        else:
-            self.deadline_date.setDate(QDate.currentDate())
-        
-        deadline_date_layout.addWidget(self.deadline_date)
-        
-        # Deadline time
-        deadline_time_layout = QVBoxLayout()
-        deadline_time_layout.setSpacing(8)
-        
-        deadline_time_label = QLabel("Due Time")
-        deadline_time_label.setObjectName("sectionLabel")
-        deadline_time_layout.addWidget(deadline_time_label)
-        
-        self.deadline_time = QTimeEdit()
-        
-        # Set current deadline time if exists
-        if self.todo.deadline:
-            try:
-                deadline_dt = datetime.fromisoformat(self.todo.deadline)
-                self.deadline_time.setTime(QTime(deadline_dt.hour, deadline_dt.minute))
-            except (ValueError, TypeError):
-                self.deadline_time.setTime(QTime(9, 0))  # Default 9am
-        else:
-            self.deadline_time.setTime(QTime(9, 0))  # Default 9am
-        
-        deadline_time_layout.addWidget(self.deadline_time)
+        # One editor covers both the date and the time of the deadline
+        self.deadline_edit = QDateTimeEdit()
+        self.deadline_edit.setCalendarPopup(True)
+        deadline_date_layout.addWidget(self.deadline_edit)
         
         # Option to disable deadline
         has_deadline_layout = QVBoxLayout()
         has_deadline_layout.setSpacing(8)
-        
-        has_deadline_label = QLabel("Has Deadline")
-        has_deadline_label.setObjectName("sectionLabel")
-        has_deadline_layout.addWidget(has_deadline_label)
+        has_deadline_layout.addWidget(self.section_label("Has Deadline"))
         
         self.has_deadline = QCheckBox("Enable")
-        self.has_deadline.setChecked(self.todo.deadline is not None)
         self.has_deadline.stateChanged.connect(self.toggle_deadline_controls)
         has_deadline_layout.addWidget(self.has_deadline)
         
         # Add all deadline controls
         deadline_layout.addLayout(has_deadline_layout)
-        deadline_layout.addLayout(deadline_date_layout)
-        deadline_layout.addLayout(deadline_time_layout)
+        deadline_layout.addLayout(deadline_date_layout, 1)
         
         details_layout.addLayout(deadline_layout)
         
-        # Initialize deadline controls state
-        self.toggle_deadline_controls(self.has_deadline.isChecked())
-        
         # Priority & Category row
         priority_category_layout = QHBoxLayout()
         priority_category_layout.setSpacing(16)
@@ -611,14 +890,10 @@ class TodoDetailDialog(QDialog):
         # Priority
         priority_layout = QVBoxLayout()
         priority_layout.setSpacing(8)
-        
-        priority_label = QLabel("Priority")
-        priority_label.setObjectName("sectionLabel")
-        priority_layout.addWidget(priority_label)
+        priority_layout.addWidget(self.section_label("Priority"))
         
         self.priority_combo = QComboBox()
-        self.priority_combo.addItems(["High", "Medium", "Low"])
-        self.priority_combo.setCurrentText(self.todo.priority)
+        self.priority_combo.addItems(PRIORITY_OPTIONS)
         priority_layout.addWidget(self.priority_combo)
         
         priority_category_layout.addLayout(priority_layout)
@@ -626,21 +901,14 @@ class TodoDetailDialog(QDialog):
         # Category
         category_layout = QVBoxLayout()
         category_layout.setSpacing(8)
-        
-        category_label = QLabel("Category")
-        category_label.setObjectName("sectionLabel")
-        category_layout.addWidget(category_label)
+        category_layout.addWidget(self.section_label("Category"))
         
         self.category_combo = QComboBox()
-        self.category_combo.addItems(self.categories)
-        if self.todo.category in self.categories:
-            self.category_combo.setCurrentText(self.todo.category)
-        else:
-            self.category_combo.addItem(self.todo.category)
-            self.category_combo.setCurrentText(self.todo.category)
         
-        # Allow adding new categories
+        # Allow adding new categories; typed names are saved from the edit text, and not
+        # inserted as items, so the items always match _category_items
         self.category_combo.setEditable(True)
+        self.category_combo.setInsertPolicy(QComboBox.NoInsert)
         category_layout.addWidget(self.category_combo)
         
         priority_category_layout.addLayout(category_layout)
@@ -654,19 +922,18 @@ class TodoDetailDialog(QDialog):
         # Tags
         tags_layout = QVBoxLayout()
         tags_layout.setSpacing(8)
+        tags_layout.addWidget(self.section_label("Tags"))
         
-        tags_label = QLabel("Tags")
-        tags_label.setObjectName("sectionLabel")
-        tags_layout.addWidget(tags_label)
-        
-        self.tags_edit = QLineEdit(", ".join(self.todo.tags) if self.todo.tags else "")
+        self.tags_edit = QLineEdit()
         self.tags_edit.setPlaceholderText("Comma-separated tags")
         
         # Add tag suggestions if available
-        if self.all_tags:
-            completer = QCompleter(self.all_tags)
+        if self.tags_model is not None:
+            completer = QCompleter(self.tags_model, self)
             completer.setCaseSensitivity(Qt.CaseInsensitive)
-            completer.setFilterMode(Qt.MatchContains)
+            # Prefix matching on the case-insensitively sorted model lets Qt binary search
+            completer.setFilterMode(Qt.MatchStartsWith)
+            completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
             self.tags_edit.setCompleter(completer)
         
         tags_layout.addWidget(self.tags_edit)
@@ -676,14 +943,10 @@ class TodoDetailDialog(QDialog):
         # Repeat option
         repeat_layout = QVBoxLayout()
         repeat_layout.setSpacing(8)
-        
-        repeat_label = QLabel("Repeat")
-        repeat_label.setObjectName("sectionLabel")
-        repeat_layout.addWidget(repeat_label)
+        repeat_layout.addWidget(self.section_label("Repeat"))
         
         self.repeat_combo = QComboBox()
-        self.repeat_combo.addItems(["None", "Daily", "Weekly", "Monthly"])
-        self.repeat_combo.setCurrentText(self.todo.repeat_option or "None")
+        self.repeat_combo.addItems(REPEAT_OPTIONS)
         repeat_layout.addWidget(self.repeat_combo)
         
         tags_repeat_layout.addLayout(repeat_layout)
@@ -696,35 +959,17 @@ class TodoDetailDialog(QDialog):
         
         has_reminder_layout = QVBoxLayout()
         has_reminder_layout.setSpacing(8)
-        
-        has_reminder_label = QLabel("Set Reminder")
-        has_reminder_label.setObjectName("sectionLabel")
-        has_reminder_layout.addWidget(has_reminder_label)
+        has_reminder_layout.addWidget(self.section_label("Set Reminder"))
         
         self.has_reminder = QCheckBox("Enable")
-        self.has_reminder.setChecked(self.todo.reminder_time is not None)
         self.has_reminder.stateChanged.connect(self.toggle_reminder_controls)
         has_reminder_layout.addWidget(self.has_reminder)
         
         reminder_time_layout = QVBoxLayout()
         reminder_time_layout.setSpacing(8)
-        
-        reminder_time_label = QLabel("Reminder Time")
-        reminder_time_label.setObjectName("sectionLabel")
-        reminder_time_layout.addWidget(reminder_time_label)
+        reminder_time_layout.addWidget(self.section_label("Reminder Time"))
         
         self.reminder_time = QTimeEdit()
-        
-        # Set current reminder time if exists
-        if self.todo.reminder_time:
-            try:
-                reminder_time = datetime.strptime(self.todo.reminder_time, "%H:%M").time()
-                self.reminder_time.setTime(QTime(reminder_time.hour, reminder_time.minute))
-            except (ValueError, TypeError):
-                self.reminder_time.setTime(QTime(9, 0))  # Default 9am
-        else:
-            self.reminder_time.setTime(QTime(9, 0))  # Default 9am
-        
         reminder_time_layout.addWidget(self.reminder_time)
         
         reminder_layout.addLayout(has_reminder_layout)
@@ -733,9 +978,6 @@ class TodoDetailDialog(QDialog):
         
         details_layout.addLayout(reminder_layout)
         
-        # Initialize reminder controls state
-        self.toggle_reminder_controls(self.has_reminder.isChecked())
-        
         main_layout.addWidget(details_container)
         
         # Action buttons
@@ -756,10 +998,82 @@ class TodoDetailDialog(QDialog):
         
         main_layout.addLayout(buttons_layout)
     
+    @staticmethod
+    def section_label(text):
+        """Create one of the muted captions above each field"""
+        label = QLabel(text)
+        label.setObjectName("sectionLabel")
+        return label
+    
+    def populate(self):
+        """Fill every field from self.todo without triggering the change handlers"""
+        todo = self.todo
+        # Blockers restore each widget's previous blocked state, even if it was already blocked
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.complete_checkbox, self.has_deadline, self.has_reminder,
+            self.priority_combo, self.category_combo, self.repeat_combo)]
+        
+        self.complete_checkbox.setChecked(todo.completed)
+        self.title_edit.setText(todo.text)
+        if self.description_edit is not None:
+            self.description_edit.setPlainText(todo.description)
+        else:
+            self.description_preview.setText(todo.description or "Add more details about this task")
+        
+        # Set current deadline if exists (parsed once by the model)
+        deadline_dt = todo.deadline_dt
+        has_deadline = todo.deadline is not None
+        self.has_deadline.setChecked(has_deadline)
+        self.deadline_edit.setEnabled(has_deadline)
+        if deadline_dt is not None:
+            self.deadline_edit.setDateTime(QDateTime(
+                QDate(deadline_dt.year, deadline_dt.month, deadline_dt.day),
+                QTime(deadline_dt.hour, deadline_dt.minute)))
+        else:
+            self.deadline_edit.setDateTime(QDateTime(QDate.currentDate(), QTime(9, 0)))  # Default 9am
+        
+        self.priority_combo.setCurrentIndex(PRIORITY_INDEX.get(todo.priority, PRIORITY_INDEX["Medium"]))
+        
+        # Only rebuild the category items when the list (or the task's extra category) changed
+        categories = self.categories
+        if todo.category not in categories:
+            categories = categories + [todo.category]
+        if categories != self._category_items:
+            self.category_combo.clear()
+            self.category_combo.addItems(categories)
+            self._category_items = list(categories)
+            self._category_index = {name: i for i, name in enumerate(categories)}
+        self.category_combo.setCurrentIndex(self._category_index[todo.category])
+        
+        tags = todo.tags
+        self.tags_edit.setText(tags[0] if len(tags) == 1 else ", ".join(tags))
+        self.repeat_combo.setCurrentIndex(REPEAT_INDEX.get(todo.repeat_option, 0))
+        
+        # Set current reminder time if exists
+        has_reminder = todo.reminder_time is not None
+        self.has_reminder.setChecked(has_reminder)
+        self.reminder_time.setEnabled(has_reminder)
+        reminder_time = QTime.fromString(todo.reminder_time, "H:mm") if todo.reminder_time else QTime()
+        if reminder_time.isValid():
+            self.reminder_time.setTime(reminder_time)
+        else:
+            self.reminder_time.setTime(QTime(9, 0))  # Default 9am
+        
+        for blocker in blockers:
+            blocker.unblock()
+    
+    def expand_description(self):
+        """Swap the description preview for an editor holding the full text"""
+        self.description_edit = QPlainTextEdit(self.todo.description)
+        self.description_edit.setPlaceholderText("Add more details about this task")
+        self.description_edit.setFixedHeight(90)
+        self.description_layout.replaceWidget(self.description_preview, self.description_edit)
+        self.description_preview.hide()
+        self.description_edit.setFocus()
+    
     def toggle_deadline_controls(self, enabled):
         """Enable/disable deadline controls based on checkbox"""
-        self.deadline_date.setEnabled(enabled)
-        self.deadline_time.setEnabled(enabled)
+        self.deadline_edit.setEnabled(enabled)
     
     def toggle_reminder_controls(self, enabled):
         """Enable/disable reminder controls based on checkbox"""
@@ -775,22 +1089,17 @@ class TodoDetailDialog(QDialog):
         # Update todo with form values
         self.todo.text = title
         self.todo.completed = self.complete_checkbox.isChecked()
-        self.todo.description = self.description_edit.text().strip()
+        if self.description_edit is not None:
+            self.todo.description = self.description_edit.toPlainText().strip()
         self.todo.priority = self.priority_combo.currentText()
         self.todo.category = self.category_combo.currentText()
         
         # Parse tags from comma-separated string
-        tags_text = self.tags_edit.text().strip()
-        if tags_text:
-            self.todo.tags = [tag.strip() for tag in tags_text.split(",") if tag.strip()]
-        else:
-            self.todo.tags = []
+        self.todo.tags = TAG_SPLIT_RE.findall(self.tags_edit.text())
         
         # Set deadline
         if self.has_deadline.isChecked():
-            date = self.deadline_date.date().toPyDate()
-            time_val = self.deadline_time.time().toPyTime()
-            deadline_dt = datetime.combine(date, time_val)
+            deadline_dt = self.deadline_edit.dateTime().toPyDateTime().replace(second=0, microsecond=0)
             self.todo.deadline = deadline_dt.isoformat()
         else:
             self.todo.deadline = None
@@ -825,123 +1134,58 @@ class TodoDetailDialog(QDialog):
     
     def apply_styles(self):
         """Apply theme-based styles to the dialog"""
-        surface_color = self.colors.get('surface', '#2C2C2E')
-        background_color = self.colors.get('background', '#1C1C1E')
-        text_color = self.colors.get('text', '#FFFFFF')
-        border_color = self.colors.get('border', '#3A3A3C')
-        muted_color = self.colors.get('text_secondary', '#98989E')
-        primary_color = self.colors.get('primary', '#0A84FF')
-        danger_color = self.colors.get('accent', '#FF453A')
-        
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {background_color};
-                color: {text_color};
-            }}
-            
-            #titleEdit {{
-                color: {text_color};
-                font-size: 18px;
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-                border-bottom: 1px solid {border_color};
-                padding: 8px 0;
-            }}
-            
-            #detailsContainer {{
-                background-color: {surface_color};
-                border-radius: 12px;
-                padding: 8px;
-            }}
-            
-            QLabel {{
-                color: {text_color};
-            }}
-            
-            #sectionLabel {{
-                color: {muted_color};
-                font-size: 13px;
-            }}
-            
-            QLineEdit, QDateEdit, QTimeEdit, QComboBox {{
-                background-color: {background_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 8px;
-                selection-background-color: {primary_color};
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            
-            QComboBox::down-arrow {{
-                image: url(assets/icons/dropdown.svg);
-                width: 12px;
-                height: 12px;
-            }}
-            
-            QCheckBox {{
-                color: {text_color};
-            }}
-            
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 1px solid {border_color};
-                border-radius: 4px;
-            }}
-            
-            QCheckBox::indicator:checked {{
-                background-color: {primary_color};
-                image: url(assets/icons/check.svg);
-            }}
-            
-            QPushButton {{
-                background-color: {surface_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            
-            QPushButton:hover {{
-                background-color: {surface_color}CC;
-            }}
-            
-            #saveButton {{
-                background-color: {primary_color};
-                color: white;
-                border: none;
-            }}
-            
-            #saveButton:hover {{
-                background-color: {primary_color}DD;
-            }}
-            
-            #deleteButton {{
-                background-color: transparent;
-                color: {danger_color};
-                border: 1px solid {danger_color};
-            }}
-            
-            #deleteButton:hover {{
-                background-color: {danger_color}22;
-            }}
-        """)
+        sheet = self._stylesheet_cache.get(self.theme)
+        if sheet is None:
+            sheet = self._stylesheet_cache[self.theme] = self.build_stylesheet()
+        self.setStyleSheet(sheet)
+    
+    def build_stylesheet(self):
+        """Build the dialog stylesheet for the current theme"""
+        colors = self.colors
+        return DETAIL_DIALOG_STYLE.substitute(
+            surface_color=colors.get('surface', '#2C2C2E'),
+            background_color=colors.get('background', '#1C1C1E'),
+            text_color=colors.get('text', '#FFFFFF'),
+            border_color=colors.get('border', '#3A3A3C'),
+            muted_color=colors.get('text_secondary', '#98989E'),
+            primary_color=colors.get('primary', '#0A84FF'),
+            danger_color=colors.get('accent', '#FF453A'),
+        )
+
 
 # ======================================================
 # Todo List Widget
 # ======================================================
 
+class SaveSettingsJob(QRunnable):
+    """Write a settings snapshot to disk off the GUI thread"""
+    
+    _sequence = itertools.count(1)
+    # Newest job created per settings file; older jobs still queued are skipped
+    _latest = {}
+    
+    def __init__(self, settings_manager, settings):
+        super().__init__()
+        self.settings_manager = settings_manager
+        self.settings = settings
+        self.seq = next(SaveSettingsJob._sequence)
+        SaveSettingsJob._latest[settings_manager.settings_path] = self.seq
+    
+    def run(self):
+        if SaveSettingsJob._latest.get(self.settings_manager.settings_path) != self.seq:
+            return  # A newer snapshot is queued; writing this one would be wasted or stale
+        self.settings_manager.write_settings(self.settings)
+
+
 class TodoListWidget(QWidget):
     """Main todo list widget that can be integrated into the app"""
     tasksChanged = pyqtSignal()  # Signal when tasks change (for achievements)
     
+    # Stylesheets by theme, shared by every list widget
+    _stylesheet_cache = {}
+    # Single worker thread for saves, so snapshots reach the disk in order
+    _save_pool = None
+    
     def __init__(self, settings_manager=None, theme="dark v2", parent=None):
         super().__init__(parent)
         self.theme = theme
@@ -950,13 +1194,36 @@ class TodoListWidget(QWidget):
         
         # Task data
         self.todos = []
+        self._by_id = {}  # Task id -> TodoItem, kept in step with self.todos
+        self._completed_count = 0  # Running count of completed todos
         self.categories = ["Personal", "Work", "Health", "Shopping", "Other"]
         self.selected_category = "All"
         self.filter_completed = False
+        self._tags_model = None
+        self._tags_model_source = None
+        self._all_tags_cache = None  # Sorted tags, reset whenever the todos change
+        self._rev = 0  # Bumped whenever the todos change
+        self._filtered_cache = None  # (filter key, filtered todos) of the last filter pass
+        self._category_index = None  # (revision, category -> todos) for category filters
+        self._category_stats = None  # (revision, per-category counts) for get_task_stats
+        self._last_render_key = None  # Filter key the task rows were last built for
+        self._widget_cache = {}  # Task id -> row widget, reused across refreshes
         
         # State
         self.modified = False
         self.reminder_checked = False
+        self.last_check_time = None  # Wall-clock minute of the last reminder check
+        self._batch_depth = 0  # Nesting depth of _batch_signals blocks
+        self._pending_emit = False  # tasksChanged was requested inside a batch
+        
+        # Saves are coalesced: a burst of edits writes to disk once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(400)
+        self._save_timer.timeout.connect(self._flush_save)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.finish_saves)
         
         # Setup UI
         self.init_ui()
@@ -991,15 +1258,16 @@ class TodoListWidget(QWidget):
         # Filter button
         self.filter_btn = QPushButton("Filter")
         self.filter_btn.setObjectName("filterButton")
-        self.filter_btn.setIcon(QIcon(resource_path("assets/icons/filter.svg")))
+        self.filter_btn.setIcon(cached_icon("assets/icons/filter.svg"))
         self.filter_btn.setCursor(Qt.PointingHandCursor)
         self.filter_btn.clicked.connect(self.show_filter_menu)
         header_layout.addWidget(self.filter_btn)
+        self.build_filter_menu()
         
         # Add task button
         self.add_btn = QPushButton("Add Task")
         self.add_btn.setObjectName("addButton")
-        self.add_btn.setIcon(QIcon(resource_path("assets/icons/plus.svg")))
+        self.add_btn.setIcon(cached_icon("assets/icons/plus.svg"))
         self.add_btn.setCursor(Qt.PointingHandCursor)
         self.add_btn.clicked.connect(self.add_new_task)
         header_layout.addWidget(self.add_btn)
@@ -1036,6 +1304,13 @@ class TodoListWidget(QWidget):
         self.task_layout.setSpacing(8)
         self.task_layout.addStretch(1)  # Push items to the top
         
+        # Empty state stays at the top of the layout, shown only when nothing matches
+        self.empty_label = QLabel("No tasks match your filters")
+        self.empty_label.setObjectName("emptyLabel")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.hide()
+        self.task_layout.insertWidget(0, self.empty_label)
+        
         task_scroll.setWidget(self.task_container)
         main_layout.addWidget(task_scroll, 1)  # Give this most of the space
         
@@ -1064,6 +1339,15 @@ class TodoListWidget(QWidget):
     
     def apply_styles(self):
         """Apply current theme styles to the widget"""
+        sheet = self._stylesheet_cache.get(self.theme)
+        if sheet is None:
+            sheet = self._stylesheet_cache[self.theme] = self.build_stylesheet()
+        # Qt re-resolves styles on every assignment, even of an identical sheet
+        if self.styleSheet() != sheet:
+            self.setStyleSheet(sheet)
+    
+    def build_stylesheet(self):
+        """Build the list stylesheet, including the task row rules, for the current theme"""
         background_color = self.colors.get('background', '#1C1C1E')
         surface_color = self.colors.get('surface', '#2C2C2E')
         text_color = self.colors.get('text', '#FFFFFF')
@@ -1072,7 +1356,7 @@ class TodoListWidget(QWidget):
         border_color = self.colors.get('border', '#3A3A3C')
         muted_color = self.colors.get('text_secondary', '#98989E')
         
-        self.setStyleSheet(f"""
+        return f"""
             /* Main widget */
             TodoListWidget {{
                 background-color: {background_color};
@@ -1180,7 +1464,7 @@ class TodoListWidget(QWidget):
             QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
                 background: none;
             }}
-        """)
+        """ + todo_item_stylesheet(self.colors)
     
     def setup_reminder_timer(self):
         """Set up timer to check for reminders"""
@@ -1190,30 +1474,35 @@ class TodoListWidget(QWidget):
     
     def load_todos(self):
         """Load todos from settings"""
-        if not self.settings_manager:
-            # Create some sample todos if no settings manager
-            self.create_sample_todos()
-            return
-        
-        try:
-            todos_data = self.settings_manager.get("todos")
-            if not todos_data:
+        # Repaint once after the list, repeats and stats are all in place
+        with self._freeze():
+            if not self.settings_manager:
+                # Create some sample todos if no settings manager
                 self.create_sample_todos()
                 return
             
-            # Convert stored data to TodoItem objects
-            self.todos = [TodoItem.from_dict(item) for item in todos_data]
-            
-            # Handle repeating tasks that need new instances
-            self.process_repeating_tasks()
-            
-            # Update UI
-            self.update_task_list()
-            self.update_stats()
-        except Exception as e:
-            print(f"Error loading todos: {e}")
-            # Fall back to sample todos
-            self.create_sample_todos()
+            try:
+                todos_data = self.settings_manager.get("todos")
+                if not todos_data:
+                    self.create_sample_todos()
+                    return
+                
+                # Convert stored data to TodoItem objects
+                self.todos = [TodoItem.from_dict(item) for item in todos_data]
+                self._by_id = {todo.id: todo for todo in self.todos}
+                self._todos_changed()
+                
+                # Handle repeating tasks that need new instances
+                self.process_repeating_tasks()
+                self._recount_completed()
+                
+                # Update UI
+                self.update_task_list()
+                self.update_stats()
+            except Exception as e:
+                print(f"Error loading todos: {e}")
+                # Fall back to sample todos
+                self.create_sample_todos()
     
     def create_sample_todos(self):
         """Create some sample todos for first-time users"""
@@ -1240,12 +1529,40 @@ class TodoListWidget(QWidget):
                 deadline=tomorrow.replace(hour=12, minute=0).isoformat()
             )
         ]
+        self._by_id = {todo.id: todo for todo in self.todos}
+        self._completed_count = 0
+        self._todos_changed()
         
         self.update_task_list()
         self.update_stats()
     
     def save_todos(self):
-        """Save todos to settings"""
+        """Schedule a save, restarting the delay if one is already pending"""
+        self.modified = True
+        self._save_timer.start()
+    
+    def flush_pending_save(self):
+        """Start writing a scheduled save right away"""
+        if self.modified:
+            self._flush_save()
+    
+    def finish_saves(self):
+        """Flush a scheduled save and wait until every queued write is on disk"""
+        self.flush_pending_save()
+        if TodoListWidget._save_pool is not None:
+            TodoListWidget._save_pool.waitForDone()
+    
+    @classmethod
+    def _get_save_pool(cls):
+        """Return the shared single-thread pool that writes the settings file"""
+        if cls._save_pool is None:
+            cls._save_pool = QThreadPool()
+            cls._save_pool.setMaxThreadCount(1)
+        return cls._save_pool
+    
+    def _flush_save(self):
+        """Save todos to settings; the file is written on a worker thread"""
+        self._save_timer.stop()
         if not self.settings_manager:
             return
         
@@ -1253,7 +1570,9 @@ class TodoListWidget(QWidget):
             # Convert TodoItems to dictionaries
             todos_data = [todo.to_dict() for todo in self.todos]
             self.settings_manager.set("todos", todos_data)
-            self.settings_manager.save_settings()
+            # The worker gets its own deep copy, so GUI-thread edits to nested todos can't race the dump
+            snapshot = copy.deepcopy(self.settings_manager.settings)
+            self._get_save_pool().start(SaveSettingsJob(self.settings_manager, snapshot))
             self.modified = False
         except Exception as e:
             print(f"Error saving todos: {e}")
@@ -1263,137 +1582,201 @@ class TodoListWidget(QWidget):
         today = datetime.now().date()
         new_todos = []
         
-        for todo in self.todos[:]:
-            if todo.completed and todo.repeat_option:
-                # Get completion date
-                try:
-                    if not todo.completed_at:
-                        # Skip if no completion timestamp
-                        continue
-                    
-                    completed_dt = datetime.fromisoformat(todo.completed_at)
-                    completed_date = completed_dt.date()
-                    
-                    # Only create a new task if the completion was recent
-                    days_since_completion = (today - completed_date).days
-                    
-                    if days_since_completion <= 0:
-                        # Skip if completed today (avoid duplicates)
-                        continue
-                    
-                    # Determine if we need to create a new instance based on repeat pattern
-                    create_new = False
+        # Only completed repeating tasks with a valid completion timestamp can spawn a new instance
+        repeating = [todo for todo in self.todos
+                     if todo.completed and todo.repeat_option and todo.completed_date is not None]
+        
+        for todo in repeating:
+            try:
+                # Only create a new task if the completion was recent
+                days_since_completion = (today - todo.completed_date).days
+                
+                if days_since_completion <= 0:
+                    # Skip if completed today (avoid duplicates)
+                    continue
+                
+                # Determine if we need to create a new instance based on repeat pattern
+                create_new = False
+                
+                if todo.repeat_option == "Daily":
+                    create_new = True
+                elif todo.repeat_option == "Weekly" and days_since_completion >= 7:
+                    create_new = True
+                elif todo.repeat_option == "Monthly" and days_since_completion >= 28:
+                    create_new = True
+                
+                if create_new:
+                    # Create a new instance of this task
+                    new_todo = TodoItem(
+                        text=todo.text,
+                        priority=todo.priority,
+                        tags=todo.tags,
+                        category=todo.category,
+                        description=todo.description,
+                        repeat_option=todo.repeat_option,
+                        reminder_time=todo.reminder_time
+                    )
                     
-                    if todo.repeat_option == "Daily":
-                        create_new = True
-                    elif todo.repeat_option == "Weekly" and days_since_completion >= 7:
-                        create_new = True
-                    elif todo.repeat_option == "Monthly" and days_since_completion >= 28:
-                        create_new = True
+                    # Set new deadline if original had one (parsed when the task was loaded)
+                    deadline_dt = todo.deadline_dt
+                    if deadline_dt is not None:
+                        try:
+                            if todo.repeat_option == "Daily":
+                                new_deadline = datetime.combine(today, deadline_dt.time())
+                            elif todo.repeat_option == "Weekly":
+                                days_to_add = 7
+                                new_deadline = deadline_dt + timedelta(days=days_to_add)
+                            elif todo.repeat_option == "Monthly":
+                                # Keep the same day of month, or the last day of a shorter month
+                                new_date = next_month_on_day(today, deadline_dt.day)
+                                new_deadline = datetime.combine(new_date, deadline_dt.time())
+                            else:
+                                new_deadline = None
+                            
+                            if new_deadline:
+                                new_todo.deadline = new_deadline.isoformat()
+                        except (ValueError, TypeError):
+                            # In case of errors, don't set a deadline
+                            pass
                     
-                    if create_new:
-                        # Create a new instance of this task
-                        new_todo = TodoItem(
-                            text=todo.text,
-                            priority=todo.priority,
-                            tags=todo.tags,
-                            category=todo.category,
-                            description=todo.description,
-                            repeat_option=todo.repeat_option,
-                            reminder_time=todo.reminder_time
-                        )
-                        
-                        # Set new deadline if original had one
-                        if todo.deadline:
-                            try:
-                                deadline_dt = datetime.fromisoformat(todo.deadline)
-                                if todo.repeat_option == "Daily":
-                                    new_deadline = datetime.combine(today, deadline_dt.time())
-                                elif todo.repeat_option == "Weekly":
-                                    days_to_add = 7
-                                    new_deadline = deadline_dt + timedelta(days=days_to_add)
-                                elif todo.repeat_option == "Monthly":
-                                    # Try to maintain the same day of month
-                                    day = min(deadline_dt.day, 28)  # Cap at 28 to handle all months
-                                    month = today.month
-                                    year = today.year
-                                    if month == 12:
-                                        month = 1
-                                        year += 1
-                                    else:
-                                        month += 1
-                                    new_date = datetime(year, month, day).date()
-                                    new_deadline = datetime.combine(new_date, deadline_dt.time())
-                                else:
-                                    new_deadline = None
-                                
-                                if new_deadline:
-                                    new_todo.deadline = new_deadline.isoformat()
-                            except (ValueError, TypeError):
-                                # In case of errors, don't set a deadline
-                                pass
-                        
-                        new_todos.append(new_todo)
-                except (ValueError, TypeError):
-                    # Skip this task if there are date parsing issues
-                    continue
+                    new_todos.append(new_todo)
+            except (ValueError, TypeError):
+                # Skip this task if there are date parsing issues
+                continue
         
         # Add any new repeating tasks
         if new_todos:
             self.todos.extend(new_todos)
+            self._by_id.update((todo.id, todo) for todo in new_todos)
             self.modified = True
+            self._todos_changed()
     
     def update_task_list(self):
-        """Update the task list UI based on current todos and filters"""
-        # Clear existing tasks
-        self._clear_task_layout()
-        
-        # Filter tasks
-        filtered_todos = self.get_filtered_todos()
-        
-        if not filtered_todos:
-            # Show empty state
-            empty_label = QLabel("No tasks match your filters")
-            empty_label.setObjectName("emptyLabel")
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.task_layout.insertWidget(0, empty_label)
-        else:
-            # Add task widgets in reverse order (newest at top)
-            for todo in reversed(filtered_todos):
-                todo_widget = TodoItemWidget(todo, self.theme)
-                
-                # Connect signals
-                todo_widget.completed.connect(self.on_task_completed)
-                todo_widget.deleted.connect(self.on_task_deleted)
-                todo_widget.details_requested.connect(self.on_task_details)
+        """Update the task list UI based on current todos and filters, reusing existing rows"""
+        # Nothing to do if neither the todos, the filters nor the date changed since the last refresh
+        today = date.today()
+        render_key = (self._rev, self.selected_category, self.filter_completed, today)
+        if render_key == self._last_render_key:
+            return
+        # Kept rows show "Today"/"Tomorrow"/overdue relative to the day they were built
+        new_day = self._last_render_key is not None and self._last_render_key[3] != today
+        self._last_render_key = render_key
+        
+        # Newest at top
+        visible = list(reversed(self.get_filtered_todos()))
+        visible_ids = {todo.id for todo in visible}
+        
+        self.task_container.setUpdatesEnabled(False)
+        try:
+            # Drop rows whose tasks were removed or filtered out
+            for task_id in [task_id for task_id in self._widget_cache if task_id not in visible_ids]:
+                self._drop_task_widget(task_id)
+            
+            self.empty_label.setVisible(not visible)
+            
+            # Create rows for newly visible tasks and move only the ones out of place
+            for i, todo in enumerate(visible, 1):  # Index 0 is the empty label
+                todo_widget = self._widget_cache.get(todo.id)
+                if todo_widget is None:
+                    todo_widget = TodoItemWidget(todo, self.theme)
+                    
+                    # Connect signals once for the row's lifetime; reused rows keep them
+                    todo_widget.completed.connect(self.on_task_completed)
+                    todo_widget.deleted.connect(self.on_task_deleted)
+                    todo_widget.details_requested.connect(self.on_task_details)
+                    
+                    self._widget_cache[todo.id] = todo_widget
+                elif todo_widget.todo is not todo or new_day:
+                    todo_widget.set_todo(todo)
                 
-                self.task_layout.insertWidget(0, todo_widget)
+                # Rows before i are already in order, so one slot lookup tells if this one is;
+                # indexOf would rescan the layout for every row
+                item = self.task_layout.itemAt(i)
+                if item is None or item.widget() is not todo_widget:
+                    # Take a moved row out first; Qt warns when re-adding a managed widget
+                    self.task_layout.removeWidget(todo_widget)
+                    self.task_layout.insertWidget(i, todo_widget)
+        finally:
+            self.task_container.setUpdatesEnabled(True)
     
-    def _clear_task_layout(self):
-        """Clear all task widgets from the layout"""
-        while self.task_layout.count() > 1:  # Keep the stretch
-            item = self.task_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    @contextmanager
+    def _freeze(self):
+        """Hold back repaints and tasksChanged during a bulk update, then repaint and emit once"""
+        self.setUpdatesEnabled(False)
+        try:
+            with self._batch_signals():
+                yield
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    @contextmanager
+    def _batch_signals(self):
+        """Coalesce tasksChanged emissions until the outermost batch ends"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_emit:
+                self._pending_emit = False
+                self.tasksChanged.emit()
+    
+    def _emit_tasks_changed(self):
+        """Emit tasksChanged now, or once at the end of the current batch"""
+        if self._batch_depth:
+            self._pending_emit = True
+        else:
+            self.tasksChanged.emit()
+    
+    def _drop_task_widget(self, task_id):
+        """Remove a task's row from the layout and schedule it for deletion"""
+        todo_widget = self._widget_cache.pop(task_id, None)
+        if todo_widget is not None:
+            self.task_layout.removeWidget(todo_widget)
+            todo_widget.deleteLater()
+    
+    def _todos_changed(self):
+        """Invalidate the views derived from self.todos"""
+        self._rev += 1
+        self._all_tags_cache = None
+    
+    def _todos_in_category(self, category):
+        """Return the todos in a category, grouping all categories in one pass per revision"""
+        if self._category_index is None or self._category_index[0] != self._rev:
+            index = {}
+            for todo in self.todos:
+                index.setdefault(todo.category, []).append(todo)
+            self._category_index = (self._rev, index)
+        return self._category_index[1].get(category, [])
     
     def get_filtered_todos(self):
-        """Get todos filtered by current filter settings"""
+        """Get todos filtered by current filter settings; callers must not modify the result"""
+        key = (self._rev, self.selected_category, self.filter_completed)
+        if self._filtered_cache is not None and self._filtered_cache[0] == key:
+            return self._filtered_cache[1]
+        
         # Apply category filter
         if self.selected_category == "All":
-            filtered = self.todos[:]
+            filtered = self.todos
         else:
-            filtered = [todo for todo in self.todos if todo.category == self.selected_category]
+            filtered = self._todos_in_category(self.selected_category)
         
         # Apply completed filter
         if self.filter_completed:
             filtered = [todo for todo in filtered if not todo.completed]
         
+        self._filtered_cache = (key, filtered)
         return filtered
     
+    def _recount_completed(self):
+        """Recompute the running completed count from scratch"""
+        # bool counts as 0/1, and map keeps the loop in C
+        self._completed_count = sum(map(attrgetter("completed"), self.todos))
+    
     def update_stats(self):
         """Update stats label with current counts"""
         total = len(self.todos)
-        completed = sum(1 for todo in self.todos if todo.completed)
+        completed = self._completed_count
         
         self.stats_label.setText(f"{total} tasks, {completed} completed")
         
@@ -1410,73 +1793,90 @@ class TodoListWidget(QWidget):
     
     def on_task_completed(self, task_id, completed):
         """Handle task completion status change"""
-        for todo in self.todos:
-            if todo.id == task_id:
-                todo.completed = completed
-                if completed:
-                    todo.completed_at = datetime.now().isoformat()
-                else:
-                    todo.completed_at = None
-                
-                self.modified = True
-                self.save_todos()
-                self.update_stats()
-                
-                # Emit signal for achievements
-                self.tasksChanged.emit()
-                break
+        todo = self._by_id.get(task_id)
+        if not todo:
+            return
+        
+        # Rows only emit this when their check button flips the state
+        todo.completed = completed
+        if completed:
+            todo.completed_at = datetime.now().isoformat()
+            self._completed_count += 1
+        else:
+            todo.completed_at = None
+            self._completed_count -= 1
+        
+        self.modified = True
+        self._todos_changed()
+        self.save_todos()
+        self.update_stats()
+        
+        # Emit signal for achievements
+        self._emit_tasks_changed()
     
     def on_task_deleted(self, task_id):
         """Handle task deletion"""
-        for i, todo in enumerate(self.todos):
-            if todo.id == task_id:
-                self.todos.pop(i)
-                self.modified = True
-                self.save_todos()
-                self.update_task_list()
-                self.update_stats()
-                
-                # Emit signal for achievements
-                self.tasksChanged.emit()
-                break
+        todo = self._by_id.pop(task_id, None)
+        if not todo:
+            return
+        
+        self.todos.remove(todo)
+        if todo.completed:
+            self._completed_count -= 1
+        self.modified = True
+        self._todos_changed()
+        self.save_todos()
+        self.update_task_list()
+        self.update_stats()
+        
+        # Emit signal for achievements
+        self._emit_tasks_changed()
     
     def on_task_details(self, task_id):
         """Show task details dialog"""
-        # Find the todo item
-        todo = None
-        for t in self.todos:
-            if t.id == task_id:
-                todo = t
-                break
-        
+        todo = self._by_id.get(task_id)
         if not todo:
             return
         
-        # Create and show the details dialog
-        dialog = TodoDetailDialog(todo, self.categories, self.theme, self)
+        # Show the shared details dialog for this task
+        dialog = TodoDetailDialog.get_shared(self, self.theme)
+        dialog.bind(todo, self.categories)
         dialog.todoUpdated.connect(self.on_task_updated)
         dialog.todoDeleted.connect(self.on_task_deleted)
         dialog.exec_()
+        dialog.todoUpdated.disconnect(self.on_task_updated)
+        dialog.todoDeleted.disconnect(self.on_task_deleted)
     
     def on_task_updated(self, updated_todo):
         """Handle task update from detail dialog"""
-        # Find and update the todo
-        for i, todo in enumerate(self.todos):
-            if todo.id == updated_todo.id:
-                self.todos[i] = updated_todo
-                self.modified = True
-                
-                # Add new category if it doesn't exist
-                if updated_todo.category and updated_todo.category not in self.categories:
-                    self.categories.append(updated_todo.category)
-                
-                self.save_todos()
-                self.update_task_list()
-                self.update_stats()
-                
-                # Emit signal for achievements
-                self.tasksChanged.emit()
-                break
+        todo = self._by_id.get(updated_todo.id)
+        if not todo:
+            return
+        
+        # Swap in the updated task at the same position
+        if todo is not updated_todo:
+            self.todos[self.todos.index(todo)] = updated_todo
+            self._by_id[updated_todo.id] = updated_todo
+        # The dialog may have changed the completed flag in place, so the old state is gone
+        self._recount_completed()
+        self.modified = True
+        self._todos_changed()
+        
+        # Add new category if it doesn't exist
+        if updated_todo.category and updated_todo.category not in self.categories:
+            self.categories.append(updated_todo.category)
+        
+        self.save_todos()
+        with self._freeze():
+            # The dialog edits the task in place, so refresh its row's contents
+            todo_widget = self._widget_cache.get(updated_todo.id)
+            if todo_widget is not None:
+                todo_widget.set_todo(updated_todo)
+            self.update_task_list()
+            self.update_stats()
+        
+        # Emit signal for achievements
+        self._emit_tasks_changed()
     
     def quick_add_task(self):
         """Quickly add a task from the quick add field"""
@@ -1491,47 +1891,35 @@ class TodoListWidget(QWidget):
             category=self.selected_category if self.selected_category != "All" else "Personal"
         )
         
-        # Check for smart syntax for priority: ! for high, !! for medium (default)
-        if text.endswith("!!!"):
-            new_todo.text = text[:-3].strip()
-            new_todo.priority = "High"
-        elif text.endswith("!!"):
-            new_todo.text = text[:-2].strip()
-            new_todo.priority = "Medium"
-        elif text.endswith("!"):
-            new_todo.text = text[:-1].strip()
-            new_todo.priority = "Low"
-        
-        # Parse deadlines with @ syntax: @tomorrow, @friday, @5/15, etc.
-        deadlines = {
-            "@today": datetime.now().date(),
-            "@tomorrow": datetime.now().date() + timedelta(days=1),
-            "@nextweek": datetime.now().date() + timedelta(days=7)
-        }
+        # Smart syntax: trailing !!!/!!/! for high/medium/low priority,
+        # @today/@tomorrow/@nextweek for a deadline and #word for tags
+        tags = []
+        markers = {}
         
-        # Check for date keywords
-        for keyword, date_val in deadlines.items():
-            if keyword in text.lower():
-                new_todo.text = new_todo.text.replace(keyword, "").strip()
-                new_todo.deadline = datetime.combine(date_val, time(18, 0)).isoformat()
-                break
+        def take_marker(match):
+            if match.group("tag"):
+                tags.append(match.group("tag"))
+            elif match.group("deadline"):
+                markers.setdefault("deadline", match.group("deadline").lower())
+            else:
+                markers["priority"] = match.group("priority")
+            return ""
         
-        # Parse tags with # syntax: #work #personal
-        tags = []
-        words = text.split()
-        for word in words:
-            if word.startswith("#"):
-                tag = word[1:]
-                if tag:
-                    tags.append(tag)
-                    new_todo.text = new_todo.text.replace(word, "").strip()
+        new_todo.text = " ".join(QUICK_ADD_RE.sub(take_marker, text).split())
         
+        if "priority" in markers:
+            new_todo.priority = QUICK_ADD_PRIORITIES[markers["priority"]]
+        if "deadline" in markers:
+            deadline_date = date.today() + timedelta(days=QUICK_ADD_DEADLINE_DAYS[markers["deadline"]])
+            new_todo.deadline = datetime.combine(deadline_date, time(18, 0)).isoformat()
         if tags:
             new_todo.tags = tags
         
         # Add the task
         self.todos.append(new_todo)
+        self._by_id[new_todo.id] = new_todo
         self.modified = True
+        self._todos_changed()
         self.save_todos()
         self.update_task_list()
         self.update_stats()
@@ -1540,7 +1928,7 @@ class TodoListWidget(QWidget):
         self.quick_add_edit.clear()
         
         # Emit signal for achievements
-        self.tasksChanged.emit()
+        self._emit_tasks_changed()
     
     def add_new_task(self):
         """Open the full task detail dialog to add a new task"""
@@ -1551,65 +1939,95 @@ class TodoListWidget(QWidget):
         if self.selected_category != "All":
             new_todo.category = self.selected_category
         
-        # Show detail dialog
-        dialog = TodoDetailDialog(new_todo, self.categories, self.theme, self)
+        # Show the shared detail dialog
+        dialog = TodoDetailDialog.get_shared(self, self.theme)
+        dialog.bind(new_todo, self.categories)
         dialog.todoUpdated.connect(self.on_new_task_added)
         dialog.exec_()
+        dialog.todoUpdated.disconnect(self.on_new_task_added)
     
     def on_new_task_added(self, new_todo):
         """Handle a new task created from the detail dialog"""
         self.todos.append(new_todo)
+        self._by_id[new_todo.id] = new_todo
+        if new_todo.completed:
+            self._completed_count += 1
         
         # Add new category if it doesn't exist
         if new_todo.category and new_todo.category not in self.categories:
             self.categories.append(new_todo.category)
         
         self.modified = True
+        self._todos_changed()
         self.save_todos()
-        self.update_task_list()
-        self.update_stats()
+        with self._freeze():
+            self.update_task_list()
+            self.update_stats()
         
         # Emit signal for achievements
-        self.tasksChanged.emit()
+        self._emit_tasks_changed()
     
-    def show_filter_menu(self):
-        """Show filter dropdown menu"""
-        menu = QMenu(self)
+    def build_filter_menu(self):
+        """Create the filter menu once; show_filter_menu only refreshes its check marks"""
+        self.filter_menu = QMenu(self)
         
         # Category submenu
-        categories_menu = QMenu("Categories", menu)
+        self.categories_menu = QMenu("Categories", self.filter_menu)
         
         # Add "All" option
-        all_action = QAction("All", categories_menu)
-        all_action.setCheckable(True)
-        all_action.setChecked(self.selected_category == "All")
-        all_action.triggered.connect(lambda: self.set_category_filter("All"))
-        categories_menu.addAction(all_action)
+        self.all_category_action = QAction("All", self.categories_menu)
+        self.all_category_action.setCheckable(True)
+        self.all_category_action.triggered.connect(lambda: self.set_category_filter("All"))
+        self.categories_menu.addAction(self.all_category_action)
         
-        categories_menu.addSeparator()
+        self.categories_menu.addSeparator()
         
-        # Add category options
-        for category in sorted(self.categories):
-            category_action = QAction(category, categories_menu)
-            category_action.setCheckable(True)
-            category_action.setChecked(self.selected_category == category)
-            category_action.triggered.connect(lambda checked, cat=category: self.set_category_filter(cat))
-            categories_menu.addAction(category_action)
+        # Category options are added by sync_category_actions
+        self.category_actions = {}
+        self._menu_categories = None
         
         # Add categories submenu
-        menu.addMenu(categories_menu)
+        self.filter_menu.addMenu(self.categories_menu)
         
-        menu.addSeparator()
+        self.filter_menu.addSeparator()
         
         # Show completed tasks option
-        completed_action = QAction("Show Completed Tasks", menu)
-        completed_action.setCheckable(True)
-        completed_action.setChecked(not self.filter_completed)
-        completed_action.triggered.connect(self.toggle_completed_filter)
-        menu.addAction(completed_action)
+        self.completed_action = QAction("Show Completed Tasks", self.filter_menu)
+        self.completed_action.setCheckable(True)
+        self.completed_action.triggered.connect(self.toggle_completed_filter)
+        self.filter_menu.addAction(self.completed_action)
+    
+    def sync_category_actions(self):
+        """Rebuild the category actions if the category list changed since the last show"""
+        categories = tuple(self.categories)
+        if categories == self._menu_categories:
+            return
+        self._menu_categories = categories
+        
+        for action in self.category_actions.values():
+            self.categories_menu.removeAction(action)
+            action.deleteLater()
+        self.category_actions = {}
+        
+        for category in sorted(categories):
+            category_action = QAction(category, self.categories_menu)
+            category_action.setCheckable(True)
+            category_action.triggered.connect(lambda checked, cat=category: self.set_category_filter(cat))
+            self.categories_menu.addAction(category_action)
+            self.category_actions[category] = category_action
+    
+    def show_filter_menu(self):
+        """Show filter dropdown menu"""
+        self.sync_category_actions()
+        
+        # Reflect the current filters
+        self.all_category_action.setChecked(self.selected_category == "All")
+        for category, action in self.category_actions.items():
+            action.setChecked(self.selected_category == category)
+        self.completed_action.setChecked(not self.filter_completed)
         
         # Show menu under the filter button
-        menu.exec_(self.filter_btn.mapToGlobal(
+        self.filter_menu.exec_(self.filter_btn.mapToGlobal(
             QPoint(0, self.filter_btn.height())))
     
     def set_category_filter(self, category):
@@ -1626,8 +2044,7 @@ class TodoListWidget(QWidget):
     
     def clear_completed_tasks(self):
         """Remove all completed tasks after confirmation"""
-        # Count completed tasks
-        completed_count = sum(1 for todo in self.todos if todo.completed)
+        completed_count = self._completed_count
         
         if completed_count == 0:
             QMessageBox.information(self, "No Completed Tasks", 
@@ -1645,46 +2062,65 @@ class TodoListWidget(QWidget):
         if reply == QMessageBox.Yes:
             # Remove completed tasks
             self.todos = [todo for todo in self.todos if not todo.completed]
+            self._by_id = {todo.id: todo for todo in self.todos}
+            self._completed_count = 0
             self.modified = True
+            self._todos_changed()
             self.save_todos()
-            self.update_task_list()
-            self.update_stats()
-            
-            # Emit signal for achievements
-            self.tasksChanged.emit()
+            with self._freeze():
+                self.update_task_list()
+                self.update_stats()
+                
+                # Emit signal for achievements, once the batch ends
+                self._emit_tasks_changed()
     
     def check_reminders(self):
         """Check for tasks with active reminders"""
-        # Don't check more than once per minute
-        current_time = datetime.now().strftime("%H:%M")
+        # Read the clock once for the whole pass
+        now = datetime.now()
+        current_minute = now.replace(second=0, microsecond=0)
         
         # Skip if already checked this minute
-        if hasattr(self, 'last_check_time') and self.last_check_time == current_time:
+        if self.last_check_time == current_minute:
             return
         
-        self.last_check_time = current_time
+        previous_check = self.last_check_time
+        self.last_check_time = current_minute
+        self.refresh_stale_rows(previous_check, now)
         
         # Check each task for reminders
-        reminders = []
-        for todo in self.todos:
-            if todo.should_remind():
-                reminders.append(todo)
+        reminders = [todo for todo in self.todos if todo.should_remind(now)]
         
         # Show notification if any reminders are due
         if reminders:
             self.show_reminders(reminders)
     
+    def refresh_stale_rows(self, since, now):
+        """Re-render rows whose date-relative labels or overdue styling changed since the last check"""
+        if since is None:
+            return
+        if since.date() != now.date():
+            # The date is part of update_task_list's render key, so this re-renders every kept row
+            self.update_task_list()
+            return
+        for todo_widget in self._widget_cache.values():
+            deadline_dt = todo_widget.todo.deadline_dt
+            if deadline_dt is not None and since < deadline_dt <= now:
+                todo_widget.set_todo(todo_widget.todo)
+    
+    def _parent_show_message(self):
+        """Return the parent's show_message method, or None if there isn't one"""
+        return getattr(self.parent(), 'show_message', None)
+    
     def show_reminders(self, reminder_tasks):
         """Show notification for tasks with reminders"""
-        # Use parent's show_message method if available
-        if self.parent() and hasattr(self.parent(), 'show_message'):
+        # Use parent's show_message method if available (looked up once; the widget can be reparented)
+        show_message = self._parent_show_message()
+        if show_message:
             if len(reminder_tasks) == 1:
-                task = reminder_tasks[0]
-                message = f"Reminder: {task.text}"
-                self.parent().show_message(message)
+                show_message(f"Reminder: {reminder_tasks[0].text}")
             else:
-                message = f"Reminder: {len(reminder_tasks)} tasks due"
-                self.parent().show_message(message)
+                show_message(f"Reminder: {len(reminder_tasks)} tasks due")
         else:
             # Fallback to message box
             if len(reminder_tasks) == 1:
@@ -1699,6 +2135,11 @@ class TodoListWidget(QWidget):
     
     def check_todos_on_startup(self):
         """Check for overdue or today's tasks on app startup"""
+        # The summary goes through the parent's show_message; without one the scan is wasted
+        show_message = self._parent_show_message()
+        if not show_message:
+            return
+        
         # Group tasks by status
         today = datetime.now().date()
         today_tasks = []
@@ -1708,59 +2149,58 @@ class TodoListWidget(QWidget):
             if todo.completed:
                 continue
                 
-            if todo.deadline:
-                try:
-                    deadline_dt = datetime.fromisoformat(todo.deadline)
-                    deadline_date = deadline_dt.date()
-                    
-                    if deadline_date < today:
-                        overdue_tasks.append(todo)
-                    elif deadline_date == today:
-                        today_tasks.append(todo)
-                except (ValueError, TypeError):
-                    pass
+            # Deadlines were parsed when the tasks were loaded
+            if todo.deadline_dt is not None:
+                deadline_date = todo.deadline_dt.date()
+                # Most deadlines are still ahead, so rule those out first
+                if deadline_date > today:
+                    continue
+                if deadline_date < today:
+                    overdue_tasks.append(todo)
+                else:
+                    today_tasks.append(todo)
         
         # Show summary message if there are tasks
-        if overdue_tasks or today_tasks:
-            # Use parent's show_message method if available
-            message = ""
-            if overdue_tasks:
-                message += f"{len(overdue_tasks)} task{'s' if len(overdue_tasks) > 1 else ''} overdue. "
-            if today_tasks:
-                message += f"{len(today_tasks)} task{'s' if len(today_tasks) > 1 else ''} due today."
-                
-            if self.parent() and hasattr(self.parent(), 'show_message'):
-                self.parent().show_message(message)
+        parts = []
+        if overdue_tasks:
+            count = len(overdue_tasks)
+            parts.append(f"{count} task{'s' if count > 1 else ''} overdue.")
+        if today_tasks:
+            count = len(today_tasks)
+            parts.append(f"{count} task{'s' if count > 1 else ''} due today.")
+        if parts:
+            show_message(" ".join(parts))
     
     def get_task_stats(self):
         """Get statistics about tasks for achievements"""
         total = len(self.todos)
-        completed = sum(1 for todo in self.todos if todo.completed)
-        today = datetime.now().date()
+        completed = self._completed_count
+        # One clock reading for both the today and overdue counts
+        now = datetime.now()
+        today = now.date()
         
-        # Count tasks completed today
+        # Count tasks completed today and overdue tasks in one pass
         completed_today = 0
+        overdue = 0
         for todo in self.todos:
-            if todo.completed and todo.completed_at:
-                try:
-                    completed_date = datetime.fromisoformat(todo.completed_at).date()
-                    if completed_date == today:
-                        completed_today += 1
-                except (ValueError, TypeError):
-                    pass
-        
-        # Count overdue tasks
-        overdue = sum(1 for todo in self.todos if todo.is_overdue())
-        
-        # Count tasks by category
-        categories = {}
-        for todo in self.todos:
-            cat = todo.category or "Uncategorized"
-            if cat not in categories:
-                categories[cat] = {"total": 0, "completed": 0}
-            categories[cat]["total"] += 1
             if todo.completed:
-                categories[cat]["completed"] += 1
+                if todo.completed_date == today:
+                    completed_today += 1
+            elif todo.deadline_dt is not None and todo.deadline_dt < now:
+                # Same test as TodoItem.is_overdue, inlined for the loop
+                overdue += 1
+        
+        # Category counts only change with the todos, so reuse them within a revision
+        if self._category_stats is None or self._category_stats[0] != self._rev:
+            categories = defaultdict(lambda: {"total": 0, "completed": 0})
+            for todo in self.todos:
+                counts = categories[todo.category or UNCATEGORIZED]
+                counts["total"] += 1
+                if todo.completed:
+                    counts["completed"] += 1
+            self._category_stats = (self._rev, categories)
+        # Hand out copies so callers can't alter the cached counts
+        categories = {cat: dict(counts) for cat, counts in self._category_stats[1].items()}
         
         return {
             "total": total,
@@ -1773,14 +2213,25 @@ class TodoListWidget(QWidget):
     
     def get_all_tags(self):
         """Get all unique tags from all tasks"""
-        tags = set()
-        for todo in self.todos:
-            if todo.tags:
-                tags.update(todo.tags)
-        return sorted(list(tags))
+        if self._all_tags_cache is None:
+            tags = set()
+            for todo in self.todos:
+                if todo.tags:
+                    tags.update(todo.tags)
+            self._all_tags_cache = sorted(tags, key=str.lower)
+        return self._all_tags_cache
+    
+    def get_tags_model(self):
+        """Return the tag model shared by detail dialog completers, refreshed if tags changed"""
+        tags = self.get_all_tags()
+        if self._tags_model is None:
+            self._tags_model = QStringListModel(tags, self)
+        elif tags is not self._tags_model_source:
+            self._tags_model.setStringList(tags)
+        self._tags_model_source = tags
+        return self._tags_model
     
     def closeEvent(self, event):
-        """Save todos before closing"""
-        if self.modified:
-            self.save_todos()
+        """Save todos before closing; the write finishes in the background"""
+        self.flush_pending_save()
         super().closeEvent(event)
\ No newline at end of file
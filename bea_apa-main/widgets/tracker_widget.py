@@ -1,55 +1,211 @@
 import sys
 import random
 import json
+import logging
 import os
 from datetime import datetime, timedelta
-from PyQt5.QtCore import Qt, QTimer, QPointF, QRectF, QPropertyAnimation, QVariantAnimation, QEasingCurve
-from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QFont, QPen, QPainterPath, QBrush, QIcon, QFontDatabase
+from PyQt5.QtCore import (Qt, QTimer, QPointF, QRect, QRectF, QPropertyAnimation, QVariantAnimation,
+                          QEasingCurve, QElapsedTimer)
+from PyQt5.QtGui import (QPainter, QColor, QLinearGradient, QFont, QPen, QPainterPath, QBrush, QIcon,
+                         QFontDatabase, QPixmap, QStaticText, QTransform)
 from PyQt5.QtWidgets import (QApplication, QLabel, QWidget, QVBoxLayout, QMenu, 
-                             QGraphicsDropShadowEffect, QHBoxLayout, QPushButton, 
+                             QHBoxLayout, QPushButton, 
                              QDesktopWidget, QSizePolicy)
 from utils import resource_path
+from core.settings_manager import write_settings_file
+
+logger = logging.getLogger(__name__)
+
+# --- Colour palettes ---
+# An Apple-like light design on macOS; the darker theme everywhere else.
+_ACCENT = QColor(0, 122, 255)
+
+_PALETTE_DARWIN = {
+    'bg_color': QColor(245, 245, 245),
+    'accent_color': _ACCENT,
+    'secondary_accent': _ACCENT.lighter(110),
+    'bar_color': QColor(0, 0, 0, 180),
+    'text_color': QColor(20, 20, 20),
+    'muted_text_color': QColor(120, 120, 120),
+    'highlight_color': QColor(20, 20, 20),
+}
+
+_PALETTE_DEFAULT = {
+    'bg_color': QColor(40, 40, 45),
+    'accent_color': _ACCENT,
+    'secondary_accent': QColor(88, 86, 214),
+    'bar_color': QColor(255, 255, 255, 180),
+    'text_color': QColor(255, 255, 255),
+    'muted_text_color': QColor(180, 180, 180),
+    'highlight_color': QColor(255, 255, 255),
+}
+
+_ADD_BUTTON_QSS = """
+    QPushButton {{
+        background-color: {normal};
+        color: white;
+        font-weight: bold;
+        font-size: 14px;
+        border-radius: 11px;
+        border: none;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed};
+    }}
+"""
+_ADD_BUTTON_QSS_DARWIN = _ADD_BUTTON_QSS.format(
+    normal=_ACCENT.name(), hover=_ACCENT.lighter(120).name(), pressed=_ACCENT.darker(110).name())
+_ADD_BUTTON_QSS_DEFAULT = _ADD_BUTTON_QSS.format(
+    normal=_ACCENT.name(), hover="#1a86ff", pressed="#0062cc")
+
+_CONTEXT_MENU_QSS_DARWIN = """
+    QMenu {
+        background-color: #ffffff;
+        border: 1px solid #ccc;
+        border-radius: 8px;
+        padding: 5px;
+        color: #000;
+    }
+    QMenu::item {
+        padding: 8px 25px;
+        border-radius: 5px;
+    }
+    QMenu::item:selected {
+        background-color: #e5f1fb;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #ddd;
+        margin: 4px 10px;
+    }
+"""
+_CONTEXT_MENU_QSS_DEFAULT = """
+    QMenu {
+        background-color: #333333;
+        border-radius: 10px;
+        padding: 5px;
+        color: white;
+    }
+    QMenu::item {
+        padding: 8px 25px;
+        border-radius: 5px;
+    }
+    QMenu::item:selected {
+        background-color: #0a84ff;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #444444;
+        margin: 4px 10px;
+    }
+"""
+
+# Drop shadow baked into the static cache (matches the old QGraphicsDropShadowEffect)
+_SHADOW_COLOR = QColor(0, 0, 0, 80)
+_SHADOW_BLUR = 20
+_SHADOW_OFFSET = (0, 5)
+_SHADOW_STEPS = 5
+
+# Parsed settings files by path, as (file_version, settings); re-read only after the file changes
+_settings_cache = {}
+
+
+def file_version(path):
+    """Identify the current contents of path without reading it.
+    
+    mtime alone can repeat for two writes within one timestamp tick (about 15 ms on NTFS);
+    every save replaces the file via os.replace, which always gives it a new inode.
+    """
+    st = os.stat(path)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def read_settings(path):
+    """Return the parsed settings file at path, parsing it again only if it changed on disk"""
+    version = file_version(path)
+    cached = _settings_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        settings = json.load(f)
+    _settings_cache[path] = (version, settings)
+    return settings
 
 class WaterLevelWidget(QWidget):
     def __init__(self, parent=None, settings_path="settings.json"):
         super().__init__(parent)
         self.settings_path = settings_path
+        # Changes made by log_drink/reset_today that settings_flush_timer hasn't written yet
+        self._pending_settings = {}
         self.days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         
         self.animation_progress = 0
-        self.bar_animations = []
         self.percentage_animation = None
         
+        # All seven bars ease together, stepped by animation_timer (see animate_bars)
+        self._bars_animating = False
+        self._bar_anim_start = [0.0] * 7
+        self._bar_anim_targets = [0.0] * 7
+        self._bar_anim_duration = 800
+        self._bar_anim_curve = QEasingCurve(QEasingCurve.OutQuart)
+        self._bar_anim_clock = QElapsedTimer()
+        
         self.percentage = 0
         self.animated_percentage = 0
         self.old_percentage = 0
         
-        # --- Set color palette ---
-        # For an Apple-like design on macOS, we use a light background with dark text.
-        # Otherwise, we retain the darker theme.
-        if sys.platform == "darwin":
-            self.bg_color = QColor(245, 245, 245)
-            self.accent_color = QColor(0, 122, 255)
-            self.secondary_accent = QColor(0, 122, 255).lighter(110)
-            self.bar_color = QColor(0, 0, 0, 180)
-            self.text_color = QColor(20, 20, 20)
-            self.muted_text_color = QColor(120, 120, 120)
-            self.highlight_color = QColor(20, 20, 20)
-        else:
-            self.bg_color = QColor(40, 40, 45)
-            self.accent_color = QColor(0, 122, 255)
-            self.secondary_accent = QColor(88, 86, 214)
-            self.bar_color = QColor(255, 255, 255, 180)
-            self.text_color = QColor(255, 255, 255)
-            self.muted_text_color = QColor(180, 180, 180)
-            self.highlight_color = QColor(255, 255, 255)
+        # Background, title, guides, empty bars and day labels, rendered once per layout
+        self._static_cache = None
+        self._static_today = None
+        # Repaint regions, filled in by calculate_layout
+        self._bar_rects = [QRect()] * 7
+        self._stats_rect = QRect()
+        # (today's count, goal) as last passed to update_stats
+        self._shown_stats = None
+        # Progress arc as a path, rebuilt when the shown percentage changes
+        self._arc_rect = QRectF()
+        self._arc_path = QPainterPath()
+        self._arc_path_value = None
+        # "of {target}" label, laid out again only when the goal or font changes
+        self._goal_static = QStaticText()
+        self._goal_static.setTextFormat(Qt.PlainText)
+        self._goal_static_target = None
+        # Today's count and the percentage, laid out again only when the shown number changes
+        self._drinks_static = QStaticText()
+        self._drinks_static.setTextFormat(Qt.PlainText)
+        self._drinks_static_value = None
+        self._percent_static = QStaticText()
+        self._percent_static.setTextFormat(Qt.PlainText)
+        self._percent_static_value = None
         
-        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
-        self.setAttribute(Qt.WA_NoSystemBackground, False)
+        # --- Set color palette ---
+        # The palettes are built once per process; the colours are shared, never modified.
+        palette = _PALETTE_DARWIN if sys.platform == "darwin" else _PALETTE_DEFAULT
+        self.bg_color = palette['bg_color']
+        self.accent_color = palette['accent_color']
+        self.secondary_accent = palette['secondary_accent']
+        self.bar_color = palette['bar_color']
+        self.text_color = palette['text_color']
+        self.muted_text_color = palette['muted_text_color']
+        self.highlight_color = palette['highlight_color']
+        
+        self.build_paint_resources()
+        
+        # paintEvent always covers the whole widget from the static cache, so Qt can skip erasing first
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        if sys.platform == 'win32':
+            # The window is opaque on Windows; resizes don't invalidate what was already drawn
+            self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            self.setAttribute(Qt.WA_StaticContents, True)
         
         self.load_fonts()
-        self.load_settings()
-        self.load_hydration_data()
+        self._data_key = self._current_data_key()
+        settings = self._get_settings()
+        self.load_settings(settings)
+        self.load_hydration_data(settings)
         self.update_stats()
         
         self.setMinimumSize(270, 140)
@@ -62,7 +218,6 @@ class WaterLevelWidget(QWidget):
         else:
             self.setAttribute(Qt.WA_TranslucentBackground)
         
-        self.apply_shadow()
         self.create_add_button()
         
         try:
@@ -87,7 +242,31 @@ class WaterLevelWidget(QWidget):
         
         self.animate_bars()
     
+    def build_paint_resources(self):
+        """Create the bar fills and arc pen once; paintEvent reuses them every frame"""
+        # The subtle bar gradient is part of the macOS look; elsewhere a flat fill is cheaper to raster
+        self._use_gradients = sys.platform == "darwin"
+        if self._use_gradients:
+            # Gradients in bounding-box coordinates stretch over whatever bar height is drawn
+            self._today_fill = QLinearGradient(0, 0, 0, 1)
+            self._today_fill.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+            self._today_fill.setColorAt(0, self.accent_color.lighter(110))
+            self._today_fill.setColorAt(1, self.accent_color)
+            self._other_fill = QLinearGradient(0, 0, 0, 1)
+            self._other_fill.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+            self._other_fill.setColorAt(0, self.secondary_accent.lighter(120))
+            self._other_fill.setColorAt(1, self.secondary_accent)
+        else:
+            self._today_fill = QBrush(self.accent_color)
+            self._other_fill = QBrush(self.secondary_accent)
+        self._arc_pen = QPen(self.accent_color, 3)
+    
     def load_fonts(self):
+        self._static_cache = None
+        if hasattr(self, '_goal_static'):
+            self._goal_static_target = None
+            self._drinks_static_value = None
+            self._percent_static_value = None
         self.title_font = QFont("SF Pro Display", 11, QFont.DemiBold)
         self.day_font = QFont("SF Pro Text", 9)
         self.stats_font = QFont("SF Pro Display", 18, QFont.Bold)
@@ -113,55 +292,34 @@ class WaterLevelWidget(QWidget):
                 self.stats_font = QFont("Ubuntu", 18, QFont.Bold)
                 self.small_stats_font = QFont("Ubuntu", 10)
     
-    def apply_shadow(self):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 5)
-        self.setGraphicsEffect(shadow)
+    def paint_shadow(self, painter, rect):
+        """Bake a soft drop shadow under the card into the static cache.
+        
+        Replaces a QGraphicsDropShadowEffect, which re-rendered the whole widget offscreen on
+        every repaint. Stacked translucent rounded rects stand in for the blur.
+        """
+        shadow_rect = rect.translated(*_SHADOW_OFFSET)
+        color = QColor(_SHADOW_COLOR)
+        color.setAlpha(_SHADOW_COLOR.alpha() // _SHADOW_STEPS)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        for step in range(_SHADOW_STEPS, 0, -1):
+            grow = _SHADOW_BLUR / 2 * step / _SHADOW_STEPS
+            painter.drawRoundedRect(shadow_rect.adjusted(-grow, -grow, grow, grow), 16 + grow, 16 + grow)
     
     def create_add_button(self):
         self.add_button = QPushButton("+", self)
         self.add_button.setFixedSize(22, 22)
         # Use refined styling on macOS
         if sys.platform == "darwin":
-            self.add_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.accent_color.name()};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 14px;
-                    border-radius: 11px;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.accent_color.lighter(120).name()};
-                }}
-                QPushButton:pressed {{
-                    background-color: {self.accent_color.darker(110).name()};
-                }}
-            """)
+            self.add_button.setStyleSheet(_ADD_BUTTON_QSS_DARWIN)
         else:
-            self.add_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.accent_color.name()};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 14px;
-                    border-radius: 11px;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background-color: #1a86ff;
-                }}
-                QPushButton:pressed {{
-                    background-color: #0062cc;
-                }}
-            """)
+            self.add_button.setStyleSheet(_ADD_BUTTON_QSS_DEFAULT)
         self.add_button.clicked.connect(self.log_drink)
         self.add_button.setCursor(Qt.PointingHandCursor)
     
     def calculate_layout(self):
+        self._static_cache = None
         width = self.width()
         height = self.height()
         
@@ -206,58 +364,98 @@ class WaterLevelWidget(QWidget):
             'percent_rect': QRectF(stats_x + stats_width / 2 - 40, height * 0.7 + 16 + 5, 80, 20)
         }
         
+        # Per-bar geometry, reused by every paint
+        self._bar_x = [chart_left + i * (bar_width + bar_spacing) for i in range(7)]
+        self._bar_bg_rects = [QRectF(x, chart_top, bar_width, chart_height) for x in self._bar_x]
+        self._day_label_rects = [QRectF(x - bar_spacing/4, chart_bottom + 5, bar_width + bar_spacing/2, 20)
+                                 for x in self._bar_x]
+        
+        # Repaint regions: one column per bar, and the counter/arc/percentage block
+        self._bar_rects = [rect.toAlignedRect().adjusted(-1, -1, 1, 1) for rect in self._bar_bg_rects]
+        stats = self.layout['stats']
+        arc_radius = stats['arc_radius']
+        # Same whole-pixel box the arc track is drawn in
+        self._arc_rect = QRectF(int(stats['arc_center_x'] - arc_radius), int(stats['arc_center_y'] - arc_radius),
+                                int(arc_radius * 2), int(arc_radius * 2))
+        self._arc_path_value = None
+        self._stats_rect = (stats['counter_rect'].united(stats['label_rect'])
+                            .united(self._arc_rect.adjusted(-3, -3, 3, 3))
+                            .united(stats['percent_rect']).toAlignedRect())
+        
         self.add_button.move(int(self.layout['add_button_pos'].x()), int(self.layout['add_button_pos'].y()))
     
     def setup_timers(self):
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_display)
+        # Also catches changes that don't emit history_updated (daily reset, goal edits);
+        # refresh_data returns early when settings.json and the date are unchanged
         self.update_timer.start(60000)
         
+        # Runs only while the bars animate (started by animate_bars, stopped by update_animations)
         self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(33)
         self.animation_timer.timeout.connect(self.update_animations)
-        self.animation_timer.start(33)
+        
+        # Coalesces rapid log/reset clicks into a single settings.json write
+        self.settings_flush_timer = QTimer(self)
+        self.settings_flush_timer.setSingleShot(True)
+        self.settings_flush_timer.setInterval(250)
+        self.settings_flush_timer.timeout.connect(self.flush_settings)
+        QApplication.instance().aboutToQuit.connect(self.flush_pending_settings)
     
     def position_widget(self):
         desktop = QDesktopWidget().availableGeometry()
         self.move(desktop.width() - self.width() - 20, desktop.height() - self.height() - 40)
     
-    def load_settings(self):
+    def _get_settings(self):
+        """Parsed settings shared by load_settings and load_hydration_data; None if unavailable.
+        
+        Includes any unwritten changes. Make changes through change_settings(), not on the dict.
+        """
+        if not os.path.exists(self.settings_path):
+            return None
         try:
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, "r") as f:
-                    settings = json.load(f)
+            settings = read_settings(self.settings_path)
+            # Re-applied every time, in case the file was reloaded after another writer saved it
+            settings.update(self._pending_settings)
+            return settings
+        except Exception as e:
+            logger.error("Error reading settings: %s", e)
+            return None
+    
+    def load_settings(self, settings):
+        try:
+            if settings is not None:
                 self.target_drinks = settings.get("daily_goal", 8)
                 if not isinstance(self.target_drinks, int) or self.target_drinks <= 0:
                     self.target_drinks = 8
                 self.current_log_count = settings.get("log_count", 0)
                 if not isinstance(self.current_log_count, int) or self.current_log_count < 0:
                     self.current_log_count = 0
-                print(f"Loaded settings: target={self.target_drinks}, current={self.current_log_count}")
+                logger.debug("Loaded settings: target=%s, current=%s", self.target_drinks, self.current_log_count)
             else:
                 self.target_drinks = 8
                 self.current_log_count = 0
-                print(f"Settings file not found: {self.settings_path}, using defaults")
+                logger.debug("Settings not available: %s, using defaults", self.settings_path)
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            logger.error("Error loading settings: %s", e)
             self.target_drinks = 8
             self.current_log_count = 0
     
-    def load_hydration_data(self):
+    def load_hydration_data(self, settings):
         try:
             self.drink_data = [0] * 7
             self.bar_targets = [0] * 7
             
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
+            if settings is not None:
                 history = settings.get("history", {})
                 if not isinstance(history, dict):
-                    print(f"Invalid history data format: {type(history)}, using defaults")
+                    logger.warning("Invalid history data format: %s, using defaults", type(history))
                     history = {}
                 
                 today = datetime.now().date()
                 current_weekday = today.weekday()
-                print(f"Current weekday: {current_weekday}, today: {today}")
+                logger.debug("Current weekday: %s, today: %s", current_weekday, today)
                 
                 for i in range(7):
                     day_offset = i - current_weekday
@@ -274,19 +472,28 @@ class WaterLevelWidget(QWidget):
                             history_count = 0
                         self.drink_data[i] = history_count
                     self.bar_targets[i] = self.drink_data[i]
-                print(f"Loaded drink data: {self.drink_data}")
+                logger.debug("Loaded drink data: %s", self.drink_data)
             else:
-                print(f"Settings file not found: {self.settings_path}, using sample data")
+                logger.debug("Settings not available: %s, using sample data", self.settings_path)
                 self.drink_data = [3, 4, 5, 4, 6, 5, 4]
                 self.bar_targets = self.drink_data.copy()
         except Exception as e:
-            print(f"Error loading hydration data: {e}")
+            logger.error("Error loading hydration data: %s", e)
             self.drink_data = [3, 4, 5, 4, 6, 5, 4]
             self.bar_targets = self.drink_data.copy()
         
         self.animated_values = self.drink_data.copy()
+        self.update_fill_fractions()
         self.old_percentage = getattr(self, 'percentage', 0)
     
+    def update_fill_fractions(self):
+        """Recompute how full each bar is (0..1) from animated_values and the daily goal"""
+        target = self.target_drinks
+        if target > 0:
+            self._fill_fractions = [min(1.0, value / target) for value in self.animated_values]
+        else:
+            self._fill_fractions = [0] * 7
+    
     def update_stats(self):
         self.total_drinks = sum(self.drink_data)
         self.weekly_target = 7 * self.target_drinks
@@ -309,66 +516,113 @@ class WaterLevelWidget(QWidget):
         self.percentage_animation.setEndValue(self.percentage)
         self.percentage_animation.setDuration(800)
         self.percentage_animation.setEasingCurve(QEasingCurve.OutQuart)
-        self.percentage_animation.valueChanged.connect(lambda value: self._update_percentage(value))
+        self.percentage_animation.valueChanged.connect(self._update_percentage)
         self.percentage_animation.start()
         
-        print(f"Stats updated: today's drinks={today_drinks}, target={self.target_drinks}, percentage={self.percentage}%")
+        # _update_percentage repaints only when the percentage moves, so repaint here for
+        # count/goal changes that leave it the same; a new goal also rescales every bar
+        shown = (today_drinks, self.target_drinks)
+        if shown != self._shown_stats:
+            if self._shown_stats is not None and shown[1] != self._shown_stats[1]:
+                self.update()
+            else:
+                self.update(self._stats_rect)
+            self._shown_stats = shown
+        
+        logger.debug("Stats updated: today's drinks=%s, target=%s, percentage=%s%%",
+                     today_drinks, self.target_drinks, self.percentage)
     
     def _update_percentage(self, value):
-        self.animated_percentage = value
-    
-    def animate_bars(self):
-        for anim in self.bar_animations:
-            if anim is not None:
-                anim.stop()
-        self.bar_animations = []
-        
-        for i, target in enumerate(self.bar_targets):
-            animation = QVariantAnimation()
-            animation.setStartValue(self.animated_values[i])
-            animation.setEndValue(float(target))
-            animation.setDuration(800)
-            animation.setEasingCurve(QEasingCurve.OutQuart)
-            
-            def create_update_function(idx):
-                return lambda value: self._update_bar_value(idx, value)
-            animation.valueChanged.connect(create_update_function(i))
-            animation.start()
-            self.bar_animations.append(animation)
+        # Only whole percentages are shown, so frames that don't change it need no repaint
+        value = int(value)
+        if value != self.animated_percentage:
+            self.animated_percentage = value
+            self.update(self._stats_rect)
     
-    def _update_bar_value(self, idx, value):
-        self.animated_values[idx] = value
-        self.update()
+    def animate_bars(self, duration=800, easing=QEasingCurve.OutQuart):
+        """Ease every bar from its current value to its target"""
+        self._bar_anim_start = [float(value) for value in self.animated_values]
+        self._bar_anim_targets = [float(target) for target in self.bar_targets]
+        self._bar_anim_duration = duration
+        self._bar_anim_curve = QEasingCurve(easing)
+        self._bar_anim_clock.start()
+        self._bars_animating = True
+        self.animation_timer.start()
     
     def update_animations(self):
-        needs_update = any(anim and anim.state() == QVariantAnimation.Running for anim in self.bar_animations)
-        if needs_update or (self.percentage_animation and self.percentage_animation.state() == QVariantAnimation.Running):
-            self.update()
+        # The percentage animation repaints its own area through _update_percentage
+        if not self._bars_animating:
+            self.animation_timer.stop()
+            return
+        
+        progress = min(1.0, self._bar_anim_clock.elapsed() / self._bar_anim_duration)
+        eased = self._bar_anim_curve.valueForProgress(progress)
+        goal = self.target_drinks
+        dirty = QRect()
+        for i, (start, target) in enumerate(zip(self._bar_anim_start, self._bar_anim_targets)):
+            if start != target:
+                value = start + (target - start) * eased
+                self.animated_values[i] = value
+                self._fill_fractions[i] = min(1.0, value / goal) if goal > 0 else 0
+                dirty = dirty.united(self._bar_rects[i])
+        if progress >= 1.0:
+            self._bars_animating = False
+            self.animation_timer.stop()
+        
+        if not dirty.isEmpty():
+            self.update(dirty)
     
     def update_display(self):
         self.refresh_data()
     
-    def refresh_data(self):
+    def _current_data_key(self):
+        """What the loaded data depends on: the settings file version and today's date"""
+        try:
+            version = file_version(self.settings_path)
+        except OSError:
+            version = None
+        return (version, datetime.now().date())
+    
+    def refresh_data(self, force=False):
+        """Reload from settings.json; skipped when neither the file nor the date has changed.
+        
+        Pass force=True after changing the in-memory settings that haven't been flushed yet.
+        """
+        data_key = self._current_data_key()
+        if not force and data_key == self._data_key:
+            return
+        self._data_key = data_key
+        
         old_values = self.drink_data.copy()
         old_animated_values = self.animated_values.copy()
         old_percentage = self.animated_percentage
         
-        self.load_settings()
-        self.load_hydration_data()
+        settings = self._get_settings()
+        self.load_settings(settings)
+        self.load_hydration_data(settings)
         self.update_stats()
         
         if old_values != self.drink_data:
             self.animated_values = old_animated_values
+            self.update_fill_fractions()
             self.animate_bars()
     
-    def paintEvent(self, event):
+    def resizeEvent(self, event):
+        self._static_cache = None
+        super().resizeEvent(event)
+    
+    def _rebuild_static_cache(self, today_index):
+        """Render everything that doesn't animate (background, title, guides, empty bars, day labels)"""
         width = self.width()
         height = self.height()
         
-        if not hasattr(self, 'layout'):
-            self.calculate_layout()
+        ratio = self.devicePixelRatioF()
+        cache = QPixmap(int(width * ratio), int(height * ratio))
+        cache.setDevicePixelRatio(ratio)
+        # Opaque on Windows (WA_OpaquePaintEvent), so the rounded corners must not show stale pixels
+        cache.fill(self.bg_color if sys.platform == 'win32' else Qt.transparent)
         
-        painter = QPainter(self)
+        painter = QPainter(cache)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         
@@ -376,6 +630,10 @@ class WaterLevelWidget(QWidget):
         path = QPainterPath()
         path.addRoundedRect(rect, 16, 16)
         
+        if sys.platform != 'win32':
+            # The Windows window is opaque, so a shadow would never show there
+            self.paint_shadow(painter, rect)
+        
         painter.setPen(Qt.NoPen)
         if sys.platform == 'win32':
             painter.setBrush(QBrush(self.bg_color))
@@ -412,73 +670,105 @@ class WaterLevelWidget(QWidget):
         for guide in [chart_top, chart_top + chart_height * 0.5, chart_bottom]:
             painter.drawLine(int(chart_left), int(guide), int(chart_left + chart_width - 16), int(guide))
         
-        bar_width = self.layout['bars']['width']
-        bar_spacing = self.layout['bars']['spacing']
-        
-        today_index = datetime.now().weekday()
+        # Empty bar backgrounds and day labels.
+        empty_gradient = QLinearGradient(0, chart_top, 0, chart_bottom)
+        empty_gradient.setColorAt(0, QColor(100, 100, 100, 30))
+        empty_gradient.setColorAt(1, QColor(80, 80, 80, 30))
+        painter.setFont(self.day_font)
         for i in range(7):
-            x = chart_left + i * (bar_width + bar_spacing)
-            max_bar_height = chart_height
-            value = self.animated_values[i]
-            fill_percentage = min(1.0, value / self.target_drinks) if self.target_drinks > 0 else 0
-            bar_height = fill_percentage * max_bar_height
-            
-            bg_bar_rect = QRectF(x, chart_top, bar_width, max_bar_height)
-            empty_gradient = QLinearGradient(0, chart_top, 0, chart_bottom)
-            empty_gradient.setColorAt(0, QColor(100, 100, 100, 30))
-            empty_gradient.setColorAt(1, QColor(80, 80, 80, 30))
             painter.setBrush(empty_gradient)
             painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(bg_bar_rect, 3, 3)
+            painter.drawRoundedRect(self._bar_bg_rects[i], 3, 3)
             
-            if bar_height > 0:
-                fill_bar_rect = QRectF(x, chart_bottom - bar_height, bar_width, bar_height)
-                fill_gradient = QLinearGradient(0, chart_bottom - bar_height, 0, chart_bottom)
-                if i == today_index:
-                    fill_gradient.setColorAt(0, self.accent_color.lighter(110))
-                    fill_gradient.setColorAt(1, self.accent_color)
-                else:
-                    fill_gradient.setColorAt(0, self.secondary_accent.lighter(120))
-                    fill_gradient.setColorAt(1, self.secondary_accent)
-                painter.setBrush(fill_gradient)
-                painter.drawRoundedRect(fill_bar_rect, 3, 3)
+            painter.setPen(self.text_color if i == today_index else self.muted_text_color)
+            painter.drawText(self._day_label_rects[i], Qt.AlignCenter, self.days[i])
+        
+        # Track of the circular progress arc.
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QPen(QColor(100, 100, 100, 100), 3))
+        painter.drawEllipse(self._arc_rect)
+        
+        painter.end()
+        self._static_cache = cache
+        self._static_today = today_index
+    
+    @staticmethod
+    def _draw_static_centered(painter, rect, static_text):
+        """Draw a prepared QStaticText centred in rect (like drawText with Qt.AlignCenter)"""
+        size = static_text.size()
+        painter.drawStaticText(QPointF(rect.center().x() - size.width() / 2,
+                                       rect.center().y() - size.height() / 2), static_text)
+    
+    def paintEvent(self, event):
+        if not hasattr(self, 'layout'):
+            self.calculate_layout()
+        
+        today_index = datetime.now().weekday()
+        if (self._static_cache is None or self._static_today != today_index
+                or self._static_cache.devicePixelRatio() != self.devicePixelRatioF()):
+            self._rebuild_static_cache(today_index)
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._static_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Filled portion of each bar.
+        chart_bottom = self.layout['chart']['bottom']
+        chart_height = self.layout['chart']['height']
+        bar_width = self.layout['bars']['width']
+        bar_x = self._bar_x
+        
+        dirty = event.rect()
+        painter.setPen(Qt.NoPen)
+        for i, fill_fraction in enumerate(self._fill_fractions):
+            if not dirty.intersects(self._bar_rects[i]):
+                continue
+            bar_height = fill_fraction * chart_height
             
-            painter.setPen(self.muted_text_color)
-            painter.setFont(self.day_font)
-            day_label_rect = QRectF(x - bar_spacing/4, chart_bottom + 5, bar_width + bar_spacing/2, 20)
-            if i == today_index:
-                painter.setPen(self.text_color)
-            painter.drawText(day_label_rect, Qt.AlignCenter, self.days[i])
+            # Under half a pixel of fill wouldn't show, so don't rasterize it
+            if bar_height >= 0.5:
+                fill_bar_rect = QRectF(bar_x[i], chart_bottom - bar_height, bar_width, bar_height)
+                painter.setBrush(self._today_fill if i == today_index else self._other_fill)
+                painter.drawRoundedRect(fill_bar_rect, 3, 3)
+        
+        if not dirty.intersects(self._stats_rect):
+            return
         
         # Draw stats (today's count and circular progress).
         stats = self.layout['stats']
         today_drinks = self.drink_data[today_index] if 0 <= today_index < len(self.drink_data) else 0
-        drinks_text = f"{today_drinks}"
         
         painter.setPen(self.text_color)
         painter.setFont(self.stats_font)
-        painter.drawText(stats['counter_rect'], Qt.AlignCenter, drinks_text)
+        if self._drinks_static_value != today_drinks:
+            self._drinks_static.setText(f"{today_drinks}")
+            self._drinks_static.prepare(QTransform(), self.stats_font)
+            self._drinks_static_value = today_drinks
+        self._draw_static_centered(painter, stats['counter_rect'], self._drinks_static)
         
         painter.setPen(self.muted_text_color)
         painter.setFont(self.small_stats_font)
-        painter.drawText(stats['label_rect'], Qt.AlignCenter, f"of {self.target_drinks}")
-        
-        # Draw circular progress arc.
-        arc_center_x = stats['arc_center_x']
-        arc_center_y = stats['arc_center_y']
-        arc_radius = stats['arc_radius']
-        painter.setPen(QPen(QColor(100, 100, 100, 100), 3))
-        painter.drawEllipse(int(arc_center_x - arc_radius), int(arc_center_y - arc_radius), 
-                            int(arc_radius * 2), int(arc_radius * 2))
-        painter.setPen(QPen(self.accent_color, 3))
-        start_angle = 90 * 16
-        span_angle = -int(3.6 * 16 * self.animated_percentage)
-        painter.drawArc(int(arc_center_x - arc_radius), int(arc_center_y - arc_radius),
-                        int(arc_radius * 2), int(arc_radius * 2), start_angle, span_angle)
+        if self._goal_static_target != self.target_drinks:
+            self._goal_static.setText(f"of {self.target_drinks}")
+            self._goal_static.prepare(QTransform(), self.small_stats_font)
+            self._goal_static_target = self.target_drinks
+        self._draw_static_centered(painter, stats['label_rect'], self._goal_static)
+        
+        # Draw circular progress arc, swept again only when the whole percentage changes.
+        shown_percent = self.animated_percentage
+        if self._arc_path_value != shown_percent:
+            self._arc_path = QPainterPath()
+            self._arc_path.arcMoveTo(self._arc_rect, 90)
+            self._arc_path.arcTo(self._arc_rect, 90, -3.6 * shown_percent)
+            self._arc_path_value = shown_percent
+        painter.strokePath(self._arc_path, self._arc_pen)
         painter.setPen(self.text_color)
         painter.setFont(self.small_stats_font)
-        percent_text = f"{int(self.animated_percentage)}%"
-        painter.drawText(stats['percent_rect'], Qt.AlignCenter, percent_text)
+        if self._percent_static_value != shown_percent:
+            self._percent_static.setText(f"{shown_percent}%")
+            self._percent_static.prepare(QTransform(), self.small_stats_font)
+            self._percent_static_value = shown_percent
+        self._draw_static_centered(painter, stats['percent_rect'], self._percent_static)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -500,48 +790,9 @@ class WaterLevelWidget(QWidget):
         menu = QMenu(self)
         # Use an Apple-like (light) context menu on macOS.
         if sys.platform == "darwin":
-            menu.setStyleSheet("""
-                QMenu {
-                    background-color: #ffffff;
-                    border: 1px solid #ccc;
-                    border-radius: 8px;
-                    padding: 5px;
-                    color: #000;
-                }
-                QMenu::item {
-                    padding: 8px 25px;
-                    border-radius: 5px;
-                }
-                QMenu::item:selected {
-                    background-color: #e5f1fb;
-                }
-                QMenu::separator {
-                    height: 1px;
-                    background-color: #ddd;
-                    margin: 4px 10px;
-                }
-            """)
+            menu.setStyleSheet(_CONTEXT_MENU_QSS_DARWIN)
         else:
-            menu.setStyleSheet("""
-                QMenu {
-                    background-color: #333333;
-                    border-radius: 10px;
-                    padding: 5px;
-                    color: white;
-                }
-                QMenu::item {
-                    padding: 8px 25px;
-                    border-radius: 5px;
-                }
-                QMenu::item:selected {
-                    background-color: #0a84ff;
-                }
-                QMenu::separator {
-                    height: 1px;
-                    background-color: #444444;
-                    margin: 4px 10px;
-                }
-            """)
+            menu.setStyleSheet(_CONTEXT_MENU_QSS_DEFAULT)
         
         refresh_action = menu.addAction("Refresh Data")
         menu.addSeparator()
@@ -553,56 +804,58 @@ class WaterLevelWidget(QWidget):
         if action == hide_action:
             self.start_fade_out()
         elif action == refresh_action:
-            self.refresh_data()
+            self.refresh_data(force=True)
         elif action == reset_action:
             self.reset_today()
     
+    def change_settings(self, values):
+        """Apply values to the settings now and write them to disk shortly, merging rapid changes"""
+        self._pending_settings.update(values)
+        self.settings_flush_timer.start()
+    
+    def flush_settings(self):
+        # Re-read so a save by another writer since the change is kept, then re-apply ours on top
+        settings = self._get_settings()
+        if settings is None:
+            return
+        try:
+            write_settings_file(self.settings_path, settings)
+            _settings_cache[self.settings_path] = (file_version(self.settings_path), settings)
+            self._pending_settings.clear()
+        except Exception as e:
+            logger.error("Error saving settings: %s", e)
+    
+    def flush_pending_settings(self):
+        """Write any change still waiting on settings_flush_timer (e.g. on quit)"""
+        if self.settings_flush_timer.isActive():
+            self.settings_flush_timer.stop()
+            self.flush_settings()
+    
     def reset_today(self):
         try:
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, "r") as f:
-                    settings = json.load(f)
-                settings["log_count"] = 0
-                with open(self.settings_path, "w") as f:
-                    json.dump(settings, f, indent=4)
-                self.refresh_data()
+            if self._get_settings() is not None:
+                self.change_settings({"log_count": 0})
+                self.refresh_data(force=True)
         except Exception as e:
-            print(f"Error resetting count: {e}")
+            logger.error("Error resetting count: %s", e)
     
     def log_drink(self):
         # Delegate to parent's log_drink if available.
         if self.parent() is not None and hasattr(self.parent(), 'log_drink'):
             self.parent().log_drink()
-            self.refresh_data()
+            self.refresh_data(force=True)
             return
         try:
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, "r") as f:
-                    settings = json.load(f)
+            settings = self._get_settings()
+            if settings is not None:
                 current_count = settings.get("log_count", 0)
                 new_count = min(current_count + 1, settings.get("daily_goal", 15))
-                settings["log_count"] = new_count
-                settings["last_log_date"] = datetime.now().isoformat()
-                with open(self.settings_path, "w") as f:
-                    json.dump(settings, f, indent=4)
+                self.change_settings({"log_count": new_count, "last_log_date": datetime.now().isoformat()})
                 today_index = datetime.now().weekday()
                 self.drink_data[today_index] = new_count
-                old_value = self.animated_values[today_index]
                 self.bar_targets[today_index] = new_count
                 self.update_stats()
-                if self.bar_animations and len(self.bar_animations) > today_index:
-                    if self.bar_animations[today_index]:
-                        self.bar_animations[today_index].stop()
-                animation = QVariantAnimation()
-                animation.setStartValue(old_value)
-                animation.setEndValue(float(new_count))
-                animation.setDuration(600)
-                animation.setEasingCurve(QEasingCurve.OutQuad)
-                animation.valueChanged.connect(lambda value, idx=today_index: self._update_bar_value(idx, value))
-                animation.start()
-                while len(self.bar_animations) <= today_index:
-                    self.bar_animations.append(None)
-                self.bar_animations[today_index] = animation
+                self.animate_bars(600, QEasingCurve.OutQuad)
                 old_percentage = self.animated_percentage
                 new_percentage = min(100, int((new_count / self.target_drinks) * 100)) if self.target_drinks > 0 else 0
                 if self.percentage_animation:
@@ -612,14 +865,14 @@ class WaterLevelWidget(QWidget):
                 self.percentage_animation.setEndValue(new_percentage)
                 self.percentage_animation.setDuration(600)
                 self.percentage_animation.setEasingCurve(QEasingCurve.OutQuad)
-                self.percentage_animation.valueChanged.connect(lambda value: self._update_percentage(value))
+                self.percentage_animation.valueChanged.connect(self._update_percentage)
                 self.percentage_animation.start()
         except Exception as e:
-            print(f"Error logging drink: {e}")
-            self.refresh_data()
+            logger.error("Error logging drink: %s", e)
+            self.refresh_data(force=True)
     
     def start_fade_out(self):
-        print("WaterLevelWidget starting fade out")
+        logger.debug("WaterLevelWidget starting fade out")
         if sys.platform == 'win32':
             self.hide_widget()
             return
@@ -632,7 +885,7 @@ class WaterLevelWidget(QWidget):
         self.fade_out_animation.start()
     
     def hide_widget(self):
-        print("WaterLevelWidget hide_widget called")
+        logger.debug("WaterLevelWidget hide_widget called")
         self.hide()
         if hasattr(self, 'fade_out_finished') and callable(self.fade_out_finished):
             self.fade_out_finished()